@@ -0,0 +1,85 @@
+"""JSON baselines shared by the benchmark suites (imported by the bench_*.py scripts).
+
+A baseline maps case names to flat metric dicts. Compared with it, a
+numeric metric regresses when it grows past its threshold: `time_threshold`
+for metrics ending in "ms" (skipped below `MIN_COMPARED_MS`, which is
+mostly noise), `threshold` for the rest. A string metric, such as a pixel
+checksum, regresses whenever it changes. A missing baseline is an error
+too (exit status 2), so a check that was never set up cannot pass.
+"""
+
+import argparse
+import json
+import platform
+import sys
+from pathlib import Path
+
+MIN_COMPARED_MS = 1.0
+
+
+def add_arguments(parser: argparse.ArgumentParser, default_path: Path) -> None:
+    parser.add_argument("--baseline", type=Path, default=default_path)
+    parser.add_argument("--save", action="store_true", help="write results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="allowed growth of non-time metrics")
+    parser.add_argument("--time-threshold", type=float, default=0.25,
+                        help="allowed growth of wall times")
+
+
+def compare(
+    results: dict[str, dict],
+    baseline: dict[str, dict],
+    threshold: float,
+    time_threshold: float,
+) -> list[str]:
+    """Describe every metric that regressed relative to the baseline."""
+    regressions = []
+    for case, metrics in results.items():
+        base = baseline.get(case, {})
+        for metric, value in metrics.items():
+            old = base.get(metric)
+            if old is None:
+                continue
+            if isinstance(value, str):
+                if value != old:
+                    regressions.append(f"{case}: {metric} changed {old} -> {value}")
+                continue
+            limit = time_threshold if metric.endswith("ms") else threshold
+            if metric.endswith("ms") and old < MIN_COMPARED_MS:
+                continue
+            if value > old * (1 + limit):
+                regressions.append(
+                    f"{case}: {metric} {old:g} -> {value:g} (+{value / old - 1:.0%}, "
+                    f"limit +{limit:.0%})"
+                )
+    return regressions
+
+
+def finish(results: dict[str, dict], args: argparse.Namespace, **meta: str) -> None:
+    """Save `results` (--save) or compare them with the baseline.
+
+    Exits 1 on regressions and 2 when there is no baseline to compare with.
+    """
+    if args.save:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        doc = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            **meta,
+            "cases": results,
+        }
+        args.baseline.write_text(json.dumps(doc, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --save to create one",
+              file=sys.stderr)
+        sys.exit(2)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))["cases"]
+    regressions = compare(results, baseline, args.threshold, args.time_threshold)
+    compared = len(results.keys() & baseline.keys())
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) across {compared} compared cases:")
+        print("\n".join(f"  {line}" for line in regressions))
+        sys.exit(1)
+    print(f"\nNo regressions across {compared} compared cases")
@@ -0,0 +1,67 @@
+"""Counting-sort fast path vs insertion sort on duplicate-heavy inputs.
+
+Draws values from only a handful of distinct keys per bucket, so insertion
+sort spends most of its comparisons on equal keys. For each distribution the
+engine is run with and without `counting_width`; reports wall time, steps
+emitted, and per-bucket operations (compares + swaps vs tallies + placements).
+
+    uv run python benchmarks/bench_counting_sort.py [--count N] [--preset NAME]
+"""
+
+import argparse
+import random
+import time
+
+from bucket_sort_viz.model.bucket_sort import generate_steps
+from bucket_sort_viz.model.stats import compute_stats
+from bucket_sort_viz.presets import PRESETS
+
+
+def duplicate_heavy(preset, count: int, distinct: int, seed: int = 0) -> list[int]:
+    """`distinct` evenly spaced keys per bucket, drawn uniformly."""
+    rng = random.Random(seed)
+    stride = max(1, preset.bucket_size // distinct)
+    keys = [
+        low + i * stride
+        for low, _ in preset.generate_bucket_ranges()
+        for i in range(min(distinct, preset.bucket_size))
+    ]
+    return [rng.choice(keys) for _ in range(count)]
+
+
+def run(preset, values, counting_width: int) -> tuple[float, int, int]:
+    """(seconds, steps, sort-phase operations) for one engine run."""
+    start = time.perf_counter()
+    stats = compute_stats(
+        generate_steps(preset, values, describe=False, counting_width=counting_width),
+        preset.num_buckets,
+    )
+    seconds = time.perf_counter() - start
+    # A counting pass tallies every element once before placing it.
+    ops = stats.comparisons + stats.swaps + 2 * stats.placements
+    return seconds, stats.step_count, ops
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=4000)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="medium")
+    args = parser.parse_args()
+
+    preset = PRESETS[args.preset]
+    print(f"{args.count} elements, {args.preset} preset (bucket width {preset.bucket_size})")
+    print(f"{'keys/bucket':>11} {'path':<10} {'time ms':>9} {'steps':>11} {'sort ops':>11}")
+    for distinct in (1, 3, 10, preset.bucket_size):
+        values = duplicate_heavy(preset, args.count, distinct)
+        results = {
+            "insertion": run(preset, values, 0),
+            "counting": run(preset, values, preset.bucket_size),
+        }
+        for path, (seconds, steps, ops) in results.items():
+            print(f"{distinct:>11} {path:<10} {seconds * 1e3:9.1f} {steps:11,} {ops:11,}")
+        speedup = results["insertion"][0] / results["counting"][0]
+        print(f"{'':>11} speedup {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Sort-engine benchmark suite with a JSON regression baseline.
+
+Runs the step engine (what `bucket_sort()` does after drawing its values)
+over every preset, input distribution and element count from 10 to 1e6.
+Each run is recorded as a list of steps, with descriptions. Three engine
+configurations are covered, each only up to the count it handles in
+reasonable time: plain insertion sort is quadratic per bucket, so it stops
+at 1e3.
+
+Per case it records:
+
+- ms: best wall time of at least `--repeat` untraced runs (more for short cases)
+- steps: steps emitted
+- bytes_per_step: memory the finished step list holds per step
+- peak_mib: tracemalloc peak of a separate traced run
+
+Results are compared with the baseline, and the script exits with status 1
+when any metric grows past its threshold, or 2 when there is no baseline
+yet (see benchmarks/baseline.py).
+`--save` rewrites the baseline. Timings are machine-specific, so
+re-save it on the machine that does the comparing. The engine never
+imports Pygame, so no display is needed.
+
+    uv run python benchmarks/bench_engine.py [--max-count N] [--save] [--threshold F]
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from collections.abc import Callable
+from pathlib import Path
+
+import baseline  # benchmarks/baseline.py, next to this script
+
+from bucket_sort_viz.model.bucket_sort import generate_steps, generate_values
+from bucket_sort_viz.presets import PRESETS, SortPreset
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "engine.json"
+COUNTS = (10, 100, 1_000, 10_000, 100_000, 1_000_000)
+TIMING_SECONDS = 0.5               # Short cases repeat until they have run this long
+SLOW_RUN_SECONDS = 1.0             # Runs longer than this are not repeated
+
+# name -> (options for generate_steps given a preset, largest count to run)
+ENGINES: dict[str, tuple[Callable[[SortPreset], dict], int]] = {
+    "insertion": (lambda preset: {}, 1_000),
+    "split": (lambda preset: {"split_load": 32}, 100_000),
+    "counting": (lambda preset: {"counting_width": preset.bucket_size}, 1_000_000),
+}
+
+
+def _skewed(preset: SortPreset, count: int, seed: int) -> list[int]:
+    """Exponential from the bottom of the range: ~63% land in the lowest bucket."""
+    low, high = preset.value_range
+    rng = random.Random(seed)
+    return [min(high, low + int(rng.expovariate(1 / preset.bucket_size))) for _ in range(count)]
+
+
+def _clustered(preset: SortPreset, count: int, seed: int) -> list[int]:
+    """Gaussian around the middle of the range, a quarter bucket wide."""
+    low, high = preset.value_range
+    rng = random.Random(seed)
+    mid, spread = (low + high) / 2, preset.bucket_size / 4
+    return [min(high, max(low, round(rng.gauss(mid, spread)))) for _ in range(count)]
+
+
+DISTRIBUTIONS: dict[str, Callable[[SortPreset, int, int], list[int]]] = {
+    "uniform": generate_values,
+    "skewed": _skewed,
+    "clustered": _clustered,
+}
+
+
+def measure(preset: SortPreset, values: list[int], options: dict, repeat: int) -> dict:
+    """Time, step count, step-list bytes per step and traced peak for one case."""
+    best, elapsed, runs = float("inf"), 0.0, 0
+    while runs < repeat or elapsed < TIMING_SECONDS:
+        start = time.perf_counter()
+        steps = list(generate_steps(preset, values, **options))
+        seconds = time.perf_counter() - start
+        best, elapsed, runs = min(best, seconds), elapsed + seconds, runs + 1
+        count = len(steps)
+        del steps
+        if best > SLOW_RUN_SECONDS:
+            break
+
+    tracemalloc.start()
+    try:
+        steps = list(generate_steps(preset, values, **options))
+        held, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del steps
+    return {
+        "ms": round(best * 1e3, 3),
+        "steps": count,
+        "bytes_per_step": round(held / count, 1),
+        "peak_mib": round(peak / (1 << 20), 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    baseline.add_arguments(parser, BASELINE_PATH)
+    parser.add_argument("--max-count", type=int, default=COUNTS[-1])
+    parser.add_argument("--presets", nargs="+", choices=sorted(PRESETS), default=list(PRESETS))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'case':<36} {'ms':>10} {'steps':>10} {'B/step':>7} {'peak MiB':>9}")
+    for preset_name in args.presets:
+        preset = PRESETS[preset_name]
+        for dist_name, distribution in DISTRIBUTIONS.items():
+            for count in (c for c in COUNTS if c <= args.max_count):
+                values = distribution(preset, count, 0)
+                for engine, (options, max_count) in ENGINES.items():
+                    if count > max_count:
+                        continue
+                    case = f"{preset_name}/{dist_name}/{engine}/{count}"
+                    metrics = measure(preset, values, options(preset), args.repeat)
+                    results[case] = metrics
+                    print(f"{case:<36} {metrics['ms']:10.2f} {metrics['steps']:10,} "
+                          f"{metrics['bytes_per_step']:7.0f} {metrics['peak_mib']:9.2f}",
+                          flush=True)
+
+    baseline.finish(results, args)
+
+
+if __name__ == "__main__":
+    main()
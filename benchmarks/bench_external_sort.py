@@ -0,0 +1,58 @@
+"""External-memory sort throughput on a generated int32 file.
+
+Writes `--count` uniform values from the chosen preset's range to a
+temporary file, sorts it with `external_sort()` under a few memory budgets
+and reports MB/s, spill volume, re-bucketing depth and peak traced memory
+(from a second, traced run, since tracemalloc slows allocation down).
+
+    uv run python benchmarks/bench_external_sort.py [--count N] [--preset NAME]
+"""
+
+import argparse
+import random
+import tempfile
+import tracemalloc
+from array import array
+from pathlib import Path
+
+from bucket_sort_viz.model.external import external_sort
+from bucket_sort_viz.presets import PRESETS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=5_000_000)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="large")
+    parser.add_argument("--budgets-mb", type=float, nargs="+", default=[1, 8, 64])
+    args = parser.parse_args()
+
+    preset = PRESETS[args.preset]
+    low, high = preset.value_range
+    rng = random.Random(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        source = Path(tmp) / "values.i32"
+        with source.open("wb") as f:
+            for start in range(0, args.count, 1 << 20):
+                size = min(1 << 20, args.count - start)
+                f.write(array("i", [rng.randint(low, high) for _ in range(size)]).tobytes())
+        print(f"{args.count:,} values ({source.stat().st_size / 1e6:.0f} MB), "
+              f"{args.preset} preset")
+        print(f"{'budget MB':>9} {'MB/s':>7} {'spill MB':>9} {'depth':>5} {'peak MB':>8}")
+        for budget in args.budgets_mb:
+            def run():
+                return external_sort(
+                    source, Path(tmp) / "sorted.i32", preset,
+                    memory_limit=int(budget * (1 << 20)),
+                )
+
+            report = run()
+            tracemalloc.start()
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(f"{budget:9g} {report.mb_per_second:7.1f} {report.spill_bytes / 1e6:9.1f} "
+                  f"{report.max_depth:5} {peak / 1e6:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""GIF export benchmark: delta frames vs. full frames with the same global palette.
+
+Renders a short headless clip (READY hold, then one element sliding into its
+bucket while the code panel highlight is on) and encodes it both ways.
+
+    uv run --extra numpy python benchmarks/bench_gif.py [--frames N]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+from bucket_sort_viz.config import (  # noqa: E402
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    TIMING,
+    timing_to_frames,
+)
+from bucket_sort_viz.export.frames import DedupWriter  # noqa: E402
+from bucket_sort_viz.export.gif import GifWriter  # noqa: E402
+from bucket_sort_viz.model.bucket_sort import bucket_sort  # noqa: E402
+from bucket_sort_viz.presets import PRESETS  # noqa: E402
+from bucket_sort_viz.view.renderer import Renderer  # noqa: E402
+
+
+def render_clip(frames: int) -> list[bytes]:
+    preset = PRESETS["small"]
+    original, _, _ = bucket_sort(preset, count=10, seed=42)
+    renderer = Renderer(preset, original)
+    clip = []
+    renderer.draw_ready_state()
+    clip.append(renderer.capture_frame())
+    element = renderer.elements[0]
+    target = renderer.buckets[0]
+    start_x, start_y = element.x, element.y
+    for i in range(1, frames):
+        t = i / (frames - 1)
+        element.x = start_x + (target.center_x - start_x) * t
+        element.y = start_y + (target.y + target.height - 40 - start_y) * t
+        renderer.draw_ready_state(active_line=3)
+        clip.append(renderer.capture_frame())
+    return clip
+
+
+def encode(clip: list[bytes], path: Path, delta: bool) -> tuple[float, int]:
+    start = time.perf_counter()
+    with DedupWriter(GifWriter(path, SCREEN_WIDTH, SCREEN_HEIGHT, delta=delta)) as writer:
+        writer.add_frame(clip[0], hold=timing_to_frames(TIMING["ready_hold"]))
+        for frame in clip[1:]:
+            writer.add_frame(frame)
+    return time.perf_counter() - start, path.stat().st_size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--frames", type=int, default=timing_to_frames(TIMING["scatter_per_element"]),
+    )
+    args = parser.parse_args()
+
+    clip = render_clip(args.frames)
+    print(f"{len(clip)} unique frames at {SCREEN_WIDTH}x{SCREEN_HEIGHT}")
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            mode: encode(clip, Path(tmp) / f"{mode}.gif", delta=(mode == "delta"))
+            for mode in ("full", "delta")
+        }
+    for mode, (seconds, size) in results.items():
+        print(f"{mode:<6} {seconds:8.2f} s  {size / 1024:9.1f} KiB")
+    full_s, full_b = results["full"]
+    delta_s, delta_b = results["delta"]
+    print(f"delta speedup {full_s / delta_s:.1f}x, size {delta_b / full_b:.1%} of full")
+
+
+if __name__ == "__main__":
+    main()
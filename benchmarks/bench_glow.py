@@ -0,0 +1,81 @@
+"""Glow rendering: per-frame gradients vs. the cached, quantized `GlowCache`.
+
+Renders headless (SDL dummy driver). Pulses `--count` element glows in the
+phase colors through the celebration hold at `config.FPS`, staggering each
+element's phase. Compares building every gradient every frame with looking
+it up in the cache, and reports ms per frame, the cache's hit rate and its
+size.
+
+    uv run python benchmarks/bench_glow.py [--count N] [--preset NAME]
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse  # noqa: E402
+import time  # noqa: E402
+
+import pygame  # noqa: E402
+
+from bucket_sort_viz.config import (  # noqa: E402
+    FPS,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    TIMING,
+    timing_to_frames,
+)
+from bucket_sort_viz.presets import PRESETS  # noqa: E402
+from bucket_sort_viz.view.effects import (  # noqa: E402
+    CELEBRATION_PALETTE,
+    GlowCache,
+    _glow_sprite,
+    glow_radius,
+    pulse_intensity,
+)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=15)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="small")
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    radius = glow_radius(PRESETS[args.preset].circle_radius)
+    frames = timing_to_frames(TIMING["celebration_hold"])
+    centers = [(80 + i * (SCREEN_WIDTH - 160) / max(1, args.count - 1), 300)
+               for i in range(args.count)]
+
+    def glows(frame: int):
+        t = frame / FPS
+        for i, center in enumerate(centers):
+            color = CELEBRATION_PALETTE[i % len(CELEBRATION_PALETTE)]
+            yield center, radius, color, pulse_intensity(t + i * 0.05)
+
+    def uncached(frame: int) -> None:
+        for (x, y), r, color, intensity in glows(frame):
+            sprite = _glow_sprite(r, color, intensity)
+            screen.blit(sprite, (int(x) - r, int(y) - r), special_flags=pygame.BLEND_ADD)
+
+    cache = GlowCache()
+
+    def cached(frame: int) -> None:
+        cache.draw_many(screen, glows(frame))
+
+    print(f"{args.count} glows of radius {radius}, {frames} frames")
+    for name, draw in (("uncached", uncached), ("cached", cached)):
+        start = time.perf_counter()
+        for frame in range(frames):
+            screen.fill((0, 0, 0))
+            draw(frame)
+        ms = (time.perf_counter() - start) * 1e3 / frames
+        print(f"  {name:<9} {ms:7.3f} ms/frame")
+    print(f"  hit rate {cache.hit_rate:.1%}, {len(cache)} sprites cached")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Multi-core shared-memory bucket sort scaling from 1 to all cores.
+
+Sorts `--count` uniform int32 values from the chosen preset's range with
+`parallel_sort()` for each worker count and reports scatter and sort time,
+throughput and speedup over one worker, with np.sort as a reference.
+Best of `--repeat` runs.
+
+    uv run python benchmarks/bench_parallel.py [--count N] [--workers W ...]
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+
+from bucket_sort_viz.model.parallel import parallel_sort
+from bucket_sort_viz.presets import PRESETS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=20_000_000)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="large")
+    parser.add_argument("--workers", type=int, nargs="+",
+                        default=list(range(1, (os.cpu_count() or 1) + 1)))
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    preset = PRESETS[args.preset]
+    low, high = preset.value_range
+    values = np.random.default_rng(0).integers(low, high + 1, args.count, dtype=np.int32)
+    start = time.perf_counter()
+    np.sort(values)
+    reference = time.perf_counter() - start
+    print(f"{args.count:,} values, {args.preset} preset, {os.cpu_count()} CPUs; "
+          f"np.sort {reference * 1e3:.0f} ms")
+    print(f"{'workers':>7} {'scatter ms':>10} {'sort ms':>8} {'total ms':>9} "
+          f"{'Mvals/s':>8} {'speedup':>7}")
+    baseline = None
+    for workers in args.workers:
+        best = None
+        for _ in range(args.repeat):
+            with parallel_sort(preset, values, workers) as result:
+                if best is None or result.seconds < best[2]:
+                    best = (result.scatter_seconds, result.sort_seconds, result.seconds)
+        scatter, sort, total = best
+        baseline = baseline or total
+        print(f"{workers:7} {scatter * 1e3:10.0f} {sort * 1e3:8.0f} {total * 1e3:9.0f} "
+              f"{args.count / total / 1e6:8.1f} {baseline / total:6.2f}x")
+
+
+if __name__ == "__main__":
+    main()
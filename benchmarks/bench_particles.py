@@ -0,0 +1,76 @@
+"""Celebration particle burst: frame time and GC activity at the target FPS.
+
+Renders headless (SDL dummy driver). For each burst size it spawns a
+celebration out of a full-width row and simulates `TIMING["celebration_hold"]`
+seconds at `config.FPS`, drawing onto a cleared screen every frame. Reports
+p50/p95/max of update and update+draw time, the number of frames over the
+1/FPS budget, and how many garbage collections of each generation ran
+during the burst.
+
+    uv run python benchmarks/bench_particles.py [--counts N ...]
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse  # noqa: E402
+import gc  # noqa: E402
+import statistics  # noqa: E402
+import time  # noqa: E402
+
+import pygame  # noqa: E402
+
+from bucket_sort_viz.config import (  # noqa: E402
+    COLORS,
+    FPS,
+    INPUT_ROW_Y,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    SIDE_MARGIN,
+    TIMING,
+    timing_to_frames,
+)
+from bucket_sort_viz.view.effects import ParticlePool, spawn_celebration  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--counts", type=int, nargs="+", default=[5_000, 20_000, 50_000])
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+    frames = timing_to_frames(TIMING["celebration_hold"])
+    budget_ms = 1000 / FPS
+    origins = [(SIDE_MARGIN + i * (SCREEN_WIDTH - 2 * SIDE_MARGIN) / 14, INPUT_ROW_Y)
+               for i in range(15)]
+    print(f"{frames} frames at {FPS} FPS ({budget_ms:.1f} ms budget)")
+    print(f"{'particles':>9} {'update p50':>10} {'frame p50':>9} {'p95':>6} {'max':>6} "
+          f"{'over':>5}  gc gen0/1/2")
+    for count in args.counts:
+        pool = ParticlePool(capacity=count, seed=0)
+        spawn_celebration(pool, origins, count)
+        updates, totals = [], []
+        gc.collect()
+        before = [gen["collections"] for gen in gc.get_stats()]
+        for _ in range(frames):
+            start = time.perf_counter()
+            pool.update(1 / FPS)
+            mid = time.perf_counter()
+            screen.fill(COLORS["bg_dark"])
+            pool.draw(screen)
+            end = time.perf_counter()
+            updates.append((mid - start) * 1e3)
+            totals.append((end - start) * 1e3)
+        collections = [gen["collections"] - b for gen, b in zip(gc.get_stats(), before)]
+        p95 = statistics.quantiles(totals, n=20)[-1]
+        over = sum(t > budget_ms for t in totals)
+        print(f"{count:9,} {statistics.median(updates):10.2f} {statistics.median(totals):9.2f} "
+              f"{p95:6.2f} {max(totals):6.2f} {over:5}  {'/'.join(map(str, collections))}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""PNG sequence export: inline `pygame.image.save` vs. the thread-pooled writer.
+
+Renders a short headless clip (one element sliding into its bucket) and
+exports every frame as a PNG, first by saving inline on the render thread,
+then through `PngSequenceWriter` at each `--levels` compression level.
+Reports the render thread's time per frame, the end-to-end frames/s, and the
+bytes written.
+
+    uv run --extra numpy python benchmarks/bench_png_sequence.py [--frames N] [--workers N]
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse  # noqa: E402
+import tempfile  # noqa: E402
+import time  # noqa: E402
+from collections.abc import Callable  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+import pygame  # noqa: E402
+
+from bucket_sort_viz.config import SCREEN_HEIGHT, SCREEN_WIDTH  # noqa: E402
+from bucket_sort_viz.export.png_sequence import PngSequenceWriter  # noqa: E402
+from bucket_sort_viz.model.bucket_sort import bucket_sort  # noqa: E402
+from bucket_sort_viz.presets import PRESETS  # noqa: E402
+from bucket_sort_viz.view.renderer import Renderer  # noqa: E402
+
+
+def render_clip(renderer: Renderer, frames: int, emit: Callable[[int], None]) -> float:
+    """Draw `frames` frames, calling `emit(i)` after each. Returns seconds spent in emit."""
+    element = renderer.elements[0]
+    target = renderer.buckets[0]
+    start_x, start_y = element.x, element.y
+    emitting = 0.0
+    for i in range(frames):
+        t = i / max(1, frames - 1)
+        element.x = start_x + (target.center_x - start_x) * t
+        element.y = start_y + (target.y + target.height - 40 - start_y) * t
+        renderer.draw_ready_state(active_line=3)
+        start = time.perf_counter()
+        emit(i)
+        emitting += time.perf_counter() - start
+    element.x, element.y = start_x, start_y
+    return emitting
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=60)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 6])
+    args = parser.parse_args()
+
+    preset = PRESETS["small"]
+    original, _, _ = bucket_sort(preset, count=10, seed=42)
+    renderer = Renderer(preset, original)
+    print(f"{args.frames} frames at {SCREEN_WIDTH}x{SCREEN_HEIGHT}, {os.cpu_count()} CPUs")
+    print(f"{'mode':<12} {'render ms/frame':>15} {'frames/s':>9} {'MB':>7}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inline = Path(tmp) / "inline"
+        inline.mkdir()
+        start = time.perf_counter()
+        emitting = render_clip(renderer, args.frames, lambda i: pygame.image.save(
+            renderer.screen, str(inline / f"frame_{i:06d}.png"),
+        ))
+        seconds = time.perf_counter() - start
+        size = sum(p.stat().st_size for p in inline.iterdir())
+        print(f"{'inline':<12} {emitting * 1e3 / args.frames:15.2f} "
+              f"{args.frames / seconds:9.1f} {size / 1e6:7.1f}")
+
+        for level in args.levels:
+            writer = PngSequenceWriter(
+                Path(tmp) / f"pooled{level}", SCREEN_WIDTH, SCREEN_HEIGHT,
+                compression=level, workers=args.workers,
+            )
+            with writer:
+                emitting = render_clip(
+                    renderer, args.frames, lambda i: writer.capture(renderer.screen),
+                )
+            print(f"{f'pooled z={level}':<12} {emitting * 1e3 / args.frames:15.2f} "
+                  f"{writer.frames_per_second:9.1f} {writer.bytes_written / 1e6:7.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
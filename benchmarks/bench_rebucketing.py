@@ -0,0 +1,52 @@
+"""Recursive re-bucketing vs plain insertion sort on clustered inputs.
+
+Packs most values into a narrow band of the large preset's range, so one
+top-level bucket receives nearly everything. For a few `split_load`
+settings, reports wall time, comparisons (against the n * K / 2 + n bound),
+recursion depth and sub-bucket loads.
+
+    uv run python benchmarks/bench_rebucketing.py [--count N] [--spread S]
+"""
+
+import argparse
+import random
+import time
+
+from bucket_sort_viz.model.bucket_sort import generate_steps
+from bucket_sort_viz.model.stats import compute_stats
+from bucket_sort_viz.presets import PRESETS
+
+
+def clustered_values(count: int, spread: float, seed: int = 0) -> list[int]:
+    """Gaussian cluster around 450 with standard deviation `spread`."""
+    low, high = PRESETS["large"].value_range
+    rng = random.Random(seed)
+    return [min(high, max(low, round(rng.gauss(450, spread)))) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=3000)
+    parser.add_argument("--spread", type=float, default=15.0)
+    args = parser.parse_args()
+
+    preset = PRESETS["large"]
+    values = clustered_values(args.count, args.spread)
+    print(f"{args.count} elements around 450 (sd {args.spread}), large preset")
+    print(f"{'split_load':>10} {'time ms':>9} {'compares':>10} {'bound':>10} "
+          f"{'depth':>5} {'splits':>6} {'max load':>8}")
+    for split_load in (0, 64, 16, 4):
+        start = time.perf_counter()
+        stats = compute_stats(
+            generate_steps(preset, values, describe=False, split_load=split_load),
+            preset.num_buckets,
+        )
+        seconds = time.perf_counter() - start
+        bound = args.count * split_load // 2 + args.count if split_load else "-"
+        max_load = stats.max_sub_bucket_load or stats.max_bucket_load
+        print(f"{split_load or 'off':>10} {seconds * 1e3:9.1f} {stats.comparisons:10,} "
+              f"{bound:>10} {stats.max_depth:5} {len(stats.sub_bucket_loads):6} {max_load:8}")
+
+
+if __name__ == "__main__":
+    main()
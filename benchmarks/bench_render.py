@@ -0,0 +1,113 @@
+"""Headless render benchmark for the READY-state frame, with a pixel checksum.
+
+Runs under SDL's dummy video driver, so no display is needed. For every
+preset and element count, it renders `--frames` frames with
+`Renderer.draw_ready_state()`. The frames cover the circle layout
+(`CircleElement.draw()`) at the supported counts and the LOD bars above
+them. The code-panel highlight cycles through the pseudocode lines.
+
+Per case it records:
+
+- p50/p95/p99 ms: per-frame time, from the renderer's own `FrameProfiler`,
+  plus the p95 of the elements and code-panel stages
+- alloc_kib: tracemalloc peak while rendering, from a separate traced run
+- checksum: SHA-256 of the pixels of one fixed frame, which must match the
+  baseline exactly so an optimization cannot silently change the output
+
+Results are compared with the baseline and exit with status 1 on a
+regression, or 2 when there is no baseline yet (see benchmarks/baseline.py).
+Timings and font rasterization are machine-specific, so re-save the
+baseline with `--save` on the machine that does the comparing.
+
+    uv run python benchmarks/bench_render.py [--frames N] [--save] [--threshold F]
+"""
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse  # noqa: E402
+import hashlib  # noqa: E402
+import tracemalloc  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+import baseline  # noqa: E402  (benchmarks/baseline.py, next to this script)
+import pygame  # noqa: E402
+
+from bucket_sort_viz.config import (  # noqa: E402
+    ELEMENT_COUNT_MAX,
+    ELEMENT_COUNT_MIN,
+    PSEUDOCODE_LINES,
+)
+from bucket_sort_viz.model.bucket_sort import generate_values  # noqa: E402
+from bucket_sort_viz.presets import PRESETS  # noqa: E402
+from bucket_sort_viz.view.profiler import FrameProfiler  # noqa: E402
+from bucket_sort_viz.view.renderer import Renderer  # noqa: E402
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "render.json"
+COUNTS = (ELEMENT_COUNT_MIN, ELEMENT_COUNT_MAX, 1_000, 100_000)   # Last two render as LOD
+
+
+def _render(renderer: Renderer, frames: int) -> None:
+    for frame in range(frames):
+        renderer.draw_ready_state(active_line=frame % len(PSEUDOCODE_LINES))
+
+
+def frame_checksum(renderer: Renderer) -> str:
+    """SHA-256 of a fixed READY frame (no highlighted line)."""
+    renderer.draw_ready_state()
+    return hashlib.sha256(renderer.capture_frame()).hexdigest()
+
+
+def measure(preset_name: str, count: int, frames: int) -> dict:
+    """Frame-time percentiles, traced allocation peak and pixel checksum for one case."""
+    values = generate_values(PRESETS[preset_name], count, seed=0)
+    renderer = Renderer(PRESETS[preset_name], values)
+    _render(renderer, 5)                               # Warm font and glyph caches
+    renderer.profiler = FrameProfiler(capacity=frames)
+    _render(renderer, frames)
+    stages = renderer.profiler.summary()["stages"]
+    renderer.profiler = None
+
+    tracemalloc.start()
+    try:
+        _render(renderer, frames)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {
+        "p50_ms": stages["total"]["p50_ms"],
+        "p95_ms": stages["total"]["p95_ms"],
+        "p99_ms": stages["total"]["p99_ms"],
+        "elements_p95_ms": stages["elements"]["p95_ms"],
+        "code_panel_p95_ms": stages["code_panel"]["p95_ms"],
+        "alloc_kib": round(peak / 1024, 1),
+        "checksum": frame_checksum(renderer),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    baseline.add_arguments(parser, BASELINE_PATH)
+    parser.add_argument("--frames", type=int, default=120)
+    parser.add_argument("--presets", nargs="+", choices=sorted(PRESETS), default=list(PRESETS))
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'case':<16} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'alloc KiB':>10}  checksum")
+    for preset_name in args.presets:
+        for count in COUNTS:
+            case = f"{preset_name}/{count}"
+            metrics = measure(preset_name, count, args.frames)
+            results[case] = metrics
+            print(f"{case:<16} {metrics['p50_ms']:7.2f} {metrics['p95_ms']:7.2f} "
+                  f"{metrics['p99_ms']:7.2f} {metrics['alloc_kib']:10.1f}  "
+                  f"{metrics['checksum'][:12]}", flush=True)
+    pygame.quit()
+
+    baseline.finish(results, args, pygame=pygame.version.ver)
+
+
+if __name__ == "__main__":
+    main()
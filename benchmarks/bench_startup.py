@@ -0,0 +1,61 @@
+"""Startup benchmark: import time of the engine-only path vs. the view path.
+
+Each target is imported in a fresh interpreter so module caches don't skew
+results. Run with:
+
+    uv run python benchmarks/bench_startup.py [--runs N]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+TARGETS = [
+    "bucket_sort_viz.presets",
+    "bucket_sort_viz.model.bucket_sort",
+    "bucket_sort_viz.main",
+    "bucket_sort_viz.view.renderer",
+]
+
+PROBE = """
+import importlib, sys, time
+start = time.perf_counter()
+importlib.import_module({target!r})
+elapsed = time.perf_counter() - start
+print(elapsed, "pygame" in sys.modules)
+"""
+
+
+def time_import(target: str) -> tuple[float, bool]:
+    """Import `target` in a fresh interpreter; return (seconds, pygame_loaded)."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(target=target)],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1", "SDL_VIDEODRIVER": "dummy"},
+    )
+    elapsed, pygame_loaded = result.stdout.split()[-2:]
+    return float(elapsed), pygame_loaded == "True"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'module':<36} {'median ms':>10} {'min ms':>8}  pygame")
+    for target in TARGETS:
+        samples = []
+        pygame_loaded = False
+        for _ in range(args.runs):
+            elapsed, pygame_loaded = time_import(target)
+            samples.append(elapsed * 1000)
+        print(
+            f"{target:<36} {statistics.median(samples):>10.1f} {min(samples):>8.1f}  "
+            f"{'yes' if pygame_loaded else 'no'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Insertion-sort synthesis benchmark: analytic bulk emission vs. the reference loop.
+
+Fills one bucket with k random values and records its insertion sort both
+ways into a StepLog, checking the logs are identical.
+
+    uv run --extra numpy python benchmarks/bench_synthesis.py [--sizes 500 2000 5000]
+"""
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from bucket_sort_viz.model.bucket_sort import _insertion_sort_bucket
+from bucket_sort_viz.model.step_log import StepLog
+from bucket_sort_viz.model.synthesis import append_insertion_sort
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 5000])
+    args = parser.parse_args()
+
+    print(f"{'bucket':>7} {'steps':>12} {'loop s':>8} {'synth s':>8} {'speedup':>8}")
+    for k in args.sizes:
+        rng = random.Random(k)
+        values = [rng.randrange(100) for _ in range(k)]
+
+        start = time.perf_counter()
+        reference = StepLog()
+        reference.extend(_insertion_sort_bucket(list(range(k)), 0, values))
+        loop_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        synthesized = StepLog()
+        append_insertion_sort(synthesized, range(k), 0, np.asarray(values))
+        synth_s = time.perf_counter() - start
+
+        assert synthesized == reference
+        speedup = loop_s / synth_s
+        print(f"{k:>7} {len(reference):>12,} {loop_s:>8.2f} {synth_s:>8.3f} {speedup:>7.0f}x")
+
+
+if __name__ == "__main__":
+    main()
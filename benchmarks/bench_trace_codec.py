@@ -0,0 +1,76 @@
+"""Trace codec benchmark: size and throughput on a large skewed input.
+
+Most values land in the first few buckets, so the sort phase is dominated by
+long insertion walks — the case the compact codec is built for. Compares the
+file size of every trace encoding and times compact encode/decode.
+
+    uv run python benchmarks/bench_trace_codec.py [--count N] [--skew S]
+"""
+
+import argparse
+import io
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from bucket_sort_viz.model.bucket_sort import generate_steps
+from bucket_sort_viz.model.trace_codec import decode_steps, encode_steps
+from bucket_sort_viz.model.trace_io import write_columnar, write_compact, write_ndjson
+from bucket_sort_viz.presets import PRESETS
+
+
+def skewed_values(count: int, skew: float, seed: int = 0) -> list[int]:
+    """Exponentially distributed values: ~`1 - e^-skew` of them in the lowest bucket."""
+    preset = PRESETS["large"]
+    low, high = preset.value_range
+    rng = random.Random(seed)
+    scale = preset.bucket_size / skew
+    return [min(high, low + int(rng.expovariate(1 / scale))) for _ in range(count)]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=2000)
+    parser.add_argument("--skew", type=float, default=1.0)
+    args = parser.parse_args()
+
+    preset = PRESETS["large"]
+    values = skewed_values(args.count, args.skew)
+    steps = list(generate_steps(preset, values))
+    meta = {"values": values}
+    print(f"{args.count} elements, {len(steps):,} steps (large preset, skew {args.skew})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        writers = {
+            "ndjson": lambda p: write_ndjson(p, steps, meta),
+            "ndjson.gz": lambda p: write_ndjson(p, steps, meta),
+            "bst": lambda p: write_columnar(p, steps, meta),
+            "bst.gz": lambda p: write_columnar(p, steps, meta),
+            "bsw": lambda p: write_compact(p, steps, meta),
+            "bsw.gz": lambda p: write_compact(p, steps, meta),
+        }
+        sizes = {}
+        for suffix, write in writers.items():
+            path = Path(tmp) / f"trace.{suffix}"
+            write(path)
+            sizes[suffix] = path.stat().st_size
+    for suffix, size in sizes.items():
+        ratio = sizes["ndjson"] / size
+        print(f"  {suffix:<10} {size / 1024:10.1f} KiB  {ratio:7.1f}x smaller than NDJSON")
+
+    buffer = io.BytesIO()
+    start = time.perf_counter()
+    encode_steps(steps, buffer, values)
+    encode_s = time.perf_counter() - start
+    buffer.seek(0)
+    start = time.perf_counter()
+    decoded = sum(1 for _ in decode_steps(buffer, values))
+    decode_s = time.perf_counter() - start
+    assert decoded == len(steps)
+    print(f"compact encode {len(steps) / encode_s:12,.0f} steps/s")
+    print(f"compact decode {len(steps) / decode_s:12,.0f} steps/s")
+
+
+if __name__ == "__main__":
+    main()
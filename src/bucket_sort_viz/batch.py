@@ -0,0 +1,272 @@
+"""Resumable batch runs over presets × element counts × seeds.
+
+A JSON manifest names the grid to cover:
+
+    {
+        "name": "course-material",
+        "presets": ["small", "medium", "large"],
+        "counts": [10, 12, 15],
+        "seeds": [0, 1, 2],
+        "render": true
+    }
+
+Each (preset, count, seed) job writes its step trace (and, with "render",
+a headless PNG of the READY state) under `OUTPUT_DIR/batch/<name>/<job>/`.
+Every finished job is appended to `status.jsonl` with its timing and the
+SHA-256 of each output file, so an interrupted batch can be re-run and only
+the jobs without a matching status line and intact outputs are redone. A job
+that now asks for more outputs than were recorded (e.g. a trace-only batch
+re-run with "render") is redone as well.
+"""
+
+import hashlib
+import itertools
+import json
+import os
+import time
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from bucket_sort_viz.config import OUTPUT_DIR
+from bucket_sort_viz.model.bucket_sort import generate_steps, generate_values
+from bucket_sort_viz.model.trace_io import write_ndjson
+from bucket_sort_viz.presets import PRESETS
+
+STATUS_FILE = "status.jsonl"
+TRACE_FILE = "trace.jsonl"
+RENDER_FILE = "ready.png"
+HEADLESS_ENV = {"SDL_VIDEODRIVER": "dummy", "PYGAME_HIDE_SUPPORT_PROMPT": "1"}
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    preset: str
+    count: int
+    seed: int
+    render: bool = False
+
+    @property
+    def job_id(self) -> str:
+        return f"{self.preset}-n{self.count}-s{self.seed}"
+
+    @property
+    def output_names(self) -> tuple[str, ...]:
+        """Files a finished run of this job leaves in its directory."""
+        return (TRACE_FILE, RENDER_FILE) if self.render else (TRACE_FILE,)
+
+
+@dataclass
+class JobResult:
+    job_id: str
+    status: str                       # "ok" or "failed"
+    seconds: float = 0.0
+    steps: int = 0
+    outputs: dict[str, str] = field(default_factory=dict)   # file name → sha256
+    error: str = ""
+
+
+@dataclass
+class BatchReport:
+    completed: int = 0
+    skipped: int = 0
+    failed: int = 0
+    steps: int = 0
+    bytes_written: int = 0
+    seconds: float = 0.0
+
+    @property
+    def jobs_per_second(self) -> float:
+        return self.completed / self.seconds if self.seconds else 0.0
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.seconds if self.seconds else 0.0
+
+
+def load_manifest(path: Path) -> tuple[str, list[BatchJob]]:
+    """Parse a manifest into its batch name and the expanded job grid."""
+    manifest = json.loads(path.read_text(encoding="utf-8"))
+    name = manifest.get("name", path.stem)
+    presets = manifest.get("presets", "all")
+    if presets == "all":
+        presets = list(PRESETS)
+    unknown = [p for p in presets if p not in PRESETS]
+    if unknown:
+        raise ValueError(f"Unknown presets in {path}: {unknown}")
+    render = bool(manifest.get("render", False))
+    jobs = [
+        BatchJob(preset, count, seed, render)
+        for preset, count, seed in itertools.product(
+            presets, manifest["counts"], manifest.get("seeds", [0]),
+        )
+    ]
+    return name, jobs
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@contextmanager
+def _headless() -> Iterator[None]:
+    """Dummy SDL drivers for the duration of one render, restoring the environment after.
+
+    Pygame is shut down again on exit unless it was already initialized, so
+    an in-process batch leaves neither the environment nor Pygame changed.
+    """
+    saved = {key: os.environ.get(key) for key in HEADLESS_ENV}
+    for key, value in HEADLESS_ENV.items():
+        os.environ.setdefault(key, value)
+    # Imported here so trace-only batches never load Pygame in the workers.
+    import pygame
+
+    was_initialized = pygame.get_init()
+    try:
+        yield
+    finally:
+        if not was_initialized:
+            pygame.quit()
+        for key, value in saved.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+def _render_ready_state(path: Path, preset_name: str, original: list[int]) -> None:
+    with _headless():
+        import pygame
+
+        from bucket_sort_viz.view.renderer import Renderer
+
+        renderer = Renderer(PRESETS[preset_name], original)
+        renderer.draw_ready_state()
+        pygame.image.save(renderer.screen, str(path))
+
+
+def run_job(job: BatchJob, batch_dir: Path) -> JobResult:
+    """Generate (and optionally render) one job. Runs inside a worker process."""
+    start = time.perf_counter()
+    job_dir = batch_dir / job.job_id
+    try:
+        job_dir.mkdir(parents=True, exist_ok=True)
+        preset = PRESETS[job.preset]
+        original = generate_values(preset, job.count, job.seed)
+        outputs = [job_dir / TRACE_FILE]
+        step_count = write_ndjson(
+            outputs[0],
+            generate_steps(preset, original),
+            meta={"preset": job.preset, "seed": job.seed, "values": original},
+        )
+        if job.render:
+            outputs.append(job_dir / RENDER_FILE)
+            _render_ready_state(outputs[-1], job.preset, original)
+        return JobResult(
+            job_id=job.job_id,
+            status="ok",
+            seconds=time.perf_counter() - start,
+            steps=step_count,
+            outputs={p.name: sha256_file(p) for p in outputs},
+        )
+    except Exception as exc:  # Reported per job; one bad job shouldn't stop the batch
+        return JobResult(
+            job_id=job.job_id, status="failed",
+            seconds=time.perf_counter() - start, error=repr(exc),
+        )
+
+
+def load_status(batch_dir: Path) -> dict[str, JobResult]:
+    """Latest recorded result per job. Truncated trailing lines are ignored."""
+    results: dict[str, JobResult] = {}
+    path = batch_dir / STATUS_FILE
+    if not path.exists():
+        return results
+    for line in path.read_text(encoding="utf-8").splitlines():
+        try:
+            result = JobResult(**json.loads(line))
+        except (json.JSONDecodeError, TypeError):
+            continue
+        results[result.job_id] = result
+    return results
+
+
+def is_complete(job: BatchJob, result: JobResult | None, batch_dir: Path) -> bool:
+    """Done if every output the job should produce was recorded and still matches its checksum."""
+    if result is None or result.status != "ok":
+        return False
+    if any(name not in result.outputs for name in job.output_names):
+        return False
+    job_dir = batch_dir / job.job_id
+    return all(
+        (job_dir / name).exists() and sha256_file(job_dir / name) == checksum
+        for name, checksum in result.outputs.items()
+    )
+
+
+def _init_worker() -> None:
+    # Worker processes only: the parent's environment is left alone.
+    for key, value in HEADLESS_ENV.items():
+        os.environ.setdefault(key, value)
+
+
+def run_batch(
+    name: str,
+    jobs: list[BatchJob],
+    workers: int | None = None,
+    output_dir: Path = OUTPUT_DIR,
+) -> BatchReport:
+    """Run every job not already completed, appending results to status.jsonl.
+
+    Args:
+        name: Batch name (output subdirectory).
+        jobs: Jobs to run.
+        workers: Worker processes (default: CPU count). 1 runs jobs in-process.
+        output_dir: Root output directory.
+    """
+    batch_dir = output_dir / "batch" / name
+    batch_dir.mkdir(parents=True, exist_ok=True)
+    previous = load_status(batch_dir)
+    report = BatchReport()
+    pending = []
+    for job in jobs:
+        if is_complete(job, previous.get(job.job_id), batch_dir):
+            report.skipped += 1
+        else:
+            pending.append(job)
+
+    start = time.perf_counter()
+    status_path = batch_dir / STATUS_FILE
+    existing = status_path.read_bytes() if status_path.exists() else b""
+    with status_path.open("a", encoding="utf-8") as status:
+        if existing and not existing.endswith(b"\n"):
+            status.write("\n")     # Terminate a line cut off by an interrupted run
+
+        def record(result: JobResult) -> None:
+            status.write(json.dumps(asdict(result)) + "\n")
+            status.flush()
+            if result.status == "ok":
+                report.completed += 1
+                report.steps += result.steps
+                report.bytes_written += sum(
+                    (batch_dir / result.job_id / n).stat().st_size for n in result.outputs
+                )
+            else:
+                report.failed += 1
+
+        if workers == 1:
+            for job in pending:
+                record(run_job(job, batch_dir))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = [pool.submit(run_job, job, batch_dir) for job in pending]
+                for future in as_completed(futures):
+                    record(future.result())
+    report.seconds = time.perf_counter() - start
+    return report
@@ -5,11 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from bucket_sort_viz.model.step import StepType
-
 if TYPE_CHECKING:
     import pygame
 
+    from bucket_sort_viz.model.step import StepType
+
 # ──────────────────────────────────────────────
 # Paths
 # ──────────────────────────────────────────────
@@ -138,6 +138,69 @@ def timing_to_frames(seconds: float) -> int:
     return max(1, round(seconds * FPS))
 
 
+# ──────────────────────────────────────────────
+# Adaptive pacing (bounded playback length)
+# ──────────────────────────────────────────────
+PACING_TARGET_SECONDS = 60.0     # Default bound on total playback
+PACING_HOLD_SHARE = 0.2          # Most of the target spent on phase-change/celebration holds
+PACING_MIN_PHASE_SHARE = 0.15    # Least of the move budget a phase with steps is given
+PACING_MIN_MOVE_FRAMES = 3       # Shorter compressed moves are batched with their neighbors
+
+
+# ──────────────────────────────────────────────
+# Particles (celebration burst and phase sparks)
+# ──────────────────────────────────────────────
+PARTICLE_CAPACITY = 50_000       # Preallocated pool slots; spawns past this are dropped
+PARTICLE_GRAVITY = 420.0         # Downward acceleration (px/s²)
+PARTICLE_LIFETIME = (0.8, 1.8)   # Seconds, drawn uniformly per particle
+PARTICLE_SPEED = (120.0, 520.0)  # Launch speed range (px/s)
+PARTICLE_RADIUS = 2              # Sprite radius (px)
+PARTICLE_FADE_LEVELS = 8         # Alpha steps a particle fades through (one sprite each)
+CELEBRATION_PARTICLES = 20_000   # Burst size when the sort completes
+
+
+# ──────────────────────────────────────────────
+# Glow (pre-rendered radial sprites, composited additively)
+# ──────────────────────────────────────────────
+GLOW_INTENSITY_LEVELS = 16       # Pulse intensities quantize to this many sprites
+GLOW_CACHE_SIZE = 96             # Max cached sprites (least recently used evicted)
+GLOW_RADIUS_SCALE = 2.2          # Glow radius relative to the element's radius
+GLOW_PULSE_FLOOR = 0.35          # Lowest intensity of a celebration pulse
+
+
+# ──────────────────────────────────────────────
+# Audio (pre-synthesized step tones)
+# ──────────────────────────────────────────────
+AUDIO_SAMPLE_RATE = 44100
+AUDIO_BUFFER = 512               # Mixer buffer in samples (~12 ms, low latency)
+AUDIO_VOICES = 12                # Mixer channels; the longest-playing voice is stolen
+TONE_PITCHES = 24                # Pitch buckets across a preset's value range
+TONE_FREQ_RANGE = (220.0, 880.0)  # Lowest and highest pitch (Hz), spaced exponentially
+TONE_VOLUME = 0.3                # Peak amplitude (0..1)
+
+
+# ──────────────────────────────────────────────
+# Preset thumbnails (menu previews, cached under OUTPUT_DIR)
+# ──────────────────────────────────────────────
+THUMBNAIL_SIZE = (424, 150)      # Downscaled READY scene (screen width × panel top, 1/4)
+THUMBNAIL_DIR_NAME = "thumbnails"
+THUMBNAIL_SEED = 7               # Seed of the sample values drawn in every preview
+
+
+# ──────────────────────────────────────────────
+# PNG frame-sequence export
+# ──────────────────────────────────────────────
+PNG_COMPRESSION = 6              # zlib level (0 = stored, 1 = fastest, 9 = smallest)
+PNG_BUFFERS_PER_WORKER = 2       # Pooled frame buffers; capture waits when all are in flight
+
+
+# ──────────────────────────────────────────────
+# Frame profiling
+# ──────────────────────────────────────────────
+PROFILE_HISTORY_FRAMES = 600    # Ring buffer size (20 s at 30 FPS)
+PROFILE_OUTPUT_NAME = "frame_profile.json"
+
+
 # ──────────────────────────────────────────────
 # Element count
 # ──────────────────────────────────────────────
@@ -145,6 +208,16 @@ ELEMENT_COUNT_MIN = 10
 ELEMENT_COUNT_MAX = 15
 ELEMENT_COUNT_DEFAULT = 10
 
+# ──────────────────────────────────────────────
+# Level of detail (LOD)
+# Past these limits the per-circle layout no longer fits, so rows and
+# bucket contents render as aggregated density bars instead.
+# ──────────────────────────────────────────────
+LOD_COUNT_THRESHOLD = 100       # Always aggregate above this many elements
+LOD_MIN_CIRCLE_GAP = 4          # Min px between neighbouring circles in a row
+LOD_BAR_WIDTH = 3               # Width of one density/histogram bar (px)
+LOD_ROW_HEIGHT = 56             # Height of the aggregated input/output rows
+
 # ──────────────────────────────────────────────
 # Layout regions (y-coordinates and margins)
 # ──────────────────────────────────────────────
@@ -158,6 +231,7 @@ PANEL_TOP_Y = 600
 PANEL_HEIGHT = SCREEN_HEIGHT - PANEL_TOP_Y
 SIDE_MARGIN = 40
 BUCKET_GAP = 6
+CODE_HIGHLIGHT_ALPHA = 40       # Opacity of the active pseudocode line bar
 
 # ──────────────────────────────────────────────
 # Pseudocode lines displayed in the code panel
@@ -169,19 +243,21 @@ PSEUDOCODE_LINES: list[str] = [
     "    buckets[idx].append(x)",      # 3 — code (scatter highlight)
     "# 2. Sort Buckets",              # 4 — comment
     "for b in buckets:",               # 5 — keyword
-    "    insertionSort(b)",            # 6 — code (sort highlight)
-    "# 3. Gather",                     # 7 — comment
-    "output = []",                     # 8 — code
-    "for b in buckets:",               # 9 — keyword
-    "    output.extend(b)",            # 10 — code (gather highlight)
+    "    if span(b) > w: insertionSort(b)",  # 6 — code (sort highlight)
+    "    else: countingSort(b)",       # 7 — code (counting-sort highlight, w = counting width)
+    "# 3. Gather",                     # 8 — comment
+    "output = []",                     # 9 — code
+    "for b in buckets:",               # 10 — keyword
+    "    output.extend(b)",            # 11 — code (gather highlight)
 ]
 
 STEP_TO_CODE_LINE: dict[StepType, int] = {
     "scatter": 3,       # buckets[idx].append(x)
-    "compare": 6,       # insertionSort(b)
-    "swap": 6,          # insertionSort(b)
-    "no_swap": 6,       # insertionSort(b)
-    "gather": 10,       # output.extend(b)
+    "compare": 6,       # if span(b) > w: insertionSort(b)
+    "swap": 6,          # if span(b) > w: insertionSort(b)
+    "no_swap": 6,       # if span(b) > w: insertionSort(b)
+    "place": 7,         # else: countingSort(b)
+    "gather": 11,       # output.extend(b)
     "phase_change": -1,  # No highlight during transitions
     "celebration": -1,   # No highlight during celebration
 }
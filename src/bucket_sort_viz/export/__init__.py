@@ -0,0 +1 @@
+"""Export pipeline: frame capture, deduplication, and video/GIF writers."""
@@ -0,0 +1,78 @@
+"""Frame sinks and duplicate-frame coalescing for the export pipeline.
+
+Frames are raw RGB bytes (`pygame.image.tobytes(surface, "RGB")`) at
+`config.FPS`. Large stretches of an animation are pixel-identical (the READY
+hold, phase transition pauses, the celebration hold, and static frames
+between steps), so every frame passes through `DedupWriter` first: each run
+of identical frames reaches the sink once, with its duration in frames.
+Sinks turn that duration into variable-frame-rate timestamps (video) or a
+per-frame delay (GIF) instead of encoding the same image again.
+"""
+
+from typing import Protocol
+
+
+class FrameSink(Protocol):
+    """Destination for deduplicated frames."""
+
+    def write(self, frame: bytes, duration: int) -> None:
+        """Emit `frame`, shown for `duration` frames at `config.FPS`."""
+        ...
+
+    def close(self) -> None:
+        ...
+
+
+class DedupWriter:
+    """Coalesces consecutive identical frames into one frame with a longer duration.
+
+    Holds the callers already know about (e.g. `timing_to_frames(TIMING["ready_hold"])`)
+    can be passed as `hold` so those frames are never rendered or compared at all.
+    Otherwise each frame is compared against the pending one; bytes equality is a
+    length check plus memcmp, which is cheaper than hashing both buffers.
+
+    Args:
+        sink: Where unique frames (with durations) are written.
+    """
+
+    def __init__(self, sink: FrameSink):
+        self.sink = sink
+        self.frames_in = 0
+        self.frames_out = 0
+        self._pending: bytes | None = None
+        self._pending_duration = 0
+
+    def add_frame(self, frame: bytes, hold: int = 1) -> None:
+        """Queue `frame` for `hold` consecutive frame slots."""
+        if hold < 1:
+            raise ValueError(f"hold must be at least 1 frame, got {hold}")
+        self.frames_in += hold
+        if self._pending is not None and frame == self._pending:
+            self._pending_duration += hold
+            return
+        self._flush()
+        self._pending = frame
+        self._pending_duration = hold
+
+    def _flush(self) -> None:
+        if self._pending is not None:
+            self.sink.write(self._pending, self._pending_duration)
+            self.frames_out += 1
+            self._pending = None
+            self._pending_duration = 0
+
+    def close(self) -> None:
+        """Emit the last pending run and close the sink."""
+        self._flush()
+        self.sink.close()
+
+    @property
+    def frames_saved(self) -> int:
+        """Frame slots that were not encoded separately."""
+        return self.frames_in - self.frames_out - (self._pending is not None)
+
+    def __enter__(self) -> "DedupWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
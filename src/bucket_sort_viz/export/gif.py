@@ -0,0 +1,264 @@
+"""Animated GIF writer with one global palette and delta-frame encoding.
+
+The scene only ever draws the handful of colors in `config.COLORS`, plus the
+antialiasing blends between those colors and the few backgrounds they are
+drawn over. That fits in one 255-entry global palette, so frames never need
+per-frame quantization: each pixel is mapped through a 24-bit lookup table
+that is filled in once per distinct color the first time it appears.
+
+Each frame after the first encodes only the bounding rectangle of pixels that
+changed since the previous frame; unchanged pixels inside that rectangle are
+written as the transparent index so they compress to long LZW runs.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
+"""
+
+import functools
+import struct
+from pathlib import Path
+
+import numpy as np
+
+from bucket_sort_viz.config import CODE_HIGHLIGHT_ALPHA, COLORS, FPS
+
+Color = tuple[int, int, int]
+
+TRANSPARENT_INDEX = 255          # Reserved palette slot; never a real color
+UNMAPPED = 255                   # Lookup-table marker for "not seen yet"
+MAX_LZW_CODES = 4096
+RAMP_BACKGROUNDS = ("bg_dark", "bg_panel", "bucket_fill", "element_default")
+RAMP_STEPS = (0.25, 0.5, 0.75)
+
+DISPOSE_NONE = 1                 # Leave the frame in place; deltas draw on top
+
+
+def build_palette() -> list[Color]:
+    """Global palette: every `COLORS` entry plus blends toward each background.
+
+    Text and circle edges are antialiased against a small set of backgrounds,
+    so blending each color toward those backgrounds at a few steps covers
+    nearly every pixel the renderer produces.
+    """
+    palette: list[Color] = []
+    seen: set[Color] = set()
+
+    def add(color: Color) -> None:
+        if color not in seen and len(palette) < TRANSPARENT_INDEX:
+            seen.add(color)
+            palette.append(color)
+
+    def blend(bg: Color, color: Color, t: float) -> Color:
+        return tuple(round(b + (c - b) * t) for b, c in zip(bg, color))
+
+    # The active pseudocode line is a translucent bar that text is drawn over.
+    highlight = blend(COLORS["bg_panel"], COLORS["cyan_scatter"], CODE_HIGHLIGHT_ALPHA / 255)
+    backgrounds = [COLORS[key] for key in RAMP_BACKGROUNDS] + [highlight]
+
+    for color in COLORS.values():
+        add(color)
+    add(highlight)
+    for bg in backgrounds:
+        for color in COLORS.values():
+            for t in RAMP_STEPS:
+                add(blend(bg, color, t))
+    return palette
+
+
+@functools.cache
+def _palette_array() -> np.ndarray:
+    return np.array(build_palette(), dtype=np.int32)
+
+
+class ColorLookup:
+    """Maps packed 24-bit RGB to palette indices through a 16 MiB lookup table.
+
+    Entries start as UNMAPPED and are filled with the nearest palette color
+    the first time a color is seen, so after the first few frames every
+    lookup is a single array gather.
+    """
+
+    def __init__(self, palette: np.ndarray | None = None):
+        self.palette = _palette_array() if palette is None else palette
+        self.table = np.full(1 << 24, UNMAPPED, dtype=np.uint8)
+        packed = (self.palette[:, 0] << 16) | (self.palette[:, 1] << 8) | self.palette[:, 2]
+        self.table[packed] = np.arange(len(self.palette), dtype=np.uint8)
+
+    def map(self, rgb: np.ndarray) -> np.ndarray:
+        """Convert an (h, w, 3) uint8 RGB array to an (h, w) array of indices."""
+        packed = (
+            (rgb[..., 0].astype(np.uint32) << 16)
+            | (rgb[..., 1].astype(np.uint32) << 8)
+            | rgb[..., 2]
+        )
+        indices = self.table[packed]
+        missing = indices == UNMAPPED
+        if missing.any():
+            self._learn(np.unique(packed[missing]))
+            indices = self.table[packed]
+        return indices
+
+    def _learn(self, colors: np.ndarray) -> None:
+        rgb = np.stack(((colors >> 16) & 0xFF, (colors >> 8) & 0xFF, colors & 0xFF), axis=1)
+        dist = ((rgb[:, None, :].astype(np.int32) - self.palette[None, :, :]) ** 2).sum(axis=2)
+        self.table[colors] = dist.argmin(axis=1).astype(np.uint8)
+
+
+def lzw_encode(indices: bytes, min_code_size: int = 8) -> bytes:
+    """GIF-flavoured variable-width LZW (LSB-first codes, 12-bit max)."""
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    out = bytearray()
+    bit_buffer = 0
+    bit_count = 0
+    code_size = min_code_size + 1
+    next_code = end_code + 1
+    table: dict[int, int] = {}
+
+    def emit(code: int) -> None:
+        nonlocal bit_buffer, bit_count
+        bit_buffer |= code << bit_count
+        bit_count += code_size
+        while bit_count >= 8:
+            out.append(bit_buffer & 0xFF)
+            bit_buffer >>= 8
+            bit_count -= 8
+
+    emit(clear_code)
+    if not indices:
+        emit(end_code)
+        if bit_count:
+            out.append(bit_buffer & 0xFF)
+        return bytes(out)
+
+    prefix = indices[0]
+    for byte in memoryview(indices)[1:]:
+        key = (prefix << 8) | byte
+        code = table.get(key)
+        if code is not None:
+            prefix = code
+            continue
+        emit(prefix)
+        if next_code < MAX_LZW_CODES:
+            table[key] = next_code
+            next_code += 1
+            if next_code > (1 << code_size) and code_size < 12:
+                code_size += 1
+        else:
+            emit(clear_code)
+            table.clear()
+            next_code = end_code + 1
+            code_size = min_code_size + 1
+        prefix = byte
+    emit(prefix)
+    emit(end_code)
+    if bit_count:
+        out.append(bit_buffer & 0xFF)
+    return bytes(out)
+
+
+def _sub_blocks(data: bytes) -> bytes:
+    """Split image data into length-prefixed sub-blocks, then the terminator."""
+    chunks = [
+        bytes([len(data[i:i + 255])]) + data[i:i + 255] for i in range(0, len(data), 255)
+    ]
+    return b"".join(chunks) + b"\x00"
+
+
+class GifWriter:
+    """Frame sink that writes an animated GIF.
+
+    Takes the same `(frame, duration)` writes as `VideoWriter`, so it can sit
+    behind `DedupWriter`: held frames become one GIF frame with a long delay.
+
+    Args:
+        path: Output .gif file.
+        width, height: Frame size in pixels.
+        fps: Frame rate that durations are expressed in.
+        delta: Encode only each frame's changed rectangle (default). False
+            writes every frame in full, which is mainly useful for comparison.
+        loop: Loop count for the NETSCAPE2.0 extension (0 = forever).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        width: int,
+        height: int,
+        fps: int = FPS,
+        delta: bool = True,
+        loop: int = 0,
+    ):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.delta = delta
+        self.lookup = ColorLookup()
+        self.frames_written = 0
+        self._frame_clock = 0
+        self._canvas: np.ndarray | None = None
+        # One encoded frame is held back so a frame that turns out identical
+        # after palette mapping can extend its delay instead of being written.
+        self._pending: tuple[tuple[int, int, int, int], bytes, bool] | None = None
+        self._pending_start = 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("wb")
+        palette = np.zeros((256, 3), dtype=np.uint8)
+        palette[: len(self.lookup.palette)] = self.lookup.palette
+        self._file.write(b"GIF89a")
+        self._file.write(struct.pack("<HHBBB", width, height, 0xF7, 0, 0))
+        self._file.write(palette.tobytes())
+        self._file.write(b"\x21\xff\x0bNETSCAPE2.0\x03\x01" + struct.pack("<H", loop) + b"\x00")
+
+    def _centiseconds(self, frames: int) -> int:
+        return round(frames * 100 / self.fps)
+
+    def write(self, frame: bytes, duration: int) -> None:
+        """Append an RGB24 frame shown for `duration` frames."""
+        rgb = np.frombuffer(frame, dtype=np.uint8).reshape(self.height, self.width, 3)
+        indices = self.lookup.map(rgb)
+
+        if self._canvas is None or not self.delta:
+            rect = (0, 0, self.width, self.height)
+            encoded = indices.tobytes()
+            transparent = False
+        else:
+            changed = indices != self._canvas
+            rows = np.flatnonzero(changed.any(axis=1))
+            if rows.size == 0:
+                self._frame_clock += duration
+                return
+            cols = np.flatnonzero(changed.any(axis=0))
+            top, bottom = int(rows[0]), int(rows[-1]) + 1
+            left, right = int(cols[0]), int(cols[-1]) + 1
+            patch = indices[top:bottom, left:right].copy()
+            patch[~changed[top:bottom, left:right]] = TRANSPARENT_INDEX
+            rect = (left, top, right - left, bottom - top)
+            encoded = patch.tobytes()
+            transparent = True
+
+        self._flush_pending()
+        self._canvas = indices
+        self._pending = (rect, encoded, transparent)
+        self._pending_start = self._frame_clock
+        self._frame_clock += duration
+
+    def _flush_pending(self) -> None:
+        if self._pending is None:
+            return
+        (left, top, width, height), encoded, transparent = self._pending
+        delay = self._centiseconds(self._frame_clock) - self._centiseconds(self._pending_start)
+        packed = (DISPOSE_NONE << 2) | int(transparent)
+        self._file.write(b"\x21\xf9\x04" + struct.pack("<BHB", packed, delay, TRANSPARENT_INDEX))
+        self._file.write(b"\x00")
+        self._file.write(b"\x2c" + struct.pack("<HHHHB", left, top, width, height, 0))
+        self._file.write(b"\x08" + _sub_blocks(lzw_encode(encoded)))
+        self.frames_written += 1
+        self._pending = None
+
+    def close(self) -> None:
+        """Write the last frame and the GIF trailer."""
+        self._flush_pending()
+        self._file.write(b"\x3b")
+        self._file.close()
@@ -0,0 +1,201 @@
+"""Lossless PNG frame sequences, compressed on a thread pool.
+
+`pygame.image.save()` on the render thread compresses every frame before the
+next one can be drawn. `PngSequenceWriter` leaves the render thread only the
+copy out of the screen:
+
+- Capture: `surfarray.pixels3d()` views the surface's pixels without
+  copying. They are copied once, straight into a pooled buffer laid out as
+  PNG scanlines (a filter byte, then RGB). The buffers are preallocated. When
+  all of them are in flight, capture waits for one to come back, which
+  caps memory at `buffers` frames.
+- Compress: worker threads deflate the scanlines at `compression`
+  (zlib releases the GIL) and return the buffer to the pool.
+- Write: a single writer thread takes the compressed frames in capture
+  order, so `frame_000000.png`, `frame_000001.png`, ... always appear in
+  sequence. A frame held for several slots is written once and hard-linked
+  (or copied) for the rest.
+
+The writer is also a `FrameSink` (raw RGB bytes plus a duration), so it can
+sit behind `DedupWriter` like the video and GIF writers.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
+"""
+
+import os
+import shutil
+import struct
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from queue import Queue
+
+import numpy as np
+import pygame
+
+from bucket_sort_viz.config import PNG_BUFFERS_PER_WORKER, PNG_COMPRESSION
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+COLOR_TYPE_RGB = 2
+
+
+def _chunk(kind: bytes, data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+
+def encode_png(scanlines: np.ndarray, width: int, height: int, compression: int) -> bytes:
+    """PNG file bytes for (height, 1 + 3 * width) filtered RGB scanlines."""
+    header = struct.pack(">IIBBBBB", width, height, 8, COLOR_TYPE_RGB, 0, 0, 0)
+    return b"".join((
+        PNG_SIGNATURE,
+        _chunk(b"IHDR", header),
+        _chunk(b"IDAT", zlib.compress(scanlines, compression)),
+        _chunk(b"IEND", b""),
+    ))
+
+
+class PngSequenceWriter:
+    """Writes numbered PNG frames to a directory, compressing on worker threads.
+
+    Args:
+        directory: Output directory (created if missing).
+        width, height: Frame size in pixels.
+        compression: zlib level, 0 (stored) to 9 (smallest).
+        workers: Compression threads (default: CPU count).
+        buffers: Pooled frame buffers (default: `PNG_BUFFERS_PER_WORKER` per worker).
+        prefix: File name prefix; files are `<prefix>_<frame:06d>.png`.
+
+    Attributes:
+        frames_written: Frame files on disk, including linked holds.
+        bytes_written: PNG bytes written (linked holds add none).
+        seconds: Wall time from the first capture to `close()`.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        width: int,
+        height: int,
+        compression: int = PNG_COMPRESSION,
+        workers: int | None = None,
+        buffers: int | None = None,
+        prefix: str = "frame",
+    ):
+        if not 0 <= compression <= 9:
+            raise ValueError(f"compression must be 0-9, got {compression}")
+        self.directory = directory
+        self.width = width
+        self.height = height
+        self.compression = compression
+        self.prefix = prefix
+        self.frames_written = 0
+        self.bytes_written = 0
+        self.seconds = 0.0
+        workers = max(1, workers or os.cpu_count() or 1)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        self._free: Queue[np.ndarray] = Queue()
+        for _ in range(buffers or PNG_BUFFERS_PER_WORKER * workers):
+            scanlines = np.empty((height, 1 + 3 * width), dtype=np.uint8)
+            scanlines[:, 0] = 0                      # Filter type None on every row
+            self._free.put(scanlines)
+        self._compressors = ThreadPoolExecutor(workers, thread_name_prefix="png")
+        self._writer = ThreadPoolExecutor(1, thread_name_prefix="png-write")
+        self._writes: deque[Future] = deque()
+        self._next_frame = 0
+        self._start: float | None = None
+
+    def __enter__(self) -> "PngSequenceWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def path(self, frame: int) -> Path:
+        return self.directory / f"{self.prefix}_{frame:06d}.png"
+
+    @property
+    def frames_per_second(self) -> float:
+        return self.frames_written / self.seconds if self.seconds else 0.0
+
+    def capture(self, surface: pygame.Surface, hold: int = 1) -> None:
+        """Queue the surface's current pixels as the next `hold` frames."""
+        if surface.get_size() != (self.width, self.height):
+            raise ValueError(
+                f"Surface is {surface.get_size()}, expected {(self.width, self.height)}",
+            )
+
+        def fill(scanlines: np.ndarray) -> None:
+            pixels = pygame.surfarray.pixels3d(surface)  # (width, height, 3) view; locks it
+            try:
+                scanlines[:, 1:].reshape(self.height, self.width, 3)[:] = pixels.transpose(1, 0, 2)
+            finally:
+                del pixels
+
+        self._queue(fill, hold)
+
+    def write(self, frame: bytes, duration: int) -> None:
+        """`FrameSink` entry point: queue raw RGB24 bytes for `duration` frames."""
+        if len(frame) != 3 * self.width * self.height:
+            raise ValueError(
+                f"Frame is {len(frame)} bytes, expected {3 * self.width * self.height}",
+            )
+
+        def fill(scanlines: np.ndarray) -> None:
+            scanlines[:, 1:] = np.frombuffer(frame, dtype=np.uint8).reshape(self.height, -1)
+
+        self._queue(fill, duration)
+
+    def _queue(self, fill: Callable[[np.ndarray], None], hold: int) -> None:
+        """Fill a pooled buffer and submit it. Checks come first, so a bad call never holds one."""
+        if hold < 1:
+            raise ValueError(f"hold must be at least 1 frame, got {hold}")
+        if self._start is None:
+            self._start = time.perf_counter()
+        while self._writes and self._writes[0].done():
+            self._writes.popleft().result()          # Surface worker errors early
+        scanlines = self._free.get()
+        try:
+            fill(scanlines)
+        except BaseException:
+            self._free.put(scanlines)
+            raise
+        compressed = self._compressors.submit(self._compress, scanlines)
+        frame, self._next_frame = self._next_frame, self._next_frame + hold
+        self._writes.append(self._writer.submit(self._write, compressed, frame, hold))
+
+    def _compress(self, scanlines: np.ndarray) -> bytes:
+        try:
+            return encode_png(scanlines, self.width, self.height, self.compression)
+        finally:
+            self._free.put(scanlines)
+
+    def _write(self, compressed: Future, frame: int, hold: int) -> None:
+        data = compressed.result()
+        first = self.path(frame)
+        first.write_bytes(data)
+        self.bytes_written += len(data)
+        self.frames_written += 1
+        for repeat in range(frame + 1, frame + hold):
+            path = self.path(repeat)
+            path.unlink(missing_ok=True)
+            try:
+                os.link(first, path)
+            except OSError:                          # No hard links here (e.g. FAT, some shares)
+                shutil.copyfile(first, path)
+                self.bytes_written += len(data)
+            self.frames_written += 1
+
+    def close(self) -> None:
+        """Wait for every queued frame to be on disk. Raises the first worker error."""
+        try:
+            while self._writes:
+                self._writes.popleft().result()
+        finally:
+            self._compressors.shutdown(cancel_futures=True)
+            self._writer.shutdown(cancel_futures=True)
+            if self._start is not None:
+                self.seconds = time.perf_counter() - self._start
@@ -0,0 +1,203 @@
+"""Piped ffmpeg video export with variable frame durations.
+
+Raw RGB frames are wrapped in a minimal streaming Matroska container before
+being piped to ffmpeg. Unlike a bare `-f rawvideo` pipe (which forces one
+input frame per output tick), Matroska carries a timestamp and duration per
+frame, so a held frame is sent and encoded once and ffmpeg writes it out as a
+single long frame (variable frame rate).
+"""
+
+import struct
+import subprocess
+from pathlib import Path
+from typing import BinaryIO
+
+from bucket_sort_viz.config import FPS
+
+# EBML / Matroska element IDs (only what a single raw video track needs).
+EBML = 0x1A45DFA3
+EBML_VERSION = 0x4286
+EBML_READ_VERSION = 0x42F7
+EBML_MAX_ID_LENGTH = 0x42F2
+EBML_MAX_SIZE_LENGTH = 0x42F3
+DOC_TYPE = 0x4282
+DOC_TYPE_VERSION = 0x4287
+DOC_TYPE_READ_VERSION = 0x4285
+SEGMENT = 0x18538067
+INFO = 0x1549A966
+TIMESTAMP_SCALE = 0x2AD7B1
+MUXING_APP = 0x4D80
+WRITING_APP = 0x5741
+TRACKS = 0x1654AE6B
+TRACK_ENTRY = 0xAE
+TRACK_NUMBER = 0xD7
+TRACK_UID = 0x73C5
+TRACK_TYPE = 0x83
+CODEC_ID = 0x86
+VIDEO = 0xE0
+PIXEL_WIDTH = 0xB0
+PIXEL_HEIGHT = 0xBA
+COLOUR_SPACE = 0x2EB524
+CLUSTER = 0x1F43B675
+CLUSTER_TIMESTAMP = 0xE7
+BLOCK_GROUP = 0xA0
+BLOCK = 0xA1
+BLOCK_DURATION = 0x9B
+
+UNKNOWN_SIZE = b"\x01\xff\xff\xff\xff\xff\xff\xff"
+RGB24_FOURCC = b"RGB\x18"
+MAX_CLUSTER_SPAN_MS = 30_000    # Block timestamps are int16 offsets from the cluster
+
+
+def _encode_id(element_id: int) -> bytes:
+    return element_id.to_bytes((element_id.bit_length() + 7) // 8, "big")
+
+
+def _encode_size(size: int) -> bytes:
+    """EBML variable-length size (shortest form; all-ones values are reserved)."""
+    for length in range(1, 9):
+        if size < (1 << (7 * length)) - 1:
+            return (size | (1 << (7 * length))).to_bytes(length, "big")
+    raise ValueError(f"EBML element too large: {size} bytes")
+
+
+def _element(element_id: int, payload: bytes) -> bytes:
+    return _encode_id(element_id) + _encode_size(len(payload)) + payload
+
+
+def _uint(element_id: int, value: int) -> bytes:
+    return _element(element_id, value.to_bytes(max(1, (value.bit_length() + 7) // 8), "big"))
+
+
+def _string(element_id: int, value: str) -> bytes:
+    return _element(element_id, value.encode("ascii"))
+
+
+class MatroskaStream:
+    """Writes RGB24 frames with explicit durations as a streaming Matroska file.
+
+    Segment and clusters use the "unknown size" encoding, so nothing is ever
+    seeked back to — the output can be a pipe.
+
+    Args:
+        stream: Writable binary stream (e.g. ffmpeg's stdin).
+        width, height: Frame size in pixels.
+        fps: Frame rate that durations are expressed in.
+    """
+
+    def __init__(self, stream: BinaryIO, width: int, height: int, fps: int = FPS):
+        self.stream = stream
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.frame_size = width * height * 3
+        self._frame_clock = 0          # Elapsed time in frames at `fps`
+        self._cluster_start_ms: int | None = None
+        self._write_header()
+
+    def _write_header(self) -> None:
+        header = _element(EBML, b"".join([
+            _uint(EBML_VERSION, 1),
+            _uint(EBML_READ_VERSION, 1),
+            _uint(EBML_MAX_ID_LENGTH, 4),
+            _uint(EBML_MAX_SIZE_LENGTH, 8),
+            _string(DOC_TYPE, "matroska"),
+            _uint(DOC_TYPE_VERSION, 4),
+            _uint(DOC_TYPE_READ_VERSION, 2),
+        ]))
+        info = _element(INFO, b"".join([
+            _uint(TIMESTAMP_SCALE, 1_000_000),     # Block timestamps in ms
+            _string(MUXING_APP, "bucket-sort-viz"),
+            _string(WRITING_APP, "bucket-sort-viz"),
+        ]))
+        tracks = _element(TRACKS, _element(TRACK_ENTRY, b"".join([
+            _uint(TRACK_NUMBER, 1),
+            _uint(TRACK_UID, 1),
+            _uint(TRACK_TYPE, 1),                   # Video
+            _string(CODEC_ID, "V_UNCOMPRESSED"),
+            _element(VIDEO, b"".join([
+                _uint(PIXEL_WIDTH, self.width),
+                _uint(PIXEL_HEIGHT, self.height),
+                _element(COLOUR_SPACE, RGB24_FOURCC),
+            ])),
+        ])))
+        self.stream.write(header + _encode_id(SEGMENT) + UNKNOWN_SIZE + info + tracks)
+
+    def _ms(self, frames: int) -> int:
+        return round(frames * 1000 / self.fps)
+
+    def write(self, frame: bytes, duration: int) -> None:
+        """Append one frame shown for `duration` frames."""
+        if len(frame) != self.frame_size:
+            raise ValueError(f"Expected {self.frame_size} bytes of RGB24, got {len(frame)}")
+        start_ms = self._ms(self._frame_clock)
+        duration_ms = self._ms(self._frame_clock + duration) - start_ms
+        cluster_start = self._cluster_start_ms
+        if cluster_start is None or start_ms - cluster_start > MAX_CLUSTER_SPAN_MS:
+            self._cluster_start_ms = start_ms
+            self.stream.write(
+                _encode_id(CLUSTER) + UNKNOWN_SIZE + _uint(CLUSTER_TIMESTAMP, start_ms)
+            )
+        # Block: track number (vint), int16 timestamp relative to cluster, flags.
+        block_header = b"\x81" + struct.pack(">hB", start_ms - self._cluster_start_ms, 0)
+        block_size = len(block_header) + len(frame)
+        block = _encode_id(BLOCK) + _encode_size(block_size) + block_header
+        group_tail = _uint(BLOCK_DURATION, duration_ms)
+        group_size = len(block) + len(frame) + len(group_tail)
+        self.stream.write(_encode_id(BLOCK_GROUP) + _encode_size(group_size) + block)
+        self.stream.write(frame)
+        self.stream.write(group_tail)
+        self._frame_clock += duration
+
+    @property
+    def duration_frames(self) -> int:
+        return self._frame_clock
+
+
+class VideoWriter:
+    """Frame sink that encodes to H.264 via a piped ffmpeg process.
+
+    Each `write()` sends one frame with its duration, so runs coalesced by
+    `DedupWriter` are encoded once and kept as variable-frame-rate output.
+
+    Args:
+        path: Output video file (container chosen by ffmpeg from the suffix).
+        width, height: Frame size in pixels.
+        fps: Frame rate that durations are expressed in.
+        ffmpeg: ffmpeg executable.
+        crf: x264 constant rate factor (lower is higher quality).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        width: int,
+        height: int,
+        fps: int = FPS,
+        ffmpeg: str = "ffmpeg",
+        crf: int = 18,
+    ):
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._process = subprocess.Popen(
+            [
+                ffmpeg, "-y", "-loglevel", "error",
+                "-f", "matroska", "-i", "pipe:0",
+                "-c:v", "libx264", "-pix_fmt", "yuv420p", "-crf", str(crf),
+                # Keep the stream's millisecond timestamps: otherwise x264's time base
+                # comes from a frame rate guessed off the holds, rounding them off.
+                "-fps_mode", "passthrough", "-enc_time_base", "demux",
+                str(path),
+            ],
+            stdin=subprocess.PIPE,
+        )
+        self._muxer = MatroskaStream(self._process.stdin, width, height, fps)
+
+    def write(self, frame: bytes, duration: int) -> None:
+        self._muxer.write(frame, duration)
+
+    def close(self) -> None:
+        """Finish the stream and wait for ffmpeg to flush the file."""
+        self._process.stdin.close()
+        if self._process.wait() != 0:
+            raise RuntimeError(f"ffmpeg exited with status {self._process.returncode}")
@@ -1,10 +1,243 @@
 """Entry point: CLI parsing and visualization launcher.
 
-Stub for Brick 1 — full implementation in Brick 11.
+Engine-only modes (`--trace-only`, `--stats`, `--export-trace`, `--sort-file`)
+never import Pygame. The renderer (and with it Pygame, SDL, and fonts) is
+imported only when a window is actually requested.
 """
 
+import argparse
+from pathlib import Path
 
-def main():
-    print("Bucket Sort Visualizer — Lightning Labs")
-    print("Full CLI + menu implementation coming in Brick 11.")
-    print("Run `uv run pytest tests/ -v` to verify Brick 1.")
+from bucket_sort_viz.config import ELEMENT_COUNT_DEFAULT
+from bucket_sort_viz.model.bucket_sort import generate_steps, generate_values
+from bucket_sort_viz.model.stats import compute_stats
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.model.trace_io import write_trace
+from bucket_sort_viz.presets import DEFAULT_PRESET, PRESETS, SortPreset
+
+LOD_CHOICES = {"auto": None, "on": True, "off": False}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bucket-sort-viz",
+        description="Bucket Sort Visualizer — Lightning Labs",
+    )
+    parser.add_argument(
+        "--preset", choices=sorted(PRESETS), default=None,
+        help=f"value range / bucket layout (default: {DEFAULT_PRESET}, "
+             "or fitted to --input)",
+    )
+    parser.add_argument(
+        "--count", type=int, default=ELEMENT_COUNT_DEFAULT,
+        help=f"number of elements to sort (default: {ELEMENT_COUNT_DEFAULT})",
+    )
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument(
+        "--input", type=Path, metavar="PATH",
+        help="sort the values in PATH (raw int32, .npy, or a .txt/.csv column) instead "
+             "of random ones (needs NumPy)",
+    )
+    parser.add_argument(
+        "--column", default="0", metavar="COL",
+        help="--input .txt/.csv column, by index (negative from the end) or header name "
+             "(default: 0)",
+    )
+    parser.add_argument(
+        "--counting-width", type=int, default=0, metavar="W",
+        help="counting-sort buckets whose value range is at most W wide (default: off)",
+    )
+    parser.add_argument(
+        "--split-load", type=int, default=0, metavar="K",
+        help="recursively re-bucket buckets holding more than K elements (default: off)",
+    )
+
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "--trace-only", action="store_true",
+        help="print the recorded steps and exit (no window, no Pygame)",
+    )
+    mode.add_argument(
+        "--stats", action="store_true",
+        help="print step and bucket-load statistics and exit (no window, no Pygame)",
+    )
+    mode.add_argument(
+        "--export-trace", type=Path, metavar="PATH",
+        help="stream the steps to an NDJSON, .bst (columnar) or .bsw (compact) trace; "
+             "append .gz to compress",
+    )
+    mode.add_argument(
+        "--sort-file", type=Path, nargs=2, metavar=("INPUT", "OUTPUT"),
+        help="external-memory sort of an int32 (or .txt/.csv) file into OUTPUT, "
+             "using the preset's buckets",
+    )
+    parser.add_argument(
+        "--memory-mb", type=int, default=64,
+        help="memory budget for --sort-file in MB (default: 64)",
+    )
+    mode.add_argument(
+        "--validate", type=Path, nargs="+", metavar="TRACE",
+        help="check recorded trace files against the sort invariants (needs NumPy)",
+    )
+    mode.add_argument(
+        "--batch", type=Path, metavar="MANIFEST",
+        help="run every job in a JSON batch manifest (resumes interrupted batches)",
+    )
+    parser.add_argument(
+        "--workers", type=int, default=None,
+        help="worker processes for --batch (default: CPU count)",
+    )
+
+    view = parser.add_argument_group("window options")
+    view.add_argument(
+        "--lod", choices=sorted(LOD_CHOICES), default="auto",
+        help="aggregated level-of-detail rendering (default: auto)",
+    )
+    view.add_argument(
+        "--profile", action="store_true",
+        help="record per-stage frame times and write them to output/ on exit",
+    )
+    view.add_argument(
+        "--profile-overlay", action="store_true",
+        help="also draw an FPS / stage-breakdown overlay",
+    )
+    return parser
+
+
+def _print_trace(steps: list[Step]) -> None:
+    for i, step in enumerate(steps):
+        print(f"{i:>7}  {step.phase:<8} {step.step_type:<12} {step.description}")
+
+
+def _print_stats(preset: SortPreset, original: list[int], steps: list[Step]) -> None:
+    stats = compute_stats(steps, preset.num_buckets)
+    print(f"preset:      {preset.name} {preset.value_range}, {preset.num_buckets} buckets")
+    print(f"elements:    {len(original)}")
+    print(f"steps:       {stats.step_count}")
+    for step_type, n in sorted(stats.step_counts.items()):
+        print(f"  {step_type:<12} {n}")
+    print(f"comparisons: {stats.comparisons}")
+    print(f"swaps:       {stats.swaps}")
+    print(f"placements:  {stats.placements}")
+    print(f"bucket load: {stats.bucket_loads} (max {stats.max_bucket_load})")
+    if stats.max_depth:
+        print(f"re-bucketed: depth {stats.max_depth}, {len(stats.sub_bucket_loads)} sub-buckets "
+              f"(max load {stats.max_sub_bucket_load})")
+
+
+def _run_batch(manifest: Path, workers: int | None) -> None:
+    from bucket_sort_viz.batch import load_manifest, run_batch
+
+    name, jobs = load_manifest(manifest)
+    report = run_batch(name, jobs, workers=workers)
+    print(f"batch '{name}': {len(jobs)} jobs")
+    print(f"  completed {report.completed}, skipped {report.skipped}, failed {report.failed}")
+    print(f"  {report.seconds:.2f} s, {report.jobs_per_second:.1f} jobs/s, "
+          f"{report.steps_per_second:,.0f} steps/s, {report.bytes_written / 1e6:.1f} MB written")
+
+
+def _sort_file(preset: SortPreset, paths: list[Path], memory_mb: int) -> None:
+    from bucket_sort_viz.model.external import external_sort
+
+    input_path, output_path = paths
+    report = external_sort(input_path, output_path, preset, memory_limit=memory_mb << 20)
+    print(f"sorted {report.values:,} values into {output_path}")
+    print(f"  {report.seconds:.2f} s, {report.mb_per_second:.1f} MB/s, "
+          f"{report.spill_bytes / 1e6:.1f} MB spilled, re-bucketing depth {report.max_depth}")
+
+
+def _load_input(path: Path, preset_name: str | None, column: str) -> tuple[SortPreset, list[int]]:
+    from bucket_sort_viz.model.loaders import load_values
+
+    preset = PRESETS[preset_name] if preset_name else None
+    try:
+        field: int | str = int(column)
+    except ValueError:
+        field = column                       # A header name
+    values, preset = load_values(path, preset, column=field)
+    # The step engine indexes values one at a time, which is faster on a list.
+    return preset, values.tolist()
+
+
+def _validate(paths: list[Path]) -> bool:
+    from bucket_sort_viz.model.validate import validate_trace
+
+    all_ok = True
+    for path in paths:
+        try:
+            result = validate_trace(path)
+        except ValueError as e:              # No preset/values recorded, or a bad header
+            print(f"ERROR    {e}")
+            all_ok = False
+            continue
+        rate = f"{result.steps:,} steps, {result.steps_per_second:,.0f} steps/s"
+        if result.ok:
+            print(f"ok       {path} ({rate})")
+        else:
+            print(f"INVALID  {path}: {result.violation} ({rate})")
+            all_ok = False
+    return all_ok
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.count < 1:
+        parser.error("--count must be at least 1")
+
+    if args.batch:
+        _run_batch(args.batch, args.workers)
+        return
+    if args.validate:
+        if not _validate(args.validate):
+            raise SystemExit(1)
+        return
+
+    preset = PRESETS[args.preset or DEFAULT_PRESET]
+    if args.sort_file:
+        _sort_file(preset, args.sort_file, args.memory_mb)
+        return
+    if args.input:
+        try:
+            preset, values = _load_input(args.input, args.preset, args.column)
+        except ValueError as e:
+            parser.error(f"--input {args.input}: {e}")
+    else:
+        values = generate_values(preset, args.count, args.seed)
+    if args.export_trace:
+        # Streamed straight from the engine, so the step list is never built.
+        meta = {"preset": preset.name, "seed": args.seed, "values": values}
+        if preset.name not in PRESETS:       # Fitted to --input: record how to rebuild it
+            meta["buckets"] = {
+                "value_range": list(preset.value_range),
+                "num_buckets": preset.num_buckets,
+                "bucket_size": preset.bucket_size,
+            }
+        steps = generate_steps(
+            preset, values, counting_width=args.counting_width, split_load=args.split_load,
+        )
+        written = write_trace(args.export_trace, steps, meta)
+        print(f"wrote {written} steps to {args.export_trace}")
+        return
+
+    steps = list(generate_steps(
+        preset, values, counting_width=args.counting_width, split_load=args.split_load,
+    ))
+
+    if args.trace_only:
+        _print_trace(steps)
+        return
+    if args.stats:
+        _print_stats(preset, values, steps)
+        return
+
+    # Deferred: importing the view pulls in Pygame and initializes SDL.
+    from bucket_sort_viz.view.renderer import Renderer
+
+    Renderer(
+        preset,
+        values,
+        lod=LOD_CHOICES[args.lod],
+        profile=args.profile,
+        profile_overlay=args.profile_overlay,
+    ).run_static()
@@ -2,20 +2,40 @@
 
 Generates random values within a preset's range, sorts them using
 bucket sort with insertion sort per bucket, and records every logical
-step for the animator to replay.
+step for the animator to replay. With `counting_width` set, buckets whose
+value range is at most that wide are sorted by a stable counting pass
+instead, which does no comparisons at all — the fast path for
+duplicate-heavy inputs. With `split_load` set, any bucket holding more than
+that many elements is re-bucketed recursively (MSD-style) over its own
+range, which bounds the work of clustered inputs: every leaf bucket either
+holds at most `split_load` elements or a single distinct value, so a run
+makes at most about n * split_load / 2 + n comparisons.
+
+`generate_steps()` yields the steps lazily so very large runs can be
+streamed to disk without holding the whole trace in memory;
+`bucket_sort()` is the list-returning convenience wrapper.
 """
 
 import random
+from collections.abc import Iterator, Sequence
 
 from bucket_sort_viz.config import STEP_TO_CODE_LINE
 from bucket_sort_viz.model.step import Step
 from bucket_sort_viz.presets import SortPreset
 
 
+def generate_values(preset: SortPreset, count: int, seed: int | None = None) -> list[int]:
+    """Draw `count` uniform random values from the preset's value range."""
+    rng = random.Random(seed)
+    return [rng.randint(preset.value_range[0], preset.value_range[1]) for _ in range(count)]
+
+
 def bucket_sort(
     preset: SortPreset,
     count: int,
     seed: int | None = None,
+    counting_width: int = 0,
+    split_load: int = 0,
 ) -> tuple[list[int], list[int], list[Step]]:
     """Run bucket sort and record all steps.
 
@@ -23,15 +43,101 @@ def bucket_sort(
         preset: The sort preset defining range, bucket count, etc.
         count: Number of elements to generate and sort.
         seed: Optional random seed for reproducibility.
+        counting_width: Counting-sort buckets whose range spans at most this
+            many values (0 disables the fast path).
+        split_load: Re-bucket buckets holding more elements than this
+            (0 disables recursion).
 
     Returns:
         A tuple of (original_values, sorted_values, steps).
     """
-    rng = random.Random(seed)
-    values = [rng.randint(preset.value_range[0], preset.value_range[1]) for _ in range(count)]
-    original_values = list(values)
+    original_values = generate_values(preset, count, seed)
+    steps = list(generate_steps(
+        preset, original_values, counting_width=counting_width, split_load=split_load,
+    ))
+    sorted_values = [original_values[eid] for eid in steps[-1].element_ids]
+    return original_values, sorted_values, steps
+
+
+def generate_steps(
+    preset: SortPreset,
+    original_values: Sequence[int],
+    describe: bool = True,
+    counting_width: int = 0,
+    split_load: int = 0,
+) -> Iterator[Step]:
+    """Yield every recorded step of bucket-sorting `original_values`, in order.
+
+    Element IDs are indices into `original_values`. The final step is the
+    celebration, whose element_ids list the IDs in sorted order. With
+    `describe=False` the debug descriptions are left empty, which is
+    noticeably faster for very large runs. Buckets whose value range spans
+    at most `counting_width` values are counting-sorted ("place" steps);
+    buckets holding more than `split_load` elements are split into
+    `preset.num_buckets` sub-buckets and sorted recursively (steps with
+    depth > 0).
+    """
+    steps = _sort_steps(preset, original_values, counting_width, split_load)
+    if not describe:
+        yield from steps
+        return
+    for step in steps:
+        step.description = describe_step(step, original_values)
+        yield step
+
+
+def describe_step(step: Step, values: Sequence[int] | None) -> str:
+    """Human-readable debug note for a step ("" when `values` is unknown)."""
+    if values is None:
+        return ""
+    ids = step.element_ids
+    bucket = f"bucket {step.bucket_index}"
+    if step.depth:
+        bucket = f"sub-bucket {step.bucket_index} (depth {step.depth})"
+    match step.step_type:
+        case "phase_change":
+            return f"Begin {step.phase} phase"
+        case "scatter":
+            return (
+                f"Scatter element {ids[0]} (value={values[ids[0]]}) "
+                f"into {bucket}"
+            )
+        case "compare" | "swap" | "no_swap":
+            a, b = ids
+            pair = f"{a} (val={values[a]})", f"{b} (val={values[b]})"
+            where = f"in {bucket}"
+            if step.step_type == "compare":
+                return f"Compare elements {pair[0]} and {pair[1]} {where}"
+            if step.step_type == "swap":
+                return f"Swap elements {pair[0]} and {pair[1]} {where}"
+            return f"No swap needed: {pair[0]} <= {pair[1]} {where}"
+        case "gather" if step.depth:
+            return (
+                f"Gather element {ids[0]} (value={values[ids[0]]}) from {bucket} "
+                f"back to slot {step.output_index} of its parent"
+            )
+        case "gather":
+            return (
+                f"Gather element {ids[0]} (value={values[ids[0]]}) "
+                f"to output[{step.output_index}]"
+            )
+        case "place":
+            return (
+                f"Place element {ids[0]} (value={values[ids[0]]}) "
+                f"at slot {step.slot_index} of {bucket}"
+            )
+        case "celebration":
+            return "Sorting complete!"
+    return ""
 
-    steps: list[Step] = []
+
+def _sort_steps(
+    preset: SortPreset,
+    original_values: Sequence[int],
+    counting_width: int = 0,
+    split_load: int = 0,
+) -> Iterator[Step]:
+    count = len(original_values)
     bucket_ranges = preset.generate_bucket_ranges()
 
     # Build element_id -> value mapping (stable IDs = original list indices)
@@ -39,13 +145,12 @@ def bucket_sort(
     buckets: list[list[int]] = [[] for _ in range(preset.num_buckets)]
 
     # ── Phase: Scatter ──────────────────────────────────
-    steps.append(Step(
+    yield Step(
         step_type="phase_change",
         phase="scatter",
         element_ids=[],
         code_line=STEP_TO_CODE_LINE["phase_change"],
-        description="Begin scatter phase",
-    ))
+    )
 
     for element_id in range(count):
         value = original_values[element_id]
@@ -53,56 +158,50 @@ def bucket_sort(
         slot = len(buckets[bucket_idx])
         buckets[bucket_idx].append(element_id)
 
-        steps.append(Step(
+        yield Step(
             step_type="scatter",
             phase="scatter",
             element_ids=[element_id],
             bucket_index=bucket_idx,
             slot_index=slot,
             code_line=STEP_TO_CODE_LINE["scatter"],
-            description=f"Scatter element {element_id} (value={value}) into bucket {bucket_idx}",
-        ))
+        )
 
-    # ── Phase: Sort Buckets (insertion sort) ────────────
-    steps.append(Step(
+    # ── Phase: Sort Buckets ─────────────────────────────
+    yield Step(
         step_type="phase_change",
         phase="sort",
         element_ids=[],
         code_line=STEP_TO_CODE_LINE["phase_change"],
-        description="Begin sort phase",
-    ))
+    )
 
     for bucket_idx, bucket in enumerate(buckets):
-        if len(bucket) <= 1:
-            continue
-        _insertion_sort_bucket(
-            bucket, bucket_idx, original_values, steps,
+        yield from _sort_bucket(
+            bucket, bucket_idx, bucket_ranges[bucket_idx], original_values,
+            counting_width=counting_width,
+            split_load=split_load,
+            fanout=preset.num_buckets,
         )
 
     # ── Phase: Gather ───────────────────────────────────
-    steps.append(Step(
+    yield Step(
         step_type="phase_change",
         phase="gather",
         element_ids=[],
         code_line=STEP_TO_CODE_LINE["phase_change"],
-        description="Begin gather phase",
-    ))
+    )
 
     output_idx = 0
     for bucket_idx, bucket in enumerate(buckets):
         for element_id in bucket:
-            steps.append(Step(
+            yield Step(
                 step_type="gather",
                 phase="gather",
                 element_ids=[element_id],
                 bucket_index=bucket_idx,
                 output_index=output_idx,
                 code_line=STEP_TO_CODE_LINE["gather"],
-                description=(
-                    f"Gather element {element_id} "
-                    f"(value={original_values[element_id]}) to output[{output_idx}]"
-                ),
-            ))
+            )
             output_idx += 1
 
     # ── Celebration ─────────────────────────────────────
@@ -110,16 +209,12 @@ def bucket_sort(
     for bucket in buckets:
         all_ids.extend(bucket)
 
-    steps.append(Step(
+    yield Step(
         step_type="celebration",
         phase="done",
         element_ids=all_ids,
         code_line=STEP_TO_CODE_LINE["celebration"],
-        description="Sorting complete!",
-    ))
-
-    sorted_values = [original_values[eid] for eid in all_ids]
-    return original_values, sorted_values, steps
+    )
 
 
 def _find_bucket(value: int, bucket_ranges: list[tuple[int, int]]) -> int:
@@ -130,13 +225,102 @@ def _find_bucket(value: int, bucket_ranges: list[tuple[int, int]]) -> int:
     raise ValueError(f"Value {value} does not fit in any bucket range: {bucket_ranges}")
 
 
+def _sort_bucket(
+    bucket: list[int],
+    bucket_idx: int,
+    bucket_range: tuple[int, int],
+    original_values: Sequence[int],
+    depth: int = 0,
+    *,
+    counting_width: int = 0,
+    split_load: int = 0,
+    fanout: int = 2,
+    parent_bucket: int = -1,
+) -> Iterator[Step]:
+    """Sort one bucket in-place by the cheapest applicable method, yielding steps.
+
+    Narrow buckets are counting-sorted; overloaded ones that still span more
+    than one value are re-bucketed; everything else is insertion-sorted.
+    `parent_bucket` is the enclosing top-level bucket when depth > 0.
+    """
+    if len(bucket) <= 1:
+        return
+    low, high = bucket_range
+    if high - low + 1 <= counting_width:
+        yield from _counting_sort_bucket(
+            bucket, bucket_idx, low, high, original_values, depth, parent_bucket,
+        )
+    elif split_load and len(bucket) > split_load and high > low:
+        yield from _split_bucket(
+            bucket, bucket_range, original_values, depth,
+            counting_width=counting_width, split_load=split_load, fanout=fanout,
+            parent_bucket=bucket_idx if depth == 0 else parent_bucket,
+        )
+    else:
+        yield from _insertion_sort_bucket(
+            bucket, bucket_idx, original_values, depth, parent_bucket,
+        )
+
+
+def _split_bucket(
+    bucket: list[int],
+    bucket_range: tuple[int, int],
+    original_values: Sequence[int],
+    depth: int,
+    *,
+    counting_width: int,
+    split_load: int,
+    fanout: int,
+    parent_bucket: int,
+) -> Iterator[Step]:
+    """Re-bucket an overloaded bucket over its own range, sort the parts, gather them back."""
+    low, high = bucket_range
+    size = -(-(high - low + 1) // max(2, fanout))      # ceil: at most `fanout` sub-buckets
+    sub_ranges = [(start, min(start + size - 1, high)) for start in range(low, high + 1, size)]
+    sub_buckets: list[list[int]] = [[] for _ in sub_ranges]
+    for element_id in bucket:
+        sub_idx = (original_values[element_id] - low) // size
+        yield Step(
+            step_type="scatter",
+            phase="sort",
+            element_ids=[element_id],
+            bucket_index=sub_idx,
+            slot_index=len(sub_buckets[sub_idx]),
+            code_line=STEP_TO_CODE_LINE["scatter"],
+            depth=depth + 1,
+            parent_bucket=parent_bucket,
+        )
+        sub_buckets[sub_idx].append(element_id)
+
+    for sub_idx, sub_bucket in enumerate(sub_buckets):
+        yield from _sort_bucket(
+            sub_bucket, sub_idx, sub_ranges[sub_idx], original_values, depth + 1,
+            counting_width=counting_width, split_load=split_load, fanout=fanout,
+            parent_bucket=parent_bucket,
+        )
+
+    bucket[:] = [element_id for sub_bucket in sub_buckets for element_id in sub_bucket]
+    for slot, element_id in enumerate(bucket):
+        yield Step(
+            step_type="gather",
+            phase="sort",
+            element_ids=[element_id],
+            bucket_index=(original_values[element_id] - low) // size,
+            output_index=slot,
+            code_line=STEP_TO_CODE_LINE["gather"],
+            depth=depth + 1,
+            parent_bucket=parent_bucket,
+        )
+
+
 def _insertion_sort_bucket(
     bucket: list[int],
     bucket_idx: int,
-    original_values: list[int],
-    steps: list[Step],
-) -> None:
-    """Sort a bucket in-place using insertion sort, recording steps."""
+    original_values: Sequence[int],
+    depth: int = 0,
+    parent_bucket: int = -1,
+) -> Iterator[Step]:
+    """Sort a bucket in-place using insertion sort, yielding steps."""
     for i in range(1, len(bucket)):
         j = i
         while j > 0:
@@ -146,46 +330,78 @@ def _insertion_sort_bucket(
             val_j_minus_1 = original_values[eid_j_minus_1]
 
             # Record comparison
-            steps.append(Step(
+            yield Step(
                 step_type="compare",
                 phase="sort",
                 element_ids=[eid_j_minus_1, eid_j],
                 bucket_index=bucket_idx,
                 code_line=STEP_TO_CODE_LINE["compare"],
-                description=(
-                    f"Compare elements {eid_j_minus_1} (val={val_j_minus_1}) "
-                    f"and {eid_j} (val={val_j}) in bucket {bucket_idx}"
-                ),
-            ))
+                depth=depth,
+                parent_bucket=parent_bucket,
+            )
 
             if val_j_minus_1 > val_j:
                 # Swap needed
                 bucket[j], bucket[j - 1] = bucket[j - 1], bucket[j]
-                steps.append(Step(
+                yield Step(
                     step_type="swap",
                     phase="sort",
                     element_ids=[eid_j_minus_1, eid_j],
                     bucket_index=bucket_idx,
                     slot_index=j - 1,
                     code_line=STEP_TO_CODE_LINE["swap"],
-                    description=(
-                        f"Swap elements {eid_j_minus_1} (val={val_j_minus_1}) "
-                        f"and {eid_j} (val={val_j}) in bucket {bucket_idx}"
-                    ),
-                ))
+                    depth=depth,
+                    parent_bucket=parent_bucket,
+                )
                 j -= 1
             else:
                 # No swap needed — element is in correct position
-                steps.append(Step(
+                yield Step(
                     step_type="no_swap",
                     phase="sort",
                     element_ids=[eid_j_minus_1, eid_j],
                     bucket_index=bucket_idx,
                     slot_index=j,
                     code_line=STEP_TO_CODE_LINE["no_swap"],
-                    description=(
-                        f"No swap needed: {eid_j_minus_1} (val={val_j_minus_1}) "
-                        f"<= {eid_j} (val={val_j}) in bucket {bucket_idx}"
-                    ),
-                ))
+                    depth=depth,
+                    parent_bucket=parent_bucket,
+                )
                 break
+
+
+def _counting_sort_bucket(
+    bucket: list[int],
+    bucket_idx: int,
+    low: int,
+    high: int,
+    original_values: Sequence[int],
+    depth: int = 0,
+    parent_bucket: int = -1,
+) -> Iterator[Step]:
+    """Sort a bucket in-place with a stable counting pass, yielding one place step per slot."""
+    counts = [0] * (high - low + 1)
+    for element_id in bucket:
+        counts[original_values[element_id] - low] += 1
+    next_slot = []
+    total = 0
+    for count in counts:
+        next_slot.append(total)
+        total += count
+    placed = [0] * len(bucket)
+    for element_id in bucket:
+        key = original_values[element_id] - low
+        placed[next_slot[key]] = element_id
+        next_slot[key] += 1
+    bucket[:] = placed
+
+    for slot, element_id in enumerate(bucket):
+        yield Step(
+            step_type="place",
+            phase="sort",
+            element_ids=[element_id],
+            bucket_index=bucket_idx,
+            slot_index=slot,
+            code_line=STEP_TO_CODE_LINE["place"],
+            depth=depth,
+            parent_bucket=parent_bucket,
+        )
@@ -0,0 +1,242 @@
+"""External-memory bucket sort for integer files larger than RAM.
+
+The same scatter / sort / gather shape as the step engine, but over files
+and without step recording:
+
+- Scatter: values are streamed from the input in chunks and appended to
+  per-bucket buffers, which are flushed to one spill file per bucket of the
+  preset's `generate_bucket_ranges()`.
+- Sort: each spill file is sorted on its own. One that fits in the memory
+  budget is loaded and sorted in memory; a larger one is re-bucketed over
+  its own (low, high) range into `preset.num_buckets` sub-spill files, as
+  `split_load` does in the step engine. A single-value range is already
+  sorted and is copied through.
+- Gather: the sorted buckets are appended to the output in bucket order.
+
+Input and output are either raw little-endian int32 ("binary") or text with
+one integer per line. Memory use stays within roughly `memory_limit` bytes
+regardless of file size. Spill files live in a temporary directory that is
+removed afterwards.
+"""
+
+import bisect
+import sys
+import tempfile
+import time
+from array import array
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+from bucket_sort_viz.presets import SortPreset
+
+FileFormat = Literal["binary", "text"]
+
+TYPECODE = "i"                      # int32, little-endian on disk
+ITEM_SIZE = array(TYPECODE).itemsize
+SORT_BYTES_PER_VALUE = 64           # Sorting in Python: int object, list slots, array copies
+DEFAULT_MEMORY_LIMIT = 64 << 20
+TEXT_SUFFIXES = (".txt", ".csv")
+
+
+@dataclass
+class ExternalSortReport:
+    values: int = 0
+    bytes_in: int = 0
+    bytes_out: int = 0
+    spill_bytes: int = 0              # Total written to spill files, all levels
+    max_depth: int = 0                # Deepest re-bucketing level (0 = none)
+    seconds: float = 0.0
+
+    @property
+    def mb_per_second(self) -> float:
+        return self.bytes_in / 1e6 / self.seconds if self.seconds else 0.0
+
+
+def detect_format(path: Path) -> FileFormat:
+    """Text for ".txt"/".csv" files, raw int32 otherwise."""
+    return "text" if path.suffix.lower() in TEXT_SUFFIXES else "binary"
+
+
+# ──────────────────────────────────────────────
+# Chunked value I/O
+# ──────────────────────────────────────────────
+def _to_disk(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array(TYPECODE, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _iter_binary(f: BinaryIO, chunk_values: int) -> Iterator[array]:
+    while data := f.read(chunk_values * ITEM_SIZE):
+        if len(data) % ITEM_SIZE:
+            raise ValueError("Truncated int32 input: size is not a multiple of 4 bytes")
+        chunk = array(TYPECODE)
+        chunk.frombytes(data)
+        if sys.byteorder == "big":
+            chunk.byteswap()
+        yield chunk
+
+
+def _iter_text(f: BinaryIO, chunk_values: int) -> Iterator[array]:
+    # ~8 bytes per line is a fair guess for the readlines() size hint.
+    while lines := f.readlines(chunk_values * 8):
+        yield array(TYPECODE, [int(line) for line in lines if not line.isspace()])
+
+
+def read_chunks(f: BinaryIO, file_format: FileFormat, chunk_values: int) -> Iterator[array]:
+    """Stream an integer file as arrays of at most about `chunk_values` values."""
+    if file_format == "binary":
+        return _iter_binary(f, chunk_values)
+    return _iter_text(f, chunk_values)
+
+
+def write_values(f: BinaryIO, values: array, file_format: FileFormat) -> int:
+    """Append values in the given format. Returns the bytes written."""
+    if file_format == "binary":
+        data = _to_disk(values)
+    else:
+        data = "".join(f"{value}\n" for value in values).encode()
+    f.write(data)
+    return len(data)
+
+
+# ──────────────────────────────────────────────
+# Scatter / sort / gather over files
+# ──────────────────────────────────────────────
+class _ExternalSorter:
+    def __init__(self, preset: SortPreset, memory_limit: int, spill_dir: Path):
+        self.fanout = max(2, preset.num_buckets)
+        self.spill_dir = spill_dir
+        self.fit_values = max(1, memory_limit // SORT_BYTES_PER_VALUE)
+        # Half the budget reads input, the other half buffers the spill files.
+        self.chunk_values = max(1024, memory_limit // 2 // SORT_BYTES_PER_VALUE)
+        self.buffer_values = max(256, memory_limit // 2 // ITEM_SIZE // (self.fanout + 1))
+        self.report = ExternalSortReport()
+        self._next_spill = 0
+
+    def scatter(
+        self,
+        chunks: Iterator[array],
+        ranges: list[tuple[int, int]],
+        depth: int,
+    ) -> list[tuple[Path, int]]:
+        """Spill the values of `chunks` into one file per range. Returns (path, count)s."""
+        low, high = ranges[0][0], ranges[-1][1]
+        starts = [range_low for range_low, _ in ranges[1:]]
+        paths = []
+        for _ in ranges:
+            paths.append(self.spill_dir / f"spill-{self._next_spill}.bin")
+            self._next_spill += 1
+        files = [path.open("wb") for path in paths]
+        buffers = [array(TYPECODE) for _ in ranges]
+        counts = [0] * len(ranges)
+        try:
+            for chunk in chunks:
+                if not chunk:
+                    continue
+                # Sorting the chunk (in C) and cutting it at the range starts is
+                # much faster than routing values one by one in Python.
+                ordered = sorted(chunk)
+                for value in (ordered[0], ordered[-1]):
+                    if not low <= value <= high:
+                        raise ValueError(
+                            f"Value {value} does not fit in any bucket range: {low}..{high}"
+                        )
+                cuts = [0, *(bisect.bisect_left(ordered, start) for start in starts), len(ordered)]
+                for index, buffer in enumerate(buffers):
+                    buffer.extend(ordered[cuts[index]:cuts[index + 1]])
+                    if len(buffer) >= self.buffer_values:
+                        self._flush(files[index], buffer)
+                        counts[index] += len(buffer)
+                        del buffer[:]
+            for index, buffer in enumerate(buffers):
+                self._flush(files[index], buffer)
+                counts[index] += len(buffer)
+        finally:
+            for f in files:
+                f.close()
+        self.report.max_depth = max(self.report.max_depth, depth)
+        return list(zip(paths, counts))
+
+    def _flush(self, f: BinaryIO, buffer: array) -> None:
+        if buffer:
+            self.report.spill_bytes += write_values(f, buffer, "binary")
+
+    def sort_into(
+        self,
+        spill: Path,
+        count: int,
+        bucket_range: tuple[int, int],
+        out: BinaryIO,
+        out_format: FileFormat,
+        depth: int,
+    ) -> None:
+        """Append the sorted contents of one spill file to `out`, then delete it."""
+        low, high = bucket_range
+        sub_ranges = _split_range(low, high, self.fanout)
+        sub_buckets = []
+        with spill.open("rb") as f:
+            if count <= self.fit_values or low == high:
+                # Fits in memory — or a single value, which is already sorted.
+                for chunk in read_chunks(f, "binary", self.fit_values):
+                    if low != high:
+                        chunk = array(TYPECODE, sorted(chunk))
+                    self.report.bytes_out += write_values(out, chunk, out_format)
+            else:
+                chunks = read_chunks(f, "binary", self.chunk_values)
+                sub_buckets = self.scatter(chunks, sub_ranges, depth + 1)
+        spill.unlink()
+        for (sub_spill, sub_count), sub_range in zip(sub_buckets, sub_ranges):
+            self.sort_into(sub_spill, sub_count, sub_range, out, out_format, depth + 1)
+
+
+def _split_range(low: int, high: int, fanout: int) -> list[tuple[int, int]]:
+    """At most `fanout` equal sub-ranges covering low..high (the last may be narrower)."""
+    size = -(-(high - low + 1) // fanout)
+    return [(start, min(start + size - 1, high)) for start in range(low, high + 1, size)]
+
+
+def external_sort(
+    input_path: Path,
+    output_path: Path,
+    preset: SortPreset,
+    *,
+    input_format: FileFormat | None = None,
+    output_format: FileFormat | None = None,
+    memory_limit: int = DEFAULT_MEMORY_LIMIT,
+    spill_dir: Path | None = None,
+) -> ExternalSortReport:
+    """Bucket-sort an integer file into `output_path` with bounded memory.
+
+    Args:
+        input_path: Values to sort, binary int32 or one integer per line.
+        output_path: Destination for the sorted values.
+        preset: Supplies the value range and top-level bucket boundaries.
+        input_format, output_format: Default to `detect_format()` of each path.
+        memory_limit: Approximate memory budget in bytes.
+        spill_dir: Where to create the temporary spill directory.
+
+    Raises:
+        ValueError: If a value is outside the preset's bucket ranges, or the
+            binary input is truncated.
+    """
+    input_format = input_format or detect_format(input_path)
+    output_format = output_format or detect_format(output_path)
+    start = time.perf_counter()
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=spill_dir, prefix="bucket-sort-") as tmp:
+        sorter = _ExternalSorter(preset, memory_limit, Path(tmp))
+        ranges = preset.generate_bucket_ranges()
+        with input_path.open("rb") as f:
+            buckets = sorter.scatter(read_chunks(f, input_format, sorter.chunk_values), ranges, 0)
+        with output_path.open("wb") as out:
+            for (spill, count), bucket_range in zip(buckets, ranges):
+                sorter.sort_into(spill, count, bucket_range, out, output_format, 0)
+    report = sorter.report
+    report.values = sum(count for _, count in buckets)
+    report.bytes_in = input_path.stat().st_size
+    report.seconds = time.perf_counter() - start
+    return report
@@ -0,0 +1,196 @@
+"""Loaders for user-supplied value sets: raw int32, .npy, and text/CSV columns.
+
+`bucket_sort()` draws its own values; these loaders feed the engines real
+datasets instead. Binary input is never copied:
+
+- Raw files (".bin", or any suffix without a text/.npy meaning) are
+  little-endian int32, the format `external.py` reads and writes. They are
+  mapped with `numpy.memmap`, read-only.
+- ".npy" files are opened with `np.load(mmap_mode="r")`. They must hold a
+  1-D integer array.
+- ".txt"/".csv" files are parsed in chunks of about `chunk_values` lines,
+  one integer per line or one column of a delimited file, with an optional
+  header row. Only the parsed values are kept in memory, never the text.
+
+`load_values()` checks every value against a preset's `value_range`, or
+derives a fitting preset when none is given: the smallest built-in preset
+that covers the data, else a custom one spanning its minimum to maximum. The
+values come back as a NumPy array (a view of the mapped file for binary
+input). `parallel_sort()` takes it as is. The step engine takes any sequence
+of ints, though `.tolist()` is faster there.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
+"""
+
+import math
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO, Literal
+
+import numpy as np
+
+from bucket_sort_viz.presets import PRESETS, SortPreset, custom_preset
+
+InputFormat = Literal["binary", "npy", "text"]
+
+RAW_DTYPE = np.dtype("<i4")          # Same on-disk format as external.py's "binary"
+TEXT_SUFFIXES = (".txt", ".csv")
+CHUNK_VALUES = 1 << 16
+DERIVED_BUCKETS = 10
+
+
+def detect_input_format(path: Path) -> InputFormat:
+    """".npy" by suffix, text for ".txt"/".csv", raw int32 otherwise."""
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        return "npy"
+    return "text" if suffix in TEXT_SUFFIXES else "binary"
+
+
+# ──────────────────────────────────────────────
+# Format readers
+# ──────────────────────────────────────────────
+def load_raw(path: Path, dtype: np.dtype = RAW_DTYPE) -> np.ndarray:
+    """Map a headerless file of `dtype` values (default little-endian int32), read-only."""
+    size = path.stat().st_size
+    if size % dtype.itemsize:
+        raise ValueError(
+            f"Truncated {dtype} input: size {size} is not a multiple of {dtype.itemsize} bytes",
+        )
+    if size == 0:                    # mmap can't map an empty file
+        return np.empty(0, dtype)
+    return np.memmap(path, dtype=dtype, mode="r")
+
+
+def load_npy(path: Path) -> np.ndarray:
+    """Map a 1-D integer .npy array, read-only."""
+    values = np.load(path, mmap_mode="r", allow_pickle=False)
+    if values.ndim != 1 or values.dtype.kind not in "iu":
+        raise ValueError(f"Expected a 1-D integer array, got {values.ndim}-D {values.dtype}")
+    return values
+
+
+def _iter_lines(f: BinaryIO, chunk_values: int) -> Iterator[list[bytes]]:
+    # ~8 bytes per line is a fair guess for the readlines() size hint.
+    while lines := f.readlines(chunk_values * 8):
+        yield [line for line in lines if not line.isspace()]
+
+
+def _is_int(field: bytes) -> bool:
+    return field.strip().lstrip(b"+-").isdigit()
+
+
+def _parse(lines: list[bytes], sep: bytes, index: int) -> np.ndarray:
+    try:
+        if index == 0 and sep not in lines[0]:     # One value per line: no split needed
+            return np.array([int(line) for line in lines], dtype=np.int64)
+        return np.array([int(line.split(sep)[index]) for line in lines], dtype=np.int64)
+    except (ValueError, IndexError):
+        for line in lines:
+            fields = line.split(sep)
+            if not -len(fields) <= index < len(fields) or not _is_int(fields[index]):
+                raise ValueError(f"No integer in field {index} of line {line.strip()!r}") from None
+        raise
+
+
+def load_text(
+    path: Path,
+    column: int | str = 0,
+    delimiter: str = ",",
+    chunk_values: int = CHUNK_VALUES,
+) -> np.ndarray:
+    """Parse one integer column of a text/CSV file, chunk by chunk, into an int64 array.
+
+    `column` is a field index (negative counts from the end), or a name from
+    the header row. With an index, a first line whose field isn't an integer
+    is skipped as a header. Blank lines are ignored.
+
+    Raises:
+        ValueError: If a line has no such field, the field isn't an integer,
+            or a named column isn't in the header.
+    """
+    sep = delimiter.encode()
+    index = column if isinstance(column, int) else None
+    chunks = []
+    first = True
+    with open(path, "rb") as f:
+        for lines in _iter_lines(f, chunk_values):
+            if first and lines:                  # First line: header or data?
+                first = False
+                fields = lines[0].split(sep)
+                if index is None:
+                    names = [name.strip().decode() for name in fields]
+                    if column not in names:
+                        raise ValueError(f"Column {column!r} not in header {names}")
+                    index = names.index(column)
+                    lines = lines[1:]
+                elif -len(fields) <= index < len(fields) and not _is_int(fields[index]):
+                    lines = lines[1:]
+            if lines:
+                chunks.append(_parse(lines, sep, index))
+    return np.concatenate(chunks) if chunks else np.empty(0, np.int64)
+
+
+# ──────────────────────────────────────────────
+# Presets for loaded values
+# ──────────────────────────────────────────────
+def check_range(values: np.ndarray, preset: SortPreset) -> None:
+    """Raise ValueError naming the first value outside the preset's `value_range`."""
+    low, high = preset.value_range
+    if values.size and (values.min() < low or values.max() > high):
+        outside = values[(values < low) | (values > high)][0]
+        raise ValueError(
+            f"Value {outside} is outside the {preset.name} preset's range {low}\u2013{high}",
+        )
+
+
+def _span(preset: SortPreset) -> int:
+    return preset.value_range[1] - preset.value_range[0]
+
+
+def fit_preset(values: np.ndarray, num_buckets: int = DERIVED_BUCKETS) -> SortPreset:
+    """The smallest built-in preset covering `values`, else a custom preset spanning them."""
+    if not values.size:
+        return min(PRESETS.values(), key=_span)
+    low, high = int(values.min()), int(values.max())
+    covering = [p for p in PRESETS.values() if p.value_range[0] <= low and high <= p.value_range[1]]
+    if covering:
+        return min(covering, key=_span)
+    bucket_size = math.ceil((high - low + 1) / num_buckets)
+    high = low + num_buckets * bucket_size - 1      # Buckets must tile the range exactly
+    return custom_preset((low, high), num_buckets, bucket_size)
+
+
+def load_values(
+    path: Path,
+    preset: SortPreset | None = None,
+    *,
+    input_format: InputFormat | None = None,
+    column: int | str = 0,
+) -> tuple[np.ndarray, SortPreset]:
+    """Load a value set and the preset to sort it with.
+
+    Args:
+        path: Raw int32, .npy, or text/CSV file.
+        preset: Preset the values must fit; derived with `fit_preset()` if None.
+        input_format: Overrides the format detected from the suffix.
+        column: Text/CSV column index or header name.
+
+    Returns:
+        A tuple of (values, preset). Binary values are a read-only view of
+        the mapped file.
+
+    Raises:
+        ValueError: If the file is malformed or a value is outside the preset's range.
+    """
+    input_format = input_format or detect_input_format(path)
+    if input_format == "npy":
+        values = load_npy(path)
+    elif input_format == "text":
+        values = load_text(path, column)
+    else:
+        values = load_raw(path)
+    if preset is None:
+        return values, fit_preset(values)
+    check_range(values, preset)
+    return values, preset
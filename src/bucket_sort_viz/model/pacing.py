@@ -0,0 +1,226 @@
+"""Adaptive playback pacing that bounds the total animation length.
+
+At the per-step `TIMING` durations, playback grows with the trace: a few
+dozen elements already take minutes to watch or export. `plan_pacing()`
+fits a trace into a target duration without touching the steps themselves:
+
+- Natural time: each step gets its `TIMING` duration. Scatters and gathers
+  are staggered, so a run of k of them lasts (k - 1) * stagger + per_element.
+  Phase changes and the celebration are holds.
+- Compression: if the natural time exceeds the target, holds are shrunk
+  first, down to `PACING_HOLD_SHARE` of the target. The rest of the target is
+  the move budget, split between the scatter, sort and gather phases in
+  proportion to their natural time. Every phase with steps gets at least
+  `PACING_MIN_PHASE_SHARE` of it. Each phase is then scaled by its own
+  factor, and never slowed down.
+- Batching: consecutive steps whose compressed duration is under
+  `PACING_MIN_MOVE_FRAMES` are merged into one beat, a single animated move
+  from the state before its first step to the state after its last. A beat
+  ends early at a change of run (a new bucket's compare/swap walk, or a
+  scatter run turning into a counting pass) once it fills a frame. Beats
+  never span a phase boundary unless one would get no frame at all.
+- Frames: beat boundaries are the floor of the cumulative compressed time,
+  so every beat spans at least one frame. Steps that share a frame are
+  skipped over rather than drawn. The total is at most `target_seconds *
+  fps` frames.
+
+Works on a `StepLog` or a list of `Step`s.
+"""
+
+import math
+from bisect import bisect_right
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from bucket_sort_viz.config import (
+    FPS,
+    PACING_HOLD_SHARE,
+    PACING_MIN_MOVE_FRAMES,
+    PACING_MIN_PHASE_SHARE,
+    PACING_TARGET_SECONDS,
+    TIMING,
+)
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.model.step_log import PHASES, STEP_TYPES, StepLog
+
+# Step type -> (TIMING key of a lone/last step, TIMING key of the stagger in a run).
+STAGGERED = {
+    "scatter": ("scatter_per_element", "scatter_stagger"),
+    "gather": ("gather_per_element", "gather_stagger"),
+}
+FIXED = {
+    "compare": "sort_compare_hold",
+    "no_swap": "sort_compare_hold",
+    "swap": "sort_swap",
+    "place": "sort_swap",
+    "phase_change": "phase_transition_pause",
+    "celebration": "celebration_hold",
+}
+HOLDS = ("phase_change", "celebration")
+WALKS = ("compare", "swap", "no_swap")
+
+
+@dataclass
+class Beat:
+    """One animated move covering steps [start, stop)."""
+
+    start: int
+    stop: int
+    frame: int                        # First frame of the move
+    frames: int                       # Frames it lasts (at least 1)
+
+    @property
+    def steps(self) -> range:
+        return range(self.start, self.stop)
+
+
+@dataclass
+class PacingPlan:
+    beats: list[Beat]
+    fps: int
+    target_seconds: float
+    natural_seconds: float            # Playback time at the unscaled `TIMING` durations
+    hold_scale: float = 1.0
+    phase_scales: dict[str, float] = field(default_factory=dict)
+
+    @property
+    def total_frames(self) -> int:
+        return self.beats[-1].frame + self.beats[-1].frames if self.beats else 0
+
+    @property
+    def seconds(self) -> float:
+        return self.total_frames / self.fps
+
+    @property
+    def skipped_steps(self) -> int:
+        """Steps folded into another step's beat instead of animating on their own."""
+        return sum(beat.stop - beat.start - 1 for beat in self.beats)
+
+    def beat_at(self, frame: int) -> Beat | None:
+        """The beat animating on `frame` (None past the end)."""
+        i = bisect_right(self.beats, frame, key=lambda beat: beat.frame) - 1
+        if i < 0 or frame >= self.total_frames:
+            return None
+        return self.beats[i]
+
+
+def _columns(steps: StepLog | Sequence[Step]) -> tuple[list[str], list[str], list[int], list[int]]:
+    """(step_type, phase, bucket_index, depth) columns, by name."""
+    if isinstance(steps, StepLog):
+        return (
+            [STEP_TYPES[code] for code in steps.step_type],
+            [PHASES[code] for code in steps.phase],
+            steps.bucket_index.tolist(),
+            steps.depth.tolist(),
+        )
+    return (
+        [step.step_type for step in steps],
+        [step.phase for step in steps],
+        [step.bucket_index for step in steps],
+        [step.depth for step in steps],
+    )
+
+
+def natural_seconds(types: Sequence[str], phases: Sequence[str]) -> list[float]:
+    """Each step's playback time at the `TIMING` durations, staggering scatter/gather runs."""
+    seconds = []
+    last = len(types) - 1
+    for i, step_type in enumerate(types):
+        if step_type in STAGGERED:
+            lone, stagger = STAGGERED[step_type]
+            in_run = i < last and types[i + 1] == step_type and phases[i + 1] == phases[i]
+            seconds.append(TIMING[stagger if in_run else lone])
+        else:
+            seconds.append(TIMING[FIXED[step_type]])
+    return seconds
+
+
+def _phase_scales(totals: dict[str, float], budget: float) -> dict[str, float]:
+    """Per-phase compression so the phases' natural `totals` fit in `budget` seconds."""
+    natural = sum(totals.values())
+    if natural <= budget:
+        return {phase: 1.0 for phase in totals}
+    shares = {phase: max(PACING_MIN_PHASE_SHARE, total / natural)
+              for phase, total in totals.items()}
+    norm = sum(shares.values())
+    return {
+        phase: min(1.0, budget * shares[phase] / norm / total) if total else 1.0
+        for phase, total in totals.items()
+    }
+
+
+def plan_pacing(
+    steps: StepLog | Sequence[Step],
+    target_seconds: float = PACING_TARGET_SECONDS,
+    fps: int = FPS,
+    *,
+    min_move_frames: float = PACING_MIN_MOVE_FRAMES,
+) -> PacingPlan:
+    """Schedule `steps` as beats lasting at most `target_seconds` in total.
+
+    Raises:
+        ValueError: If the target is shorter than one frame.
+    """
+    target_frames = math.floor(target_seconds * fps + 1e-9)
+    if target_frames < 1:
+        raise ValueError(f"Target of {target_seconds} s is shorter than one frame at {fps} FPS")
+    types, phases, buckets, depths = _columns(steps)
+    natural = natural_seconds(types, phases)
+    total = sum(natural)
+    plan = PacingPlan([], fps, target_seconds, total)
+    if not types:
+        return plan
+
+    is_hold = [step_type in HOLDS for step_type in types]
+    hold_total = sum(t for t, hold in zip(natural, is_hold) if hold)
+    move_totals: dict[str, float] = {}
+    for t, hold, phase in zip(natural, is_hold, phases):
+        if not hold:
+            move_totals[phase] = move_totals.get(phase, 0.0) + t
+    budget = target_frames / fps
+    if total > budget and hold_total:
+        # Holds keep whatever the moves leave, but never less than their share.
+        move_total = total - hold_total
+        hold_budget = min(hold_total, max(PACING_HOLD_SHARE * budget, budget - move_total))
+        plan.hold_scale = hold_budget / hold_total
+    plan.phase_scales = _phase_scales(move_totals, budget - hold_total * plan.hold_scale)
+
+    # Compressed durations, in frames.
+    frames = [
+        t * fps * (plan.hold_scale if hold else plan.phase_scales[phase])
+        for t, hold, phase in zip(natural, is_hold, phases)
+    ]
+    runs = [
+        (phase, "walk" if step_type in WALKS else step_type, depth,
+         bucket if step_type in WALKS or step_type == "place" else -1)
+        for step_type, phase, bucket, depth in zip(types, phases, buckets, depths)
+    ]
+
+    # Group steps into beats, then cut beats at floored cumulative frame times.
+    n = len(types)
+    elapsed = 0.0
+    pending = None                   # First step of a leading run too short for a frame
+    i = 0
+    while i < n:
+        start = i
+        length = frames[i]
+        i += 1
+        if not is_hold[start]:
+            while i < n and not is_hold[i] and phases[i] == phases[start]:
+                if length >= min_move_frames or (runs[i] != runs[i - 1] and length >= 1):
+                    break
+                length += frames[i]
+                i += 1
+        first = math.floor(elapsed + 1e-9)
+        elapsed = min(elapsed + length, target_frames)
+        count = math.floor(elapsed + 1e-9) - first
+        if count:
+            plan.beats.append(Beat(start if pending is None else pending, i, first, count))
+            pending = None
+        elif plan.beats:             # Too short for a frame of its own: folded into the last
+            plan.beats[-1].stop = i
+        elif pending is None:
+            pending = start
+    if pending is not None:          # The whole trace fits in under a frame
+        plan.beats.append(Beat(pending, n, 0, 1))
+    return plan
@@ -0,0 +1,213 @@
+"""Multi-core bucket sort over shared memory, for non-visual runs.
+
+Every phase is split across worker processes, and values never pass through
+pickling. Workers attach to `multiprocessing.shared_memory` blocks by name
+and get only block names, lengths and offsets:
+
+- Scatter: the input is copied once into a shared block and cut into one
+  chunk per worker. Each worker sorts its chunk in place with `np.sort` and
+  cuts it at the partition edges with `searchsorted`, the way `external.py`
+  cuts its chunks. The prefix sums of the per-chunk counts give every
+  (chunk, partition) pair its own offset in the output block, and each
+  worker copies its runs there without coordinating with the others.
+  Sorting is the grouping step on purpose: NumPy's vectorized sort beats a
+  `bincount` count plus an argsort/gather by id, which was about 2.5x
+  slower on 20M values.
+- Sort: each partition now holds exactly its own values, as one sorted run
+  per chunk, so values are sorted twice. With several chunks, workers sort
+  the partitions in place again, largest first, which merges their runs.
+  With a single chunk every partition is already one sorted run, and this
+  phase does nothing.
+- Gather: there is nothing left to do. The output block holds the sorted
+  values, returned as a zero-copy NumPy view.
+
+The partitions are the preset's buckets. When there are more workers than
+buckets, each bucket is also cut into equal sub-ranges (one level of the
+re-bucketing `split_load` does in the step engine). With one worker,
+everything runs in this process.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
+"""
+
+import os
+import time
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+from bucket_sort_viz.presets import SortPreset
+
+DTYPE = np.dtype(np.int32)
+PARTITIONS_PER_WORKER = 4
+
+
+@dataclass
+class SharedSortResult:
+    """Sorted values living in shared memory; `close()` (or `with`) releases them.
+
+    Attributes:
+        values: Zero-copy view of the sorted values in the shared block.
+        offsets: Start of every partition in `values`, plus the total length.
+        workers: Worker processes used (1 = sorted in this process).
+        scatter_seconds, sort_seconds: Wall time of the two phases.
+    """
+
+    values: np.ndarray
+    offsets: np.ndarray
+    workers: int
+    scatter_seconds: float
+    sort_seconds: float
+    _shm: SharedMemory = field(repr=False)
+
+    @property
+    def seconds(self) -> float:
+        return self.scatter_seconds + self.sort_seconds
+
+    def close(self) -> None:
+        """Drop the view and free the shared block (other views of it must be gone)."""
+        self.values = self.values[:0].copy()
+        self._shm.close()
+        self._shm.unlink()
+
+    def __enter__(self) -> "SharedSortResult":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _partition_step(preset: SortPreset, partitions: int) -> int:
+    """Width of each partition: the bucket size cut into at most ~`partitions` equal parts.
+
+    The number of cuts is the largest divisor of the bucket size that fits, so
+    every partition has the same width.
+    """
+    wanted = max(1, -(-partitions // preset.num_buckets))
+    per_bucket = max(d for d in range(1, min(wanted, preset.bucket_size) + 1)
+                     if preset.bucket_size % d == 0)
+    return preset.bucket_size // per_bucket
+
+
+def _partition_edges(preset: SortPreset, step: int) -> np.ndarray:
+    """Lower bound of every partition, plus one past the top."""
+    low = preset.value_range[0]
+    return np.arange(low, low + preset.num_buckets * preset.bucket_size + 1, step)
+
+
+# ──────────────────────────────────────────────
+# Worker tasks (module-level so they pickle by name)
+# ──────────────────────────────────────────────
+def _attach(name: str, length: int) -> tuple[SharedMemory, np.ndarray]:
+    shm = SharedMemory(name=name, track=False)
+    return shm, np.ndarray((length,), dtype=DTYPE, buffer=shm.buf)
+
+
+def _count_chunk(src: str, length: int, lo: int, hi: int, edges: np.ndarray) -> np.ndarray:
+    """Sort one input chunk in place; return how many of its values fall in each partition."""
+    shm, values = _attach(src, length)
+    try:
+        chunk = values[lo:hi]
+        chunk.sort()
+        return np.diff(np.searchsorted(chunk, edges))
+    finally:
+        del values, chunk
+        shm.close()
+
+
+def _scatter_chunk(
+    src: str, dst: str, length: int, lo: int, hi: int, starts: np.ndarray, counts: np.ndarray,
+) -> None:
+    """Copy a counted chunk's per-partition runs to their offsets in the output block."""
+    src_shm, values = _attach(src, length)
+    dst_shm, out = _attach(dst, length)
+    try:
+        begin = lo
+        for start, count in zip(starts.tolist(), counts.tolist()):
+            out[start:start + count] = values[begin:begin + count]
+            begin += count
+    finally:
+        del values, out
+        src_shm.close()
+        dst_shm.close()
+
+
+def _sort_slice(dst: str, length: int, lo: int, hi: int) -> None:
+    shm, values = _attach(dst, length)
+    try:
+        values[lo:hi].sort()
+    finally:
+        del values
+        shm.close()
+
+
+def _run(pool: Executor | None, task: Callable, calls: list[tuple]) -> list:
+    if pool is None:
+        return [task(*args) for args in calls]
+    return list(pool.map(task, *zip(*calls))) if calls else []
+
+
+def parallel_sort(
+    preset: SortPreset,
+    values: Sequence[int] | np.ndarray,
+    workers: int | None = None,
+    *,
+    partitions_per_worker: int = PARTITIONS_PER_WORKER,
+) -> SharedSortResult:
+    """Bucket-sort `values` across `workers` processes (default: CPU count).
+
+    Raises:
+        ValueError: If a value falls outside the preset's bucket ranges.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    start = time.perf_counter()
+    source = np.asarray(values)
+    n = source.size
+    step = _partition_step(preset, workers * partitions_per_worker if workers > 1 else 1)
+    edges = _partition_edges(preset, step)
+    if n and (source.min() < edges[0] or source.max() >= edges[-1]):
+        outside = source[(source < edges[0]) | (source >= edges[-1])][0]
+        raise ValueError(f"Value {outside} does not fit in any bucket range")
+
+    size = max(1, n * DTYPE.itemsize)
+    src, dst = SharedMemory(create=True, size=size), SharedMemory(create=True, size=size)
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        np.ndarray((n,), dtype=DTYPE, buffer=src.buf)[:] = source
+        bounds = np.linspace(0, n, workers + 1).astype(np.int64)
+        chunks = [(int(lo), int(hi)) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        counts = np.array(
+            _run(pool, _count_chunk, [(src.name, n, lo, hi, edges) for lo, hi in chunks]),
+        ).reshape(len(chunks), len(edges) - 1)
+        # Partition-major prefix sum: chunk c's run of partition p starts after
+        # all of partitions < p and after the runs of p from chunks < c.
+        flat = counts.T.ravel()
+        starts = (np.cumsum(flat) - flat).reshape(counts.T.shape).T
+        _run(pool, _scatter_chunk, [
+            (src.name, dst.name, n, lo, hi, starts[c], counts[c])
+            for c, (lo, hi) in enumerate(chunks)
+        ])
+        scatter_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sizes = counts.sum(axis=0)
+        offsets = np.concatenate([[0], np.cumsum(sizes)])
+        # With a single chunk every partition is already one sorted run.
+        order = np.argsort(-sizes, kind="stable") if len(chunks) > 1 else []  # largest first
+        _run(pool, _sort_slice, [
+            (dst.name, n, int(offsets[p]), int(offsets[p + 1])) for p in order if sizes[p] > 1
+        ])
+        sort_seconds = time.perf_counter() - start
+    except BaseException:
+        dst.close()
+        dst.unlink()
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        src.close()
+        src.unlink()
+    shared = np.ndarray((n,), dtype=DTYPE, buffer=dst.buf)
+    return SharedSortResult(shared, offsets, workers, scatter_seconds, sort_seconds, dst)
@@ -0,0 +1,66 @@
+"""Summary statistics over a recorded step trace (no Pygame)."""
+
+from collections import Counter
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from bucket_sort_viz.model.step import Step
+
+
+@dataclass
+class TraceStats:
+    """Aggregate counts for one recorded run."""
+
+    element_count: int = 0
+    step_count: int = 0
+    step_counts: Counter = field(default_factory=Counter)
+    bucket_loads: list[int] = field(default_factory=list)
+    max_depth: int = 0
+    sub_bucket_loads: list[int] = field(default_factory=list)   # Non-empty, split by split
+
+    @property
+    def comparisons(self) -> int:
+        return self.step_counts["compare"]
+
+    @property
+    def swaps(self) -> int:
+        return self.step_counts["swap"]
+
+    @property
+    def placements(self) -> int:
+        return self.step_counts["place"]
+
+    @property
+    def max_bucket_load(self) -> int:
+        return max(self.bucket_loads, default=0)
+
+    @property
+    def max_sub_bucket_load(self) -> int:
+        return max(self.sub_bucket_loads, default=0)
+
+
+def compute_stats(steps: Iterable[Step], num_buckets: int) -> TraceStats:
+    """Tally step types and per-bucket scatter loads in a single pass.
+
+    Each re-bucketing split's scatters are contiguous, so their loads are
+    collected run by run.
+    """
+    stats = TraceStats(bucket_loads=[0] * num_buckets)
+    split_loads: list[int] = []
+    previous = None
+    for step in steps:
+        stats.step_count += 1
+        stats.step_counts[step.step_type] += 1
+        if step.step_type == "scatter" and step.depth == 0:
+            stats.bucket_loads[step.bucket_index] += 1
+        elif step.step_type == "scatter":
+            stats.max_depth = max(stats.max_depth, step.depth)
+            if not (previous and previous.step_type == "scatter" and previous.depth == step.depth):
+                stats.sub_bucket_loads.extend(load for load in split_loads if load)
+                split_loads = []
+            split_loads.extend([0] * (step.bucket_index + 1 - len(split_loads)))
+            split_loads[step.bucket_index] += 1
+        previous = step
+    stats.sub_bucket_loads.extend(load for load in split_loads if load)
+    stats.element_count = sum(stats.bucket_loads)
+    return stats
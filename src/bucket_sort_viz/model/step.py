@@ -6,6 +6,14 @@ current layout state. This preserves clean MVC separation.
 
 Element IDs are the index in the original unsorted list (stable, unique).
 This avoids ambiguity when duplicate values exist (e.g., two 42s).
+
+Steps of a recursive re-bucketing pass have `depth` > 0: an overloaded
+bucket is scattered into sub-buckets, which are sorted and gathered back
+into it, all inside the sort phase. At depth > 0, `bucket_index` is the
+sub-bucket's index within its parent bucket — the enclosing bucket at
+depth - 1 — and a gather's `output_index` is the slot it lands in within
+that parent. `parent_bucket` names the top-level bucket the pass runs
+inside, so a nested step can be placed without replaying the trace.
 """
 
 from dataclasses import dataclass
@@ -19,6 +27,7 @@ StepType = Literal[
     "gather",        # Element moves from bucket to output row
     "phase_change",  # Transition marker between phases
     "celebration",   # Final sorted state trigger
+    "place",         # Element placed at its counted slot (counting-sort pass)
 ]
 
 PhaseName = Literal["ready", "scatter", "sort", "gather", "done"]
@@ -34,3 +43,5 @@ class Step:
     output_index: int = -1            # Position in final output row (-1 if N/A)
     code_line: int = -1               # Pseudocode line to highlight
     description: str = ""             # Human-readable debug note
+    depth: int = 0                    # Re-bucketing depth (0 = top-level buckets)
+    parent_bucket: int = -1           # Top-level bucket of a depth > 0 step (-1 at depth 0)
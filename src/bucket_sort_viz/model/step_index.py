@@ -0,0 +1,158 @@
+"""Inverted indexes over a recorded trace, for per-element and per-bucket queries.
+
+Filtering a trace for "everything element 7 did" or "steps touching bucket
+3" scans every step. A `StepIndex` instead maps each key to the sorted
+positions of the steps that have it, in four indexes:
+
+- "element": element ID → steps listing it in `element_ids`.
+- "bucket": top-level bucket → steps in it. Re-bucketing steps (depth > 0)
+  record a sub-bucket index, so they count toward their `parent_bucket`.
+- "step_type" and "phase": name → steps of that type or phase.
+
+Each index is built on its first query, in one pass over the trace. If the
+trace has grown since, the pass resumes from where it stopped. Positions
+are ascending `array("q")` columns, so a query bisects to its [start, stop)
+window and slices it: O(log n + k) for k matches, or O(log n) for a count.
+
+Works on a `StepLog` (reading its columns directly) or on a list of `Step`s.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Hashable, Iterator, Sequence
+from typing import Literal
+
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.model.step_log import PHASES, STEP_TYPES, StepLog
+
+IndexName = Literal["element", "bucket", "step_type", "phase"]
+INDEXES: tuple[IndexName, ...] = ("element", "bucket", "step_type", "phase")
+
+
+class StepIndex:
+    """Lazily built inverted indexes from element, bucket, step type and phase to positions.
+
+    Args:
+        steps: The trace to index. It may be appended to between queries.
+    """
+
+    def __init__(self, steps: StepLog | Sequence[Step]):
+        self.steps = steps
+        self._postings: dict[IndexName, dict[Hashable, array]] = {}
+        self._indexed: dict[IndexName, int] = {}        # Steps covered so far, per index
+
+    def positions(
+        self, index: IndexName, key: Hashable, start: int = 0, stop: int | None = None,
+    ) -> array:
+        """Ascending positions of the steps with `key` in `index`, within [start, stop)."""
+        postings = self._postings_for(index).get(key)
+        if postings is None:
+            return array("q")
+        lo, hi = _window(postings, start, stop)
+        return postings[lo:hi]
+
+    def count(
+        self, index: IndexName, key: Hashable, start: int = 0, stop: int | None = None,
+    ) -> int:
+        """Number of steps with `key` in `index` within [start, stop)."""
+        postings = self._postings_for(index).get(key)
+        if postings is None:
+            return 0
+        lo, hi = _window(postings, start, stop)
+        return hi - lo
+
+    def counts(
+        self, index: IndexName, start: int = 0, stop: int | None = None,
+    ) -> dict[Hashable, int]:
+        """Step count of every key in `index` within [start, stop) (e.g. a bucket heatmap)."""
+        return {
+            key: hi - lo
+            for key, postings in self._postings_for(index).items()
+            for lo, hi in [_window(postings, start, stop)]
+            if hi > lo
+        }
+
+    def keys(self, index: IndexName) -> list[Hashable]:
+        return list(self._postings_for(index))
+
+    def select(
+        self, index: IndexName, key: Hashable, start: int = 0, stop: int | None = None,
+    ) -> list[Step]:
+        """The steps with `key` in `index` within [start, stop), in trace order."""
+        return [self.steps[position] for position in self.positions(index, key, start, stop)]
+
+    def by_element(self, element_id: int, start: int = 0, stop: int | None = None) -> list[Step]:
+        return self.select("element", element_id, start, stop)
+
+    def by_bucket(self, bucket_index: int, start: int = 0, stop: int | None = None) -> list[Step]:
+        return self.select("bucket", bucket_index, start, stop)
+
+    def by_type(self, step_type: str, start: int = 0, stop: int | None = None) -> list[Step]:
+        return self.select("step_type", step_type, start, stop)
+
+    def by_phase(self, phase: str, start: int = 0, stop: int | None = None) -> list[Step]:
+        return self.select("phase", phase, start, stop)
+
+    # ──────────────────────────────────────────────
+    # Building
+    # ──────────────────────────────────────────────
+    def _postings_for(self, index: IndexName) -> dict[Hashable, array]:
+        if index not in INDEXES:
+            raise ValueError(f"Unknown index {index!r}; expected one of {INDEXES}")
+        postings = self._postings.setdefault(index, {})
+        done, total = self._indexed.get(index, 0), len(self.steps)
+        if done < total:
+            for position, key in self._entries(index, done, total):
+                column = postings.get(key)
+                if column is None:
+                    column = postings[key] = array("q")
+                if not column or column[-1] != position:   # An ID listed twice in one step
+                    column.append(position)
+            self._indexed[index] = total
+        return postings
+
+    def _entries(self, index: IndexName, start: int, stop: int) -> Iterator[tuple[int, Hashable]]:
+        """(position, key) pairs of steps start..stop-1 for one index, in order."""
+        steps = self.steps
+        if index in ("step_type", "phase"):
+            if isinstance(steps, StepLog):
+                names = STEP_TYPES if index == "step_type" else PHASES
+                for position, code in enumerate(getattr(steps, index)[start:stop], start):
+                    yield position, names[code]
+            else:
+                for position in range(start, stop):
+                    yield position, getattr(steps[position], index)
+        elif index == "element":
+            if isinstance(steps, StepLog):
+                ids, ends = steps.ids, steps.id_end
+                begin = ends[start - 1] if start else 0
+                for position in range(start, stop):
+                    end = ends[position]
+                    for element_id in ids[begin:end]:
+                        yield position, element_id
+                    begin = end
+            else:
+                for position in range(start, stop):
+                    for element_id in steps[position].element_ids:
+                        yield position, element_id
+        else:
+            if isinstance(steps, StepLog):
+                rows = zip(
+                    range(start, stop), steps.depth[start:stop],
+                    steps.bucket_index[start:stop], steps.parent_bucket[start:stop],
+                )
+            else:
+                rows = (
+                    (position, step.depth, step.bucket_index, step.parent_bucket)
+                    for position, step in zip(range(start, stop), steps[start:stop])
+                )
+            for position, depth, bucket_index, parent_bucket in rows:
+                bucket = bucket_index if depth == 0 else parent_bucket
+                if bucket >= 0:
+                    yield position, bucket
+
+
+def _window(postings: array, start: int, stop: int | None) -> tuple[int, int]:
+    lo = bisect_left(postings, start)
+    hi = len(postings) if stop is None else bisect_left(postings, stop, lo)
+    return lo, max(lo, hi)
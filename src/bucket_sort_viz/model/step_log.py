@@ -0,0 +1,141 @@
+"""Struct-of-arrays step storage.
+
+A `Step` dataclass costs a few hundred bytes once its list and string are
+counted; `StepLog` keeps the same fields in typed `array` columns (about
+30 bytes per step plus 4 per element ID), which is what the columnar trace
+format writes and what large traces are held in.
+
+Descriptions are not stored — they are debug text derived from the other
+fields and the input values.
+
+`StepLog.index` answers per-element, per-bucket, per-type and per-phase
+queries without scanning the log (see `step_index.py`).
+"""
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING, get_args
+
+from bucket_sort_viz.model.step import PhaseName, Step, StepType
+
+if TYPE_CHECKING:
+    from bucket_sort_viz.model.step_index import StepIndex
+
+STEP_TYPES: tuple[StepType, ...] = get_args(StepType)
+PHASES: tuple[PhaseName, ...] = get_args(PhaseName)
+STEP_TYPE_CODES = {name: code for code, name in enumerate(STEP_TYPES)}
+PHASE_CODES = {name: code for code, name in enumerate(PHASES)}
+
+# Column name → array typecode. `id_end` is the exclusive end offset of each
+# step's slice of `ids` (the start is the previous step's end).
+COLUMNS = {
+    "step_type": "b",
+    "phase": "b",
+    "bucket_index": "i",
+    "slot_index": "i",
+    "output_index": "i",
+    "code_line": "b",
+    "depth": "b",
+    "parent_bucket": "i",
+    "id_end": "q",
+    "ids": "i",
+}
+
+
+class StepLog:
+    """Append-only step sequence stored column by column."""
+
+    def __init__(self):
+        self.step_type = array(COLUMNS["step_type"])
+        self.phase = array(COLUMNS["phase"])
+        self.bucket_index = array(COLUMNS["bucket_index"])
+        self.slot_index = array(COLUMNS["slot_index"])
+        self.output_index = array(COLUMNS["output_index"])
+        self.code_line = array(COLUMNS["code_line"])
+        self.depth = array(COLUMNS["depth"])
+        self.parent_bucket = array(COLUMNS["parent_bucket"])
+        self.id_end = array(COLUMNS["id_end"])
+        self.ids = array(COLUMNS["ids"])
+        self._index: StepIndex | None = None
+
+    @classmethod
+    def from_steps(cls, steps: Iterable[Step]) -> "StepLog":
+        log = cls()
+        log.extend(steps)
+        return log
+
+    def append(self, step: Step) -> None:
+        self.step_type.append(STEP_TYPE_CODES[step.step_type])
+        self.phase.append(PHASE_CODES[step.phase])
+        self.bucket_index.append(step.bucket_index)
+        self.slot_index.append(step.slot_index)
+        self.output_index.append(step.output_index)
+        self.code_line.append(step.code_line)
+        self.depth.append(step.depth)
+        self.parent_bucket.append(step.parent_bucket)
+        self.ids.extend(step.element_ids)
+        self.id_end.append(len(self.ids))
+
+    def extend(self, steps: Iterable[Step]) -> None:
+        for step in steps:
+            self.append(step)
+
+    def extend_columns(self, **columns) -> None:
+        """Bulk-append steps given as whole columns, one keyword per `COLUMNS` name.
+
+        Each value is a contiguous buffer (e.g. a NumPy array) of that column's
+        typecode. `id_end` offsets are absolute, i.e. already include
+        `len(self.ids)`.
+        """
+        for name, column in self.columns().items():
+            column.frombytes(memoryview(columns[name]).cast("B"))
+
+    def element_ids(self, index: int) -> list[int]:
+        start = self.id_end[index - 1] if index > 0 else 0
+        return self.ids[start:self.id_end[index]].tolist()
+
+    @property
+    def index(self) -> "StepIndex":
+        """Inverted indexes over this log, each built on its first query."""
+        if self._index is None:
+            from bucket_sort_viz.model.step_index import StepIndex
+
+            self._index = StepIndex(self)
+        return self._index
+
+    def columns(self) -> dict[str, array]:
+        """Column name → array, in `COLUMNS` order."""
+        return {name: getattr(self, name) for name in COLUMNS}
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.itemsize * len(col) for col in self.columns().values())
+
+    def __len__(self) -> int:
+        return len(self.step_type)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, StepLog):
+            return NotImplemented
+        return self.columns() == other.columns()
+
+    def __getitem__(self, index: int) -> Step:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("StepLog index out of range")
+        return Step(
+            step_type=STEP_TYPES[self.step_type[index]],
+            phase=PHASES[self.phase[index]],
+            element_ids=self.element_ids(index),
+            bucket_index=self.bucket_index[index],
+            slot_index=self.slot_index[index],
+            output_index=self.output_index[index],
+            code_line=self.code_line[index],
+            depth=self.depth[index],
+            parent_bucket=self.parent_bucket[index],
+        )
+
+    def __iter__(self) -> Iterator[Step]:
+        for index in range(len(self)):
+            yield self[index]
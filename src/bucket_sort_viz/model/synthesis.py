@@ -0,0 +1,205 @@
+"""Analytic step synthesis: a whole run's trace straight into a `StepLog`.
+
+The insertion sort of a bucket needs no simulation. When element i (in
+scatter order) is inserted, it walks left past exactly the elements of the
+already-sorted prefix that are strictly larger than it. Those are, in walk
+order, the prefix elements of highest stable rank. If any prefix element is
+not larger, the walk ends with a compare / no_swap against the highest-ranked
+one of those.
+
+Ranking the bucket once with a stable argsort turns all of that into boolean
+masks over (element, rank) blocks. `np.nonzero` on those masks yields every
+compare/swap pair in trace order, and the step columns are scattered into place
+in bulk. The result matches `_insertion_sort_bucket()` step for step,
+without descriptions, just as `generate_steps(describe=False)` does.
+Counting-sorted buckets are simpler still: their place steps are the stable
+argsort itself.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+
+from bucket_sort_viz.config import STEP_TO_CODE_LINE
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.model.step_log import PHASE_CODES, STEP_TYPE_CODES, STEP_TYPES, StepLog
+from bucket_sort_viz.presets import SortPreset
+
+COMPARE = STEP_TYPE_CODES["compare"]
+SWAP = STEP_TYPE_CODES["swap"]
+NO_SWAP = STEP_TYPE_CODES["no_swap"]
+PLACE = STEP_TYPE_CODES["place"]
+MASK_BLOCK_CELLS = 1 << 22          # Bound on rows × bucket size per mask block
+
+_CODE_LINES = np.array([STEP_TO_CODE_LINE[name] for name in STEP_TYPES], dtype=np.int8)
+
+
+def _append(
+    log: StepLog,
+    step_type: np.ndarray,
+    phase: str,
+    left: np.ndarray,
+    right: np.ndarray | None = None,
+    bucket_index: np.ndarray | int = -1,
+    slot_index: np.ndarray | int = -1,
+    output_index: np.ndarray | int = -1,
+) -> None:
+    """Bulk-append steps with one element ID each (or two with `right`)."""
+    count = len(step_type)
+    if count == 0:
+        return
+    ids = left if right is None else np.stack([left, right], axis=1).ravel()
+    per_step = 1 if right is None else 2
+    base = len(log.ids)
+
+    def column(value, dtype):
+        return np.ascontiguousarray(np.broadcast_to(np.asarray(value, dtype=dtype), (count,)))
+
+    log.extend_columns(
+        step_type=column(step_type, np.int8),
+        phase=column(PHASE_CODES[phase], np.int8),
+        bucket_index=column(bucket_index, np.int32),
+        slot_index=column(slot_index, np.int32),
+        output_index=column(output_index, np.int32),
+        code_line=column(_CODE_LINES[step_type], np.int8),
+        depth=column(0, np.int8),
+        parent_bucket=column(-1, np.int32),
+        id_end=base + per_step * np.arange(1, count + 1, dtype=np.int64),
+        ids=np.ascontiguousarray(ids, dtype=np.int32),
+    )
+
+
+def append_insertion_sort(
+    log: StepLog,
+    bucket: Sequence[int],
+    bucket_idx: int,
+    values: np.ndarray,
+) -> None:
+    """Append the insertion-sort steps of one bucket, as the reference loop records them.
+
+    Args:
+        log: Log to append to.
+        bucket: Element IDs in the bucket, in scatter order.
+        bucket_idx: The bucket's index (recorded on every step).
+        values: All input values as an array, indexed by element ID.
+    """
+    ids = np.asarray(bucket, dtype=np.int64)
+    k = len(ids)
+    if k <= 1:
+        return
+    order = np.argsort(values[ids], kind="stable")      # rank → position
+    rank = np.empty(k, dtype=np.int64)
+    rank[order] = np.arange(k)
+    ranks_desc = np.arange(k - 1, -1, -1)
+    position_desc = order[::-1]                           # positions by descending rank
+
+    rows_per_block = max(1, MASK_BLOCK_CELLS // k)
+    for start in range(1, k, rows_per_block):
+        rows = np.arange(start, min(k, start + rows_per_block))
+        in_prefix = position_desc[None, :] < rows[:, None]
+        above = ranks_desc[None, :] > rank[rows][:, None]
+        larger = in_prefix & above
+        settle = in_prefix & ~above
+
+        # Walk pairs, row-major: each row's larger prefix elements by descending rank.
+        pair_row, pair_col = np.nonzero(larger)
+        shifts = larger.sum(axis=1)
+        settles = settle.any(axis=1)
+        settle_with = ids[position_desc[settle.argmax(axis=1)]]
+
+        steps_per_row = 2 * shifts + 2 * settles
+        row_start = np.cumsum(steps_per_row) - steps_per_row
+        total = int(steps_per_row.sum())
+        first_pair = np.cumsum(shifts) - shifts
+        t = np.arange(len(pair_row)) - first_pair[pair_row]   # swaps so far in this row
+
+        step_type = np.full(total, COMPARE, dtype=np.int8)
+        slot = np.full(total, -1, dtype=np.int32)
+        left = np.empty(total, dtype=np.int64)
+        compare_at = row_start[pair_row] + 2 * t
+        step_type[compare_at + 1] = SWAP
+        slot[compare_at + 1] = rows[pair_row] - t - 1
+        neighbor = ids[position_desc[pair_col]]
+        left[compare_at] = neighbor
+        left[compare_at + 1] = neighbor
+
+        settle_rows = np.flatnonzero(settles)
+        settle_at = row_start[settle_rows] + 2 * shifts[settle_rows]
+        step_type[settle_at + 1] = NO_SWAP
+        slot[settle_at + 1] = rows[settle_rows] - shifts[settle_rows]
+        left[settle_at] = settle_with[settle_rows]
+        left[settle_at + 1] = settle_with[settle_rows]
+
+        right = np.repeat(ids[rows], steps_per_row)
+        _append(log, step_type, "sort", left, right, bucket_index=bucket_idx, slot_index=slot)
+
+
+def append_counting_sort(
+    log: StepLog,
+    bucket: Sequence[int],
+    bucket_idx: int,
+    values: np.ndarray,
+) -> None:
+    """Append the place steps of one counting-sorted bucket (arguments as above)."""
+    ids = np.asarray(bucket, dtype=np.int64)
+    k = len(ids)
+    if k <= 1:
+        return
+    placed = ids[np.argsort(values[ids], kind="stable")]
+    step_type = np.full(k, PLACE, dtype=np.int8)
+    _append(log, step_type, "sort", placed, bucket_index=bucket_idx, slot_index=np.arange(k))
+
+
+def record_log(preset: SortPreset, values: Sequence[int], counting_width: int = 0) -> StepLog:
+    """Record a whole run as `generate_steps(preset, values, describe=False)` would.
+
+    Raises:
+        ValueError: If a value falls outside the preset's bucket ranges.
+    """
+    vals = np.asarray(values, dtype=np.int64)
+    n = len(vals)
+    low = preset.value_range[0]
+    buckets = (vals - low) // preset.bucket_size
+    outside = (vals < low) | (buckets >= preset.num_buckets)
+    if outside.any():
+        value = int(vals[np.flatnonzero(outside)[0]])
+        raise ValueError(f"Value {value} does not fit in any bucket range")
+
+    log = StepLog()
+    element_ids = np.arange(n, dtype=np.int64)
+    by_bucket = np.argsort(buckets, kind="stable")                 # scatter order per bucket
+    sizes = np.bincount(buckets, minlength=preset.num_buckets)
+    bucket_start = np.cumsum(sizes) - sizes
+    slot = np.empty(n, dtype=np.int64)
+    slot[by_bucket] = np.arange(n) - np.repeat(bucket_start, sizes)
+
+    def phase_change(phase: str) -> None:
+        log.append(Step("phase_change", phase, [], code_line=STEP_TO_CODE_LINE["phase_change"]))
+
+    phase_change("scatter")
+    scatter = np.full(n, STEP_TYPE_CODES["scatter"], dtype=np.int8)
+    _append(log, scatter, "scatter", element_ids, bucket_index=buckets, slot_index=slot)
+
+    phase_change("sort")
+    sort_bucket = append_counting_sort if preset.bucket_size <= counting_width else (
+        append_insertion_sort
+    )
+    for bucket_idx in range(preset.num_buckets):
+        start = bucket_start[bucket_idx]
+        members = by_bucket[start:start + sizes[bucket_idx]]
+        sort_bucket(log, members, bucket_idx, vals)
+
+    phase_change("gather")
+    gathered = np.lexsort((element_ids, vals, buckets))              # stable sort per bucket
+    gather = np.full(n, STEP_TYPE_CODES["gather"], dtype=np.int8)
+    _append(
+        log, gather, "gather", gathered,
+        bucket_index=buckets[gathered], output_index=np.arange(n),
+    )
+
+    log.append(Step(
+        "celebration", "done", gathered.tolist(), code_line=STEP_TO_CODE_LINE["celebration"],
+    ))
+    return log
@@ -0,0 +1,435 @@
+"""Run-length / delta codec for step traces.
+
+Recorded traces are highly redundant: every field of almost every step
+follows from the bucket contents so far. The encoder and decoder both replay
+the steps onto the same small state (bucket contents, gathered counts, output
+position), and the encoder emits a compact record only when the decoder would
+regenerate the exact step — description included — from that state:
+
+- PHASE      one phase_change
+- SCATTER    a run of scatters: per step, the ID delta and target bucket
+             (the slot is implied by the bucket's current size)
+- WALK       one insertion walk: an element compared and swapped down its
+             bucket k times, optionally ending in a no_swap. Stored as
+             (bucket delta, start-slot delta, k and the no_swap flag); the IDs
+             come from the bucket contents.
+- GATHER     a run of gathers from one bucket, in bucket order
+- CELEBRATE  the celebration over all buckets' contents
+
+Anything else is written as a LITERAL step, so any step sequence round-trips
+exactly. A literal stores the integer `LITERAL_FIELDS` in order; traces
+written before a field existed are decoded by passing the older field list.
+Records are LEB128 varints (zigzag for signed values). Decoding is lazy and
+streams from any binary file object.
+"""
+
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import BinaryIO
+
+from bucket_sort_viz.config import STEP_TO_CODE_LINE
+from bucket_sort_viz.model.bucket_sort import describe_step
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.model.step_log import PHASE_CODES, PHASES, STEP_TYPE_CODES, STEP_TYPES
+
+END, LITERAL, PHASE, SCATTER, WALK, GATHER, CELEBRATE = range(7)
+LITERAL_FIELDS = (
+    "bucket_index", "slot_index", "output_index", "code_line", "depth", "parent_bucket",
+)
+FLUSH_BYTES = 1 << 16
+READ_BYTES = 1 << 16
+
+
+@dataclass
+class _TraceState:
+    """What both ends know after replaying the steps so far."""
+
+    buckets: list[list[int]] = field(default_factory=list)
+    gathered: list[int] = field(default_factory=list)
+    output: int = 0
+    last_id: int = -1
+    last_bucket: int = 0
+    last_walk_slot: int = 0
+
+    def bucket(self, index: int) -> list[int]:
+        while len(self.buckets) <= index:
+            self.buckets.append([])
+            self.gathered.append(0)
+        return self.buckets[index]
+
+    def apply(self, step: Step) -> None:
+        """Update the state with a step's effect (tolerant of arbitrary steps).
+
+        Re-bucketing steps (depth > 0) are not tracked, so they and the
+        top-level gathers of re-bucketed buckets are stored as literals.
+        """
+        ids, b = step.element_ids, step.bucket_index
+        if step.depth:
+            return
+        if step.step_type == "scatter" and b >= 0 and ids:
+            bucket = self.bucket(b)
+            if step.slot_index == len(bucket):
+                bucket.append(ids[0])
+            self.last_id = ids[0]
+        elif step.step_type == "swap" and b >= 0:
+            bucket, j = self.bucket(b), step.slot_index
+            if 0 <= j < len(bucket) - 1 and bucket[j:j + 2] == ids:
+                bucket[j], bucket[j + 1] = bucket[j + 1], bucket[j]
+        elif step.step_type == "place" and b >= 0 and ids:
+            bucket, j = self.bucket(b), step.slot_index
+            if 0 <= j < len(bucket):
+                bucket[j] = ids[0]
+        elif step.step_type == "gather" and b >= 0:
+            self.bucket(b)
+            self.gathered[b] += 1
+            self.output = step.output_index + 1
+
+
+# ──────────────────────────────────────────────
+# Step prediction (shared by encoder and decoder)
+# ──────────────────────────────────────────────
+def _phase(phase: str, values) -> Step:
+    step = Step("phase_change", phase, [], code_line=STEP_TO_CODE_LINE["phase_change"])
+    step.description = describe_step(step, values)
+    return step
+
+
+def _scatter(state: _TraceState, element_id: int, b: int, values) -> Step:
+    step = Step(
+        "scatter", "scatter", [element_id], bucket_index=b,
+        slot_index=len(state.bucket(b)), code_line=STEP_TO_CODE_LINE["scatter"],
+    )
+    step.description = describe_step(step, values)
+    return step
+
+
+def _pair(step_type: str, bucket: list[int], b: int, j: int, slot: int, values) -> Step:
+    step = Step(
+        step_type, "sort", [bucket[j - 1], bucket[j]], bucket_index=b,
+        slot_index=slot, code_line=STEP_TO_CODE_LINE[step_type],
+    )
+    step.description = describe_step(step, values)
+    return step
+
+
+def _gather(state: _TraceState, b: int, values) -> Step | None:
+    bucket = state.bucket(b)
+    if state.gathered[b] >= len(bucket):
+        return None
+    step = Step(
+        "gather", "gather", [bucket[state.gathered[b]]], bucket_index=b,
+        output_index=state.output, code_line=STEP_TO_CODE_LINE["gather"],
+    )
+    step.description = describe_step(step, values)
+    return step
+
+
+def _celebration(state: _TraceState, values) -> Step:
+    ids = [element_id for bucket in state.buckets for element_id in bucket]
+    step = Step("celebration", "done", ids, code_line=STEP_TO_CODE_LINE["celebration"])
+    step.description = describe_step(step, values)
+    return step
+
+
+def _walk_steps(state: _TraceState, b: int, j: int, swaps: int, settles: bool, values):
+    """Yield (and apply) the steps of one insertion walk starting at slot j."""
+    bucket = state.bucket(b)
+    for _ in range(swaps):
+        yield _pair("compare", bucket, b, j, -1, values)
+        swap = _pair("swap", bucket, b, j, j - 1, values)
+        state.apply(swap)
+        yield swap
+        j -= 1
+    if settles:
+        yield _pair("compare", bucket, b, j, -1, values)
+        yield _pair("no_swap", bucket, b, j, j, values)
+
+
+# ──────────────────────────────────────────────
+# Varints
+# ──────────────────────────────────────────────
+def _zigzag(value: int) -> int:
+    return value * 2 if value >= 0 else -value * 2 - 1
+
+
+def _unzigzag(value: int) -> int:
+    return value >> 1 if not value & 1 else -(value >> 1) - 1
+
+
+def _put(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+class _Reader:
+    """Buffered varint reader over a binary stream."""
+
+    def __init__(self, f: BinaryIO):
+        self.f = f
+        self.buffer = b""
+        self.pos = 0
+
+    def _fill(self) -> None:
+        chunk = self.f.read(READ_BYTES)
+        if not chunk:
+            raise ValueError("Truncated step trace")
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def uint(self) -> int:
+        result = shift = 0
+        while True:
+            if self.pos >= len(self.buffer):
+                self._fill()
+            byte = self.buffer[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def sint(self) -> int:
+        return _unzigzag(self.uint())
+
+    def raw(self, size: int) -> bytes:
+        while len(self.buffer) - self.pos < size:
+            self._fill()
+        data = self.buffer[self.pos:self.pos + size]
+        self.pos += size
+        return data
+
+
+# ──────────────────────────────────────────────
+# Encoder
+# ──────────────────────────────────────────────
+class _Encoder:
+    def __init__(self, steps: Iterable[Step], values: Sequence[int] | None):
+        self.source = iter(steps)
+        self.pushed: list[Step] = []
+        self.values = values
+        self.state = _TraceState()
+        self.out = bytearray()
+
+    def next(self) -> Step | None:
+        return self.pushed.pop() if self.pushed else next(self.source, None)
+
+    def push(self, *steps: Step | None) -> None:
+        """Return steps to the input; the last one given is read first."""
+        self.pushed.extend(step for step in steps if step is not None)
+
+    def is_scatter(self, step: Step | None) -> bool:
+        return (
+            step is not None and step.step_type == "scatter"
+            and step.bucket_index >= 0 and len(step.element_ids) == 1
+            and step == _scatter(self.state, step.element_ids[0], step.bucket_index, self.values)
+        )
+
+    def is_gather(self, step: Step | None, b: int) -> bool:
+        return (
+            step is not None and step.step_type == "gather" and step.bucket_index == b
+            and step == _gather(self.state, b, self.values)
+        )
+
+    def encode(self, step: Step) -> int:
+        """Encode `step` and any run it starts. Returns the steps consumed."""
+        out, state = self.out, self.state
+        if step.step_type == "phase_change" and step == _phase(step.phase, self.values):
+            out += bytes((PHASE, PHASE_CODES[step.phase]))
+            return 1
+        if self.is_scatter(step):
+            return self.scatter_run(step)
+        if step.step_type == "compare" and step.bucket_index >= 0:
+            consumed = self.walk(step)
+            if consumed:
+                return consumed
+        if step.step_type == "gather" and self.is_gather(step, step.bucket_index):
+            return self.gather_run(step)
+        if step.step_type == "celebration" and step == _celebration(state, self.values):
+            out.append(CELEBRATE)
+            return 1
+        _literal(out, step, self.values)
+        state.apply(step)
+        return 1
+
+    def scatter_run(self, step: Step | None) -> int:
+        body = bytearray()
+        count = 0
+        while self.is_scatter(step):
+            _put(body, _zigzag(step.element_ids[0] - self.state.last_id - 1))
+            _put(body, step.bucket_index)
+            self.state.apply(step)
+            count += 1
+            step = self.next()
+        self.push(step)
+        self.out.append(SCATTER)
+        _put(self.out, count)
+        self.out += body
+        return count
+
+    def walk(self, compare: Step) -> int:
+        """Match an insertion walk starting at `compare`; 0 if there is none."""
+        state, values, b = self.state, self.values, compare.bucket_index
+        bucket = state.bucket(b)
+        try:
+            start = bucket.index(compare.element_ids[1], 1)
+        except (ValueError, IndexError):
+            return 0
+        if compare != _pair("compare", bucket, b, start, -1, values):
+            return 0
+
+        # `pending` is the compare that has been read but not yet matched
+        # with the swap or no_swap that should follow it.
+        j, swaps, settles, pending = start, 0, False, compare
+        while True:
+            step = self.next()
+            if step == _pair("no_swap", bucket, b, j, j, values):
+                settles = True
+                break
+            if step != _pair("swap", bucket, b, j, j - 1, values):
+                self.push(step)
+                if swaps:
+                    self.push(pending)
+                break
+            state.apply(step)
+            swaps += 1
+            j -= 1
+            if j == 0:
+                break
+            step = self.next()
+            if step != _pair("compare", bucket, b, j, -1, values):
+                self.push(step)
+                break
+            pending = step
+        if swaps == 0 and not settles:
+            return 0
+
+        self.out.append(WALK)
+        _put(self.out, _zigzag(b - state.last_bucket))
+        _put(self.out, _zigzag(start - state.last_walk_slot - 1))
+        _put(self.out, swaps * 2 + settles)
+        state.last_bucket, state.last_walk_slot = b, start
+        return 2 * swaps + 2 * settles
+
+    def gather_run(self, step: Step | None) -> int:
+        b = step.bucket_index
+        count = 0
+        while self.is_gather(step, b):
+            self.state.apply(step)
+            count += 1
+            step = self.next()
+        self.push(step)
+        self.out.append(GATHER)
+        _put(self.out, _zigzag(b - self.state.last_bucket))
+        _put(self.out, count)
+        self.state.last_bucket = b
+        return count
+
+
+def _literal(out: bytearray, step: Step, values) -> None:
+    out.append(LITERAL)
+    _put(out, STEP_TYPE_CODES[step.step_type])
+    _put(out, PHASE_CODES[step.phase])
+    _put(out, len(step.element_ids))
+    previous = 0
+    for element_id in step.element_ids:
+        _put(out, _zigzag(element_id - previous))
+        previous = element_id
+    for name in LITERAL_FIELDS:
+        _put(out, _zigzag(getattr(step, name)))
+    if step.description == describe_step(step, values):
+        _put(out, 0)
+    else:
+        text = step.description.encode()
+        _put(out, len(text) + 1)
+        out += text
+
+
+def encode_steps(
+    steps: Iterable[Step],
+    f: BinaryIO,
+    values: Sequence[int] | None = None,
+) -> int:
+    """Encode steps onto `f`, returning how many were written.
+
+    `values` (the input list) lets descriptions be regenerated instead of
+    stored; pass the same values to `decode_steps()`. Without them, only
+    steps with empty descriptions compress.
+    """
+    encoder = _Encoder(steps, values)
+    count = 0
+    while (step := encoder.next()) is not None:
+        count += encoder.encode(step)
+        if len(encoder.out) >= FLUSH_BYTES:
+            f.write(encoder.out)
+            encoder.out.clear()
+    encoder.out.append(END)
+    f.write(encoder.out)
+    return count
+
+
+# ──────────────────────────────────────────────
+# Decoder
+# ──────────────────────────────────────────────
+def _read_literal(reader: _Reader, values, fields: Sequence[str]) -> Step:
+    step_type = STEP_TYPES[reader.uint()]
+    phase = PHASES[reader.uint()]
+    ids = []
+    previous = 0
+    for _ in range(reader.uint()):
+        previous += reader.sint()
+        ids.append(previous)
+    step = Step(step_type, phase, ids, **{name: reader.sint() for name in fields})
+    length = reader.uint()
+    if length:
+        step.description = reader.raw(length - 1).decode()
+    else:
+        step.description = describe_step(step, values)
+    return step
+
+
+def decode_steps(
+    f: BinaryIO,
+    values: Sequence[int] | None = None,
+    fields: Sequence[str] = LITERAL_FIELDS,
+) -> Iterator[Step]:
+    """Lazily decode steps written by `encode_steps()` with the same `values`.
+
+    `fields` are the literal fields of the writing version (see `LITERAL_FIELDS`).
+    """
+    reader = _Reader(f)
+    state = _TraceState()
+    while True:
+        op = reader.uint()
+        if op == END:
+            return
+        if op == PHASE:
+            yield _phase(PHASES[reader.uint()], values)
+        elif op == SCATTER:
+            for _ in range(reader.uint()):
+                element_id = state.last_id + 1 + reader.sint()
+                step = _scatter(state, element_id, reader.uint(), values)
+                state.apply(step)
+                yield step
+        elif op == WALK:
+            b = state.last_bucket + reader.sint()
+            start = state.last_walk_slot + 1 + reader.sint()
+            packed = reader.uint()
+            state.last_bucket, state.last_walk_slot = b, start
+            yield from _walk_steps(state, b, start, packed >> 1, bool(packed & 1), values)
+        elif op == GATHER:
+            b = state.last_bucket + reader.sint()
+            state.last_bucket = b
+            for _ in range(reader.uint()):
+                step = _gather(state, b, values)
+                state.apply(step)
+                yield step
+        elif op == CELEBRATE:
+            yield _celebration(state, values)
+        elif op == LITERAL:
+            step = _read_literal(reader, values, fields)
+            state.apply(step)
+            yield step
+        else:
+            raise ValueError(f"Unknown trace record {op}")
@@ -0,0 +1,337 @@
+"""Streaming step-trace files for external viewers.
+
+All encodings share one header (format, version, field layout and a free-form
+`meta` object such as the preset and input values):
+
+- NDJSON: the header object on the first line, then one JSON object per step
+  with the `Step` fields. Easy to consume from a browser line by line.
+- Columnar: `MAGIC`, a little-endian u32 header length and the header as
+  UTF-8 JSON, then chunks of up to `chunk_size` steps. Each chunk is a u32
+  step count and u32 element-ID count followed by the packed little-endian
+  columns listed in the header (`id_end` is relative to the chunk). A chunk
+  with zero steps ends the file.
+- Compact: `COMPACT_MAGIC` and the header as above, then the run-length /
+  delta records of `trace_codec` (smallest; decoding replays bucket state).
+
+All writers take any iterable of steps (e.g. `generate_steps()`), buffer at
+most one chunk, and gzip the output when the path ends in ".gz". The readers
+sniff the encoding and compression, and yield steps lazily.
+
+Readers accept every version up to `TRACE_VERSION`. Fields an older version
+did not record get their defaults: `depth` 0 for version 1, and for version
+2 each re-bucketing step's `parent_bucket` is recovered by replaying the
+top-level scatters.
+"""
+
+import gzip
+import json
+import struct
+import sys
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import BinaryIO
+
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.model.step_log import COLUMNS, PHASES, STEP_TYPES, StepLog
+from bucket_sort_viz.model.trace_codec import LITERAL_FIELDS, decode_steps, encode_steps
+
+TRACE_FORMAT = "bucket-sort-viz/trace"
+TRACE_VERSION = 3                   # 2: steps carry `depth`; 3: and `parent_bucket`
+STEP_FIELDS = (
+    "step_type", "phase", "element_ids",
+    "bucket_index", "slot_index", "output_index", "code_line", "depth", "parent_bucket",
+)
+MAGIC = b"BSVTRACE"
+COMPACT_MAGIC = b"BSVWALKS"
+GZIP_MAGIC = b"\x1f\x8b"
+DEFAULT_CHUNK_SIZE = 4096
+
+# Column typecodes as typed-array names, for readers outside Python. In the
+# file, `id_end` is a chunk-relative uint32 rather than the in-memory int64.
+_FILE_TYPECODES = {**COLUMNS, "id_end": "I"}
+_COLUMN_DTYPES = {"b": "int8", "i": "int32", "I": "uint32"}
+_DTYPE_TYPECODES = {dtype: code for code, dtype in _COLUMN_DTYPES.items()}
+_COLUMN_DEFAULTS = {"depth": 0, "parent_bucket": -1}   # Columns added after version 1
+_CHUNK_HEADER = struct.Struct("<II")
+
+
+def _open(path: Path, mode: str, compress: bool | None) -> BinaryIO:
+    if compress is None:
+        compress = path.suffix == ".gz"
+    if compress:
+        return gzip.open(path, mode + "b")
+    return path.open(mode + "b")
+
+
+def _open_for_read(path: Path) -> BinaryIO:
+    with path.open("rb") as f:
+        compressed = f.read(2) == GZIP_MAGIC
+    return _open(path, "r", compressed)
+
+
+def _header(encoding: str, meta: dict | None) -> dict:
+    header = {
+        "format": TRACE_FORMAT,
+        "version": TRACE_VERSION,
+        "encoding": encoding,
+        "fields": list(STEP_FIELDS),
+        "step_types": list(STEP_TYPES),
+        "phases": list(PHASES),
+    }
+    if encoding == "columnar":
+        header["columns"] = {
+            name: _COLUMN_DTYPES[code] for name, code in _FILE_TYPECODES.items()
+        }
+    header["meta"] = meta or {}
+    return header
+
+
+def _check_header(header: dict, path: Path) -> dict:
+    if header.get("format") != TRACE_FORMAT:
+        raise ValueError(f"{path} is not a bucket-sort-viz trace")
+    version = header.get("version")
+    if not isinstance(version, int) or not 1 <= version <= TRACE_VERSION:
+        raise ValueError(f"{path}: unsupported trace version {version}")
+    return header
+
+
+class _ParentBuckets:
+    """Fills in `parent_bucket` for traces written before it was recorded.
+
+    Every element's top-level bucket is known from its depth-0 scatter, which
+    precedes all of its re-bucketing steps.
+    """
+
+    def __init__(self):
+        self.element_bucket: dict[int, int] = {}
+
+    def steps(self, steps: Iterator[Step]) -> Iterator[Step]:
+        for step in steps:
+            if step.depth == 0 and step.step_type == "scatter" and step.element_ids:
+                self.element_bucket[step.element_ids[0]] = step.bucket_index
+            elif step.depth > 0 and step.element_ids:
+                step.parent_bucket = self.element_bucket.get(step.element_ids[0], -1)
+            yield step
+
+    def chunk(self, chunk: StepLog) -> StepLog:
+        scatter, ids, ends = STEP_TYPES.index("scatter"), chunk.ids, chunk.id_end
+        for position in range(len(chunk)):
+            if ends[position] == (ends[position - 1] if position else 0):
+                continue
+            first = ids[ends[position - 1] if position else 0]
+            if chunk.depth[position] == 0 and chunk.step_type[position] == scatter:
+                self.element_bucket[first] = chunk.bucket_index[position]
+            elif chunk.depth[position] > 0:
+                chunk.parent_bucket[position] = self.element_bucket.get(first, -1)
+        return chunk
+
+
+def _needs_parents(header: dict) -> bool:
+    return "depth" in header["fields"] and "parent_bucket" not in header["fields"]
+
+
+# ──────────────────────────────────────────────
+# NDJSON
+# ──────────────────────────────────────────────
+def write_ndjson(
+    path: Path,
+    steps: Iterable[Step],
+    meta: dict | None = None,
+    *,
+    descriptions: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compress: bool | None = None,
+) -> int:
+    """Stream steps to an NDJSON trace. Returns the number of steps written.
+
+    Args:
+        path: Output file; gzip-compressed if it ends in ".gz".
+        steps: Steps to write, consumed once.
+        meta: Extra JSON-serializable metadata stored in the header.
+        descriptions: Include each step's description text.
+        chunk_size: Steps buffered per write.
+        compress: Force gzip on or off regardless of the suffix.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with _open(path, "w", compress) as f:
+        f.write(json.dumps(_header("ndjson", meta)).encode() + b"\n")
+        buffer: list[bytes] = []
+        for step in steps:
+            record = asdict(step)
+            if not descriptions:
+                del record["description"]
+            buffer.append(json.dumps(record, separators=(",", ":")).encode() + b"\n")
+            count += 1
+            if len(buffer) >= chunk_size:
+                f.write(b"".join(buffer))
+                buffer.clear()
+        f.write(b"".join(buffer))
+    return count
+
+
+def _iter_ndjson(f: BinaryIO) -> Iterator[Step]:
+    for line in f:
+        if line.strip():
+            yield Step(**json.loads(line))
+
+
+# ──────────────────────────────────────────────
+# Columnar
+# ──────────────────────────────────────────────
+def _write_chunk(f: BinaryIO, chunk: StepLog) -> None:
+    f.write(_CHUNK_HEADER.pack(len(chunk), len(chunk.ids)))
+    columns = chunk.columns()
+    for name, typecode in _FILE_TYPECODES.items():
+        column = columns[name]
+        if column.typecode != typecode:
+            column = array(typecode, column)
+        if sys.byteorder == "big":
+            column = array(column.typecode, column)
+            column.byteswap()
+        f.write(column.tobytes())
+
+
+def write_columnar(
+    path: Path,
+    steps: Iterable[Step],
+    meta: dict | None = None,
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compress: bool | None = None,
+) -> int:
+    """Stream steps to a columnar binary trace. Returns the number of steps written.
+
+    Descriptions are not stored. Arguments are as for `write_ndjson()`.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with _open(path, "w", compress) as f:
+        header = json.dumps(_header("columnar", meta)).encode()
+        f.write(MAGIC + struct.pack("<I", len(header)) + header)
+        chunk = StepLog()
+        for step in steps:
+            chunk.append(step)
+            if len(chunk) >= chunk_size:
+                _write_chunk(f, chunk)
+                count += len(chunk)
+                chunk = StepLog()
+        if len(chunk):
+            _write_chunk(f, chunk)
+            count += len(chunk)
+        f.write(_CHUNK_HEADER.pack(0, 0))
+    return count
+
+
+def _read_exact(f: BinaryIO, size: int) -> bytes:
+    data = f.read(size)
+    if len(data) != size:
+        raise ValueError("Truncated columnar trace")
+    return data
+
+
+def _iter_chunks(f: BinaryIO, header: dict) -> Iterator[StepLog]:
+    """Chunks laid out as the header's `columns` say; columns it lacks get their defaults."""
+    layout = {name: _DTYPE_TYPECODES[dtype] for name, dtype in header["columns"].items()}
+    parents = _ParentBuckets() if _needs_parents(header) else None
+    while True:
+        steps, ids = _CHUNK_HEADER.unpack(_read_exact(f, _CHUNK_HEADER.size))
+        if steps == 0:
+            return
+        chunk = StepLog()
+        columns = chunk.columns()
+        for name, typecode in layout.items():
+            raw = array(typecode)
+            raw.frombytes(_read_exact(f, raw.itemsize * (ids if name == "ids" else steps)))
+            if sys.byteorder == "big":
+                raw.byteswap()
+            column = columns[name]
+            column.extend(raw if raw.typecode == column.typecode else iter(raw))
+        for name, default in _COLUMN_DEFAULTS.items():
+            if name not in layout:
+                columns[name].extend([default] * steps)
+        yield parents.chunk(chunk) if parents else chunk
+
+
+# ──────────────────────────────────────────────
+# Compact (run-length / delta records)
+# ──────────────────────────────────────────────
+def write_compact(
+    path: Path,
+    steps: Iterable[Step],
+    meta: dict | None = None,
+    *,
+    compress: bool | None = None,
+) -> int:
+    """Stream steps through `trace_codec`. Returns the number of steps written.
+
+    Descriptions are regenerated on load from `meta["values"]` when present
+    and stored verbatim otherwise, so the steps round-trip exactly.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _open(path, "w", compress) as f:
+        header = json.dumps(_header("compact", meta)).encode()
+        f.write(COMPACT_MAGIC + struct.pack("<I", len(header)) + header)
+        return encode_steps(steps, f, (meta or {}).get("values"))
+
+
+# ──────────────────────────────────────────────
+# Reading any encoding
+# ──────────────────────────────────────────────
+def _read_header(f: BinaryIO, path: Path) -> dict:
+    """Read the header, leaving `f` at the first step."""
+    if f.read(len(MAGIC)) in (MAGIC, COMPACT_MAGIC):
+        (length,) = struct.unpack("<I", _read_exact(f, 4))
+        header = json.loads(_read_exact(f, length))
+    else:
+        f.seek(0)
+        header = json.loads(f.readline())
+    return _check_header(header, path)
+
+
+def iter_columnar_chunks(path: Path) -> Iterator[StepLog]:
+    """Yield a columnar trace one chunk at a time, without building `Step`s."""
+    with _open_for_read(path) as f:
+        header = _read_header(f, path)
+        if header["encoding"] != "columnar":
+            raise ValueError(f"{path} is not a columnar trace")
+        yield from _iter_chunks(f, header)
+
+
+def read_header(path: Path) -> dict:
+    """Return a trace's header (format, field layout and `meta`)."""
+    with _open_for_read(path) as f:
+        return _read_header(f, path)
+
+
+def read_steps(path: Path) -> Iterator[Step]:
+    """Lazily yield the steps of a trace in any encoding, gzipped or not."""
+    with _open_for_read(path) as f:
+        header = _read_header(f, path)
+        if header["encoding"] == "columnar":
+            for chunk in _iter_chunks(f, header):
+                yield from chunk
+            return
+        if header["encoding"] == "compact":
+            fields = [name for name in LITERAL_FIELDS if name in header["fields"]]
+            steps = decode_steps(f, header["meta"].get("values"), fields)
+        else:
+            steps = _iter_ndjson(f)
+        yield from _ParentBuckets().steps(steps) if _needs_parents(header) else steps
+
+
+def write_trace(path: Path, steps: Iterable[Step], meta: dict | None = None) -> int:
+    """Write a trace, choosing the encoding from the suffix.
+
+    ".bst" is columnar, ".bsw" compact, anything else NDJSON; a further
+    ".gz" compresses any of them.
+    """
+    if ".bst" in path.suffixes:
+        return write_columnar(path, steps, meta)
+    if ".bsw" in path.suffixes:
+        return write_compact(path, steps, meta)
+    return write_ndjson(path, steps, meta)
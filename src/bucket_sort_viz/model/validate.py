@@ -0,0 +1,398 @@
+"""Vectorized validation of recorded step traces.
+
+Replays a `StepLog` onto per-element state arrays (bucket, slot, output
+position) with NumPy instead of walking `Step` objects, so multi-million-step
+traces from batch runs can be checked before they are published.
+
+Checks run stage by stage in trace order — structure, scatter, sort, gather,
+celebration — and the first violation of the earliest failing stage is
+reported. Slot positions during the sort are reconstructed from each
+element's scatter slot plus the running sum of the swaps it took part in,
+which is what makes the sort-phase checks vectorizable. Counting-sorted
+buckets are checked separately: their place steps must put every member
+into slots 0..k-1 in stable value order. Re-bucketed buckets are checked by
+their outcome, the depth-1 gathers back into them (same rule); the nested
+steps inside get the structural checks, and must name the top-level bucket
+their element was scattered into as `parent_bucket`.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
+"""
+
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+
+from bucket_sort_viz.config import STEP_TO_CODE_LINE
+from bucket_sort_viz.model.step_log import PHASE_CODES, STEP_TYPE_CODES, STEP_TYPES, StepLog
+from bucket_sort_viz.model.trace_io import iter_columnar_chunks, read_header, read_steps
+from bucket_sort_viz.presets import PRESETS, SortPreset, custom_preset
+
+SCATTER, COMPARE, SWAP, NO_SWAP, GATHER, PHASE_CHANGE, CELEBRATION, PLACE = (
+    STEP_TYPE_CODES[name] for name in (
+        "scatter", "compare", "swap", "no_swap", "gather", "phase_change", "celebration", "place",
+    )
+)
+ANY = -1
+PHASE_ORDER = np.array([PHASE_CODES[name] for name in ("scatter", "sort", "gather")])
+
+# Per step type code: required phase, element-ID count and code line.
+_EXPECTED_PHASE = np.array([
+    {"scatter": PHASE_CODES["scatter"], "gather": PHASE_CODES["gather"],
+     "celebration": PHASE_CODES["done"], "phase_change": ANY}.get(name, PHASE_CODES["sort"])
+    for name in STEP_TYPES
+])
+_EXPECTED_IDS = np.array([
+    {"scatter": 1, "gather": 1, "place": 1, "phase_change": 0, "celebration": ANY}.get(name, 2)
+    for name in STEP_TYPES
+])
+_EXPECTED_CODE_LINE = np.array([STEP_TO_CODE_LINE[name] for name in STEP_TYPES])
+# Which of bucket/slot/output each step type uses; unused ones must be -1.
+_USES_BUCKET = np.array([name not in ("phase_change", "celebration") for name in STEP_TYPES])
+_USES_SLOT = np.array([name in ("scatter", "swap", "no_swap", "place") for name in STEP_TYPES])
+_USES_OUTPUT = np.array([name == "gather" for name in STEP_TYPES])
+
+
+@dataclass
+class Violation:
+    step_index: int
+    message: str
+
+    def __str__(self) -> str:
+        return f"step {self.step_index}: {self.message}"
+
+
+@dataclass
+class ValidationResult:
+    steps: int
+    seconds: float
+    violation: Violation | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.violation is None
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.seconds if self.seconds else 0.0
+
+
+class _Columns:
+    """A step log as NumPy arrays, plus each step's first two element IDs."""
+
+    def __init__(self, chunks: Iterable[StepLog]):
+        parts: dict[str, list[np.ndarray]] = {}
+        id_base = 0
+        for chunk in chunks:
+            for name, column in chunk.columns().items():
+                array = np.frombuffer(column, dtype=column.typecode)
+                if name == "id_end":
+                    array = array + id_base
+                parts.setdefault(name, []).append(array)
+            id_base += len(chunk.ids)
+        cols = {
+            name: np.concatenate(arrays) if arrays else np.zeros(0, dtype=np.int64)
+            for name, arrays in parts.items()
+        }
+        empty = np.zeros(0, dtype=np.int64)
+        self.step_type = cols.get("step_type", empty).astype(np.int64)
+        self.phase = cols.get("phase", empty).astype(np.int64)
+        self.bucket = cols.get("bucket_index", empty).astype(np.int64)
+        self.slot = cols.get("slot_index", empty).astype(np.int64)
+        self.output = cols.get("output_index", empty).astype(np.int64)
+        self.code_line = cols.get("code_line", empty).astype(np.int64)
+        self.depth = cols.get("depth", empty).astype(np.int64)
+        self.parent = cols.get("parent_bucket", empty).astype(np.int64)
+        self.ids = cols.get("ids", empty).astype(np.int64)
+        id_end = cols.get("id_end", empty).astype(np.int64)
+        self.id_count = np.diff(id_end, prepend=0)
+        self.id_start = id_end - self.id_count
+        padded = np.append(self.ids, [-1, -1])
+        self.first = np.where(self.id_count >= 1, padded[self.id_start], -1)
+        self.second = np.where(self.id_count >= 2, padded[self.id_start + 1], -1)
+
+    def __len__(self) -> int:
+        return len(self.step_type)
+
+
+def _first(bad: np.ndarray, step_indices: np.ndarray | None = None) -> int | None:
+    """Index of the first True in `bad` (mapped through `step_indices`)."""
+    hits = np.flatnonzero(bad)
+    if hits.size == 0:
+        return None
+    return int(hits[0] if step_indices is None else step_indices[hits[0]])
+
+
+def _earliest(*candidates: tuple[int | None, str]) -> Violation | None:
+    found = [(index, message) for index, message in candidates if index is not None]
+    if not found:
+        return None
+    index, message = min(found, key=lambda item: item[0])
+    return Violation(index, message)
+
+
+def _rank_in_group(groups: np.ndarray) -> np.ndarray:
+    """For each item, how many earlier items share its group."""
+    order = np.argsort(groups, kind="stable")
+    ordered = groups[order]
+    starts = np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])
+    lengths = np.diff(np.r_[starts, len(groups)])
+    ranks = np.empty(len(groups), dtype=np.int64)
+    ranks[order] = np.arange(len(groups)) - np.repeat(starts, lengths)
+    return ranks
+
+
+def _repeated(ids: np.ndarray) -> np.ndarray:
+    """Mask of items whose ID already occurred earlier."""
+    order = np.argsort(ids, kind="stable")
+    repeated = np.zeros(len(ids), dtype=bool)
+    repeated[order[1:]] = ids[order[1:]] == ids[order[:-1]]
+    return repeated
+
+
+def _check_structure(c: _Columns, n: int) -> Violation | None:
+    if ((c.step_type < 0) | (c.step_type >= len(STEP_TYPES))).any():
+        return Violation(_first((c.step_type < 0) | (c.step_type >= len(STEP_TYPES))),
+                         "unknown step type")
+    expected_phase = np.where(c.depth > 0, PHASE_CODES["sort"], _EXPECTED_PHASE[c.step_type])
+    boundary = np.r_[True, c.phase[1:] != c.phase[:-1]] & (c.step_type != CELEBRATION)
+    expected_ids = _EXPECTED_IDS[c.step_type]
+    # Each compare is immediately followed by a swap or no_swap of the same pair.
+    outcome = np.isin(c.step_type, (SWAP, NO_SWAP))
+    same_pair = (c.first[1:] == c.first[:-1]) & (c.second[1:] == c.second[:-1])
+    paired = np.r_[(c.step_type[:-1] == COMPARE) & outcome[1:] & same_pair, False]
+    unpaired = ((c.step_type == COMPARE) & ~paired) | (outcome & ~np.r_[False, paired[:-1]])
+    bad_depth = (c.depth < 0) | ((c.depth > 0) & np.isin(c.step_type, (PHASE_CHANGE, CELEBRATION)))
+    bad_id_positions = np.flatnonzero((c.ids < 0) | (c.ids >= n))
+    bad_id_step = None
+    if bad_id_positions.size:
+        bad_id_step = int(np.searchsorted(c.id_start + c.id_count, bad_id_positions[0], "right"))
+    # One phase_change per phase, in order, even when a phase has no steps.
+    markers = np.flatnonzero(c.step_type == PHASE_CHANGE)
+    shared = min(len(markers), len(PHASE_ORDER))
+    bad_marker = _first(c.phase[markers[:shared]] != PHASE_ORDER[:shared], markers[:shared])
+    if bad_marker is None and len(markers) != len(PHASE_ORDER):
+        bad_marker = int(markers[shared]) if len(markers) > shared else len(c) - 1
+    return _earliest(
+        (_first((expected_phase != ANY) & (c.phase != expected_phase)),
+         "step type does not belong to its phase"),
+        (_first((expected_ids != ANY) & (c.id_count != expected_ids)),
+         "wrong number of element IDs for step type"),
+        (_first(c.code_line != _EXPECTED_CODE_LINE[c.step_type]), "wrong pseudocode line"),
+        (_first(np.diff(c.phase) < 0, np.arange(1, len(c))), "phase goes backwards"),
+        (_first(bad_depth), "invalid re-bucketing depth"),
+        (_first(np.diff(c.depth) > 1, np.arange(1, len(c))), "depth skips a level"),
+        (_first((c.depth == 0) & (c.parent != -1)), "parent bucket on a top-level step"),
+        (_first(boundary != (c.step_type == PHASE_CHANGE)),
+         "phase_change must start each phase (and only there)"),
+        (bad_marker, "phase_change markers must be scatter, sort, gather in order"),
+        (_first(~_USES_BUCKET[c.step_type] & (c.bucket != -1)), "unexpected bucket index"),
+        (_first(~_USES_SLOT[c.step_type] & (c.slot != -1)), "unexpected slot index"),
+        (_first(~_USES_OUTPUT[c.step_type] & (c.output != -1)), "unexpected output index"),
+        (_first(unpaired), "compare not paired with one swap/no_swap"),
+        (bad_id_step, f"element ID out of range 0..{n - 1}"),
+    )
+
+
+def _check_scatter(c, preset, values, state) -> Violation | None:
+    index = np.flatnonzero((c.step_type == SCATTER) & (c.depth == 0))
+    ids, buckets = c.first[index], c.bucket[index]
+    expected_bucket = (values[ids] - preset.value_range[0]) // preset.bucket_size
+    violation = _earliest(
+        (_first(ids != np.arange(len(ids)), index), "elements not scattered in input order"),
+        (_first(_repeated(ids), index), "element scattered twice"),
+        (_first(buckets != expected_bucket, index), "element scattered into the wrong bucket"),
+        (_first(c.slot[index] != _rank_in_group(buckets), index),
+         "scatter slot is not the top of the bucket"),
+    )
+    if violation:
+        return violation
+    if len(ids) != len(values):
+        missing = int(np.flatnonzero(np.bincount(ids, minlength=len(values)) == 0)[0])
+        after = int(index[-1]) + 1 if index.size else 0
+        return Violation(after, f"element {missing} was never scattered")
+    state["bucket"][ids] = buckets
+    state["slot"][ids] = c.slot[index]
+    return None
+
+
+def _check_parents(c, state) -> Violation | None:
+    index = np.flatnonzero(c.depth > 0)
+    if index.size == 0:
+        return None
+    return _earliest(
+        (_first(c.parent[index] != state["bucket"][c.first[index]], index),
+         "re-bucketing step outside its parent bucket"),
+    )
+
+
+def _check_sort(c, values, state) -> Violation | None:
+    index = np.flatnonzero(np.isin(c.step_type, (COMPARE, SWAP, NO_SWAP)) & (c.depth == 0))
+    kind, a, b = c.step_type[index], c.first[index], c.second[index]
+    is_swap = kind == SWAP
+
+    # Slot of every element involved in a pair step, just before that step.
+    elems = np.concatenate([a, b])
+    times = np.concatenate([index, index])
+    deltas = np.concatenate([is_swap, -is_swap.astype(np.int64)]).astype(np.int64)
+    order = np.lexsort((times, elems))
+    sorted_elems, sorted_deltas = elems[order], deltas[order]
+    before = np.cumsum(sorted_deltas) - sorted_deltas
+    starts = np.flatnonzero(np.r_[True, sorted_elems[1:] != sorted_elems[:-1]][:len(elems)])
+    before -= np.repeat(before[starts], np.diff(np.r_[starts, len(elems)]))
+    slot_before = np.empty(len(elems), dtype=np.int64)
+    slot_before[order] = state["slot"][sorted_elems] + before
+    slot_a, slot_b = slot_before[: len(a)], slot_before[len(a):]
+
+    violation = _earliest(
+        (_first(a == b, index), "element compared with itself"),
+        (_first((state["bucket"][a] != c.bucket[index]) | (state["bucket"][b] != c.bucket[index]),
+                index), "elements are not in the step's bucket"),
+        (_first(slot_b != slot_a + 1, index), "elements are not in adjacent slots"),
+        (_first(is_swap & (c.slot[index] != slot_a), index), "swap slot does not match"),
+        (_first((kind == NO_SWAP) & (c.slot[index] != slot_b), index),
+         "no_swap slot does not match"),
+        (_first(is_swap & (values[a] <= values[b]), index), "swap of elements already in order"),
+        (_first((kind == NO_SWAP) & (values[a] > values[b]), index),
+         "no_swap on elements out of order"),
+    )
+    if violation:
+        return violation
+    state["slot"] += np.bincount(elems, weights=deltas, minlength=len(values)).astype(np.int64)
+    return _check_refills(c, values, state, index)
+
+
+def _check_refills(c, values, state, pair_index) -> Violation | None:
+    """Buckets refilled in one pass — counting-sorted (place steps) or re-bucketed
+    (depth-1 gathers): each member lands once, in the next slot, in stable value order.
+    """
+    place = (c.step_type == PLACE) & (c.depth == 0)
+    index = np.flatnonzero(place | ((c.step_type == GATHER) & (c.depth == 1)))
+    ids, is_place = c.first[index], place[index]
+    buckets = np.where(is_place, c.bucket[index], state["bucket"][ids])
+    slots = np.where(is_place, c.slot[index], c.output[index])
+    same_run = np.r_[False, buckets[1:] == buckets[:-1]]
+    prev_id, prev_value, value = np.r_[-1, ids[:-1]], np.r_[-1, values[ids[:-1]]], values[ids]
+    unstable = same_run & ((prev_value > value) | ((prev_value == value) & (prev_id > ids)))
+    violation = _earliest(
+        (_first(state["bucket"][ids] != buckets, index), "element placed outside its bucket"),
+        (_first(_repeated(ids), index), "element placed twice"),
+        (_first(slots != _rank_in_group(buckets), index),
+         "placement slot is not the next free slot"),
+        (_first(unstable, index), "placements out of stable value order"),
+        (_first(np.isin(c.bucket[pair_index], buckets), pair_index),
+         "bucket sorted by more than one method"),
+    )
+    if violation:
+        return violation
+    if index.size:
+        placed = np.bincount(buckets, minlength=state["bucket"].max() + 1)
+        sizes = np.bincount(state["bucket"], minlength=len(placed))
+        short = np.flatnonzero((placed > 0) & (placed != sizes))
+        if short.size:
+            last = int(index[np.flatnonzero(buckets == short[0])[-1]])
+            return Violation(last, f"bucket {short[0]} refilled with elements unplaced")
+        state["slot"][ids] = slots
+    return None
+
+
+def _check_gather(c, values, state) -> Violation | None:
+    index = np.flatnonzero((c.step_type == GATHER) & (c.depth == 0))
+    ids, buckets = c.first[index], c.bucket[index]
+    expected = np.argsort(values, kind="stable")
+    shared = min(len(ids), len(expected))
+    violation = _earliest(
+        (_first(c.output[index] != np.arange(len(index)), index), "wrong output index"),
+        (_first(buckets != state["bucket"][ids], index), "gathered from the wrong bucket"),
+        (_first(state["slot"][ids] != _rank_in_group(buckets), index),
+         "gathered out of slot order"),
+        (_first(ids[:shared] != expected[:shared], index[:shared]),
+         "gather order differs from sorted order"),
+    )
+    if violation:
+        return violation
+    if len(ids) != len(values):
+        after = int(index[-1]) + 1 if index.size else len(c)
+        return Violation(after, f"{len(ids)} of {len(values)} elements gathered")
+    state["gathered"] = ids
+    return None
+
+
+def _check_celebration(c, state) -> Violation | None:
+    index = np.flatnonzero(c.step_type == CELEBRATION)
+    last = len(c) - 1
+    if index.size != 1 or index[0] != last:
+        return Violation(int(index[0]) if index.size else last,
+                         "trace must end with exactly one celebration")
+    start, count = c.id_start[last], c.id_count[last]
+    if not np.array_equal(c.ids[start:start + count], state["gathered"]):
+        return Violation(last, "celebration does not cover all elements in sorted order")
+    return None
+
+
+def validate_log(
+    log: StepLog | Iterable[StepLog],
+    preset: SortPreset,
+    values: Sequence[int],
+) -> Violation | None:
+    """Check a step log (or a sequence of log chunks) against its input values.
+
+    Returns the first violation found, or None if the trace is valid.
+    """
+    c = _Columns([log] if isinstance(log, StepLog) else log)
+    values = np.asarray(values, dtype=np.int64)
+    n = len(values)
+    if len(c) == 0:
+        return Violation(0, "empty trace")
+    state = {
+        "bucket": np.full(n, -1, dtype=np.int64),
+        "slot": np.full(n, -1, dtype=np.int64),
+    }
+    return (
+        _check_structure(c, n)
+        or _check_scatter(c, preset, values, state)
+        or _check_parents(c, state)
+        or _check_sort(c, values, state)
+        or _check_gather(c, values, state)
+        or _check_celebration(c, state)
+    )
+
+
+def validate_trace(
+    path: Path,
+    preset: SortPreset | None = None,
+    values: Sequence[int] | None = None,
+) -> ValidationResult:
+    """Validate a trace file; preset and values default to the header's `meta`.
+
+    A custom preset is rebuilt from the bucketing recorded under "buckets".
+    """
+    start = time.perf_counter()
+    header = read_header(path)
+    meta = header["meta"]
+    if preset is None:
+        if "buckets" in meta:
+            buckets = meta["buckets"]
+            preset = custom_preset(
+                tuple(buckets["value_range"]), buckets["num_buckets"], buckets["bucket_size"],
+            )
+        elif meta.get("preset") in PRESETS:
+            preset = PRESETS[meta["preset"]]
+        else:
+            raise ValueError(f"{path}: no preset recorded; pass one explicitly")
+    if values is None:
+        if "values" not in meta:
+            raise ValueError(f"{path}: no input values recorded; pass them explicitly")
+        values = meta["values"]
+    if header["encoding"] == "columnar":
+        chunks = list(iter_columnar_chunks(path))
+    else:
+        chunks = [StepLog.from_steps(read_steps(path))]
+    violation = validate_log(chunks, preset, values)
+    return ValidationResult(
+        steps=sum(len(chunk) for chunk in chunks),
+        seconds=time.perf_counter() - start,
+        violation=violation,
+    )
@@ -1,6 +1,6 @@
 """Preset definitions for Small, Medium, and Large bucket sort configurations."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 @dataclass(frozen=True)
@@ -60,3 +60,21 @@ PRESETS: dict[str, SortPreset] = {
 }
 
 DEFAULT_PRESET = "small"
+
+
+def custom_preset(value_range: tuple[int, int], num_buckets: int, bucket_size: int) -> SortPreset:
+    """A preset named "custom" with the given bucketing, drawn like the large preset.
+
+    Traces of a custom preset record these three fields in their `meta`
+    under "buckets", so it can be rebuilt for validation.
+    """
+    low, high = value_range
+    return replace(
+        PRESETS["large"],
+        name="custom",
+        label=f"Custom ({low}\u2013{high})",
+        value_range=(low, high),
+        num_buckets=num_buckets,
+        bucket_size=bucket_size,
+        description=f"Derived from the loaded values: {num_buckets} buckets of {bucket_size}.",
+    )
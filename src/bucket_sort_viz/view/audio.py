@@ -0,0 +1,198 @@
+"""Step sound effects from a pre-synthesized tone bank.
+
+Synthesizing a tone per step during playback would put audio work inside the
+frame loop. Instead, `ToneBank` renders each tone once, into a
+`pygame.sndarray` buffer, on first use or all at once with `prewarm()`.
+There is one tone per (step type, pitch bucket). The pitch buckets divide
+the preset's value range, so higher values sound higher. The step type
+picks the waveform and length.
+
+`StepSounds` plays one frame's steps at a time, without blocking, on the
+mixer's channels. Steps that map to the same tone within a frame are
+coalesced, and at most `voices` tones start per frame (the latest ones).
+When every channel is busy, the longest-playing voice is stolen.
+
+Headless runs (tests, exports) work against SDL's dummy audio driver:
+set `SDL_AUDIODRIVER=dummy` before calling `init_mixer()`.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
+"""
+
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import pygame
+
+from bucket_sort_viz.config import (
+    AUDIO_BUFFER,
+    AUDIO_SAMPLE_RATE,
+    AUDIO_VOICES,
+    TONE_FREQ_RANGE,
+    TONE_PITCHES,
+    TONE_VOLUME,
+)
+from bucket_sort_viz.model.step import Step
+
+# Step type -> (waveform, seconds). Steps without an entry are silent.
+TONE_SHAPES: dict[str, tuple[str, float]] = {
+    "scatter": ("sine", 0.09),
+    "compare": ("triangle", 0.045),
+    "swap": ("square", 0.06),
+    "no_swap": ("triangle", 0.03),
+    "place": ("sine", 0.05),
+    "gather": ("sine", 0.11),
+}
+
+ATTACK_SECONDS = 0.004          # Linear fade-in, avoids clicks
+DECAY_RATE = 5.0                # Exponential decay constants over a tone's length
+
+
+def init_mixer(voices: int = AUDIO_VOICES) -> None:
+    """Open the mixer as 16-bit stereo with a small buffer and `voices` channels."""
+    pygame.mixer.pre_init(AUDIO_SAMPLE_RATE, -16, 2, AUDIO_BUFFER)
+    pygame.mixer.init()
+    pygame.mixer.set_num_channels(voices)
+
+
+def synthesize(
+    frequency: float,
+    seconds: float,
+    waveform: str = "sine",
+    sample_rate: int = AUDIO_SAMPLE_RATE,
+    channels: int = 2,
+    volume: float = TONE_VOLUME,
+) -> np.ndarray:
+    """Render one enveloped tone as int16 samples shaped (n, channels) (or (n,) for mono)."""
+    t = np.arange(max(1, round(seconds * sample_rate)), dtype=np.float32) / sample_rate
+    phase = (frequency * t) % 1.0
+    if waveform == "sine":
+        wave = np.sin(2 * np.pi * phase)
+    elif waveform == "triangle":
+        wave = 4 * np.abs(phase - 0.5) - 1
+    elif waveform == "square":
+        wave = np.where(phase < 0.5, 0.6, -0.6)        # Quieter: squares sound louder
+    else:
+        raise ValueError(f"Unknown waveform: {waveform!r}")
+    envelope = np.minimum(1.0, t / ATTACK_SECONDS) * np.exp(-DECAY_RATE * t / seconds)
+    samples = (wave * envelope * volume * 32767).astype(np.int16)
+    if channels == 1:
+        return samples
+    return np.repeat(samples[:, None], channels, axis=1)
+
+
+class ToneBank:
+    """Lazily synthesized `pygame.mixer.Sound`s, one per (step type, pitch bucket).
+
+    Args:
+        value_range: (low, high) values mapped onto the pitch buckets.
+        pitches: Number of pitch buckets.
+        volume: Peak amplitude of every tone (0..1).
+
+    Raises:
+        RuntimeError: If the mixer is not initialized.
+        ValueError: If the mixer's sample format is not signed 16-bit.
+    """
+
+    def __init__(
+        self,
+        value_range: tuple[int, int],
+        pitches: int = TONE_PITCHES,
+        volume: float = TONE_VOLUME,
+    ):
+        mixer = pygame.mixer.get_init()
+        if mixer is None:
+            raise RuntimeError("Mixer is not initialized; call init_mixer() first")
+        self.sample_rate, sample_format, self.channels = mixer
+        if sample_format != -16:
+            raise ValueError(f"Mixer must use signed 16-bit samples, not format {sample_format}")
+        self.value_range = value_range
+        self.pitches = pitches
+        self.volume = volume
+        self._sounds: dict[tuple[str, int], pygame.mixer.Sound] = {}
+
+    def __len__(self) -> int:
+        return len(self._sounds)
+
+    def pitch_of(self, value: int) -> int:
+        """Pitch bucket of a value (clamped to the range)."""
+        low, high = self.value_range
+        bucket = (value - low) * self.pitches // max(1, high - low + 1)
+        return min(self.pitches - 1, max(0, bucket))
+
+    def frequency(self, pitch: int) -> float:
+        """Frequency (Hz) of a pitch bucket, spaced exponentially over `TONE_FREQ_RANGE`."""
+        low, high = TONE_FREQ_RANGE
+        return low * (high / low) ** (pitch / max(1, self.pitches - 1))
+
+    def tone(self, step_type: str, pitch: int) -> pygame.mixer.Sound | None:
+        """The Sound for a step type and pitch bucket (None for silent step types)."""
+        key = (step_type, pitch)
+        sound = self._sounds.get(key)
+        if sound is None:
+            shape = TONE_SHAPES.get(step_type)
+            if shape is None:
+                return None
+            waveform, seconds = shape
+            samples = synthesize(
+                self.frequency(pitch), seconds, waveform,
+                self.sample_rate, self.channels, self.volume,
+            )
+            sound = self._sounds[key] = pygame.sndarray.make_sound(samples)
+        return sound
+
+    def prewarm(self) -> int:
+        """Synthesize every tone up front (e.g. at startup). Returns the bank size."""
+        for step_type in TONE_SHAPES:
+            for pitch in range(self.pitches):
+                self.tone(step_type, pitch)
+        return len(self._sounds)
+
+
+class StepSounds:
+    """Plays each frame's steps as tones on the mixer's channels.
+
+    Args:
+        bank: Tone source.
+        values: Input values, indexed by element ID.
+        voices: Most tones started per frame.
+
+    Attributes:
+        played: Tones started.
+        stolen: Tones that cut off a voice that was still playing.
+        dropped: Steps coalesced into another step's tone or over the per-frame limit.
+    """
+
+    def __init__(self, bank: ToneBank, values: Sequence[int], voices: int = AUDIO_VOICES):
+        self.bank = bank
+        self.values = values
+        self.voices = voices
+        self.played = 0
+        self.stolen = 0
+        self.dropped = 0
+
+    def play_steps(self, steps: Iterable[Step]) -> int:
+        """Start tones for the steps fired this frame. Returns how many started."""
+        keys: dict[tuple[str, int], None] = {}
+        fired = 0
+        for step in steps:
+            if step.step_type not in TONE_SHAPES or not step.element_ids:
+                continue
+            fired += 1
+            key = (step.step_type, self.bank.pitch_of(self.values[step.element_ids[0]]))
+            keys.pop(key, None)                      # Re-insert so the latest comes last
+            keys[key] = None
+        started = 0
+        for step_type, pitch in list(keys)[-self.voices:]:
+            channel = pygame.mixer.find_channel(True)  # Longest-playing voice if all busy
+            if channel is None:                        # Mixer has no channels at all
+                break
+            if channel.get_busy():
+                self.stolen += 1
+            channel.play(self.bank.tone(step_type, pitch))
+            started += 1
+        self.played += started
+        self.dropped += fired - started
+        return started
+
+    def play(self, step: Step) -> int:
+        return self.play_steps([step])
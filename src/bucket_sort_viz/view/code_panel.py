@@ -2,7 +2,7 @@
 
 import pygame
 
-from bucket_sort_viz.config import COLORS, PSEUDOCODE_LINES, load_font
+from bucket_sort_viz.config import CODE_HIGHLIGHT_ALPHA, COLORS, PSEUDOCODE_LINES, load_font
 
 
 class CodePanel:
@@ -15,7 +15,7 @@ class CodePanel:
 
     CODE_LEFT_MARGIN = 30
     CODE_TOP_OFFSET = 90       # Below branding + header
-    LINE_HEIGHT = 24
+    LINE_HEIGHT = 24           # Upper bound; shrunk to fit all lines in the panel
     HIGHLIGHT_PAD_X = 10
     HIGHLIGHT_PAD_Y = 2
 
@@ -71,9 +71,12 @@ class CodePanel:
         # Pseudocode lines
         code_x = self.x + self.CODE_LEFT_MARGIN
         code_start_y = self.y + self.CODE_TOP_OFFSET
+        line_height = min(
+            self.LINE_HEIGHT, (self.height - self.CODE_TOP_OFFSET) // len(PSEUDOCODE_LINES),
+        )
 
         for i, line in enumerate(PSEUDOCODE_LINES):
-            line_y = code_start_y + i * self.LINE_HEIGHT
+            line_y = code_start_y + i * line_height
 
             # Highlight bar for active line
             if i == active_line:
@@ -81,9 +84,9 @@ class CodePanel:
                     self.x + self.HIGHLIGHT_PAD_X,
                     line_y - self.HIGHLIGHT_PAD_Y,
                     self.width - 2 * self.HIGHLIGHT_PAD_X,
-                    self.LINE_HEIGHT,
+                    line_height,
                 )
-                highlight_color = (*COLORS["cyan_scatter"][:3], 40)
+                highlight_color = (*COLORS["cyan_scatter"][:3], CODE_HIGHLIGHT_ALPHA)
                 highlight_surface = pygame.Surface(
                     (highlight_rect.width, highlight_rect.height), pygame.SRCALPHA,
                 )
@@ -1,4 +1,306 @@
 """Glow, particles, and celebration effects.
 
-Stub for Brick 2 — full implementation in Brick 8.
+Particles live in a fixed-capacity, struct-of-arrays `ParticlePool`.
+Position, velocity, remaining and total life, and palette color index are
+preallocated NumPy arrays, so there are no per-particle Python objects for
+the garbage collector to scan:
+
+- Spawning pops slots off a free-slot stack, and deaths push them back.
+  Once the pool is full, further spawns are dropped rather than growing it.
+- `update(dt)` integrates gravity, motion and aging for every slot with
+  in-place array operations.
+- `draw()` blits one cached sprite per live particle, chosen by color and
+  by quantized fade level. The sprites are built once per pool.
+
+`spawn_celebration()` is the end-of-sort burst: tens of thousands of sparks
+fanned out of the sorted row in the phase colors.
+
+Glows are soft radial gradients. They are too expensive to compute per
+element per frame, so `GlowCache` pre-renders them once per (radius, color,
+intensity level) and composites them with `BLEND_ADD`. Intensities are
+quantized to `GLOW_INTENSITY_LEVELS`, so a pulsing glow cycles through a
+handful of sprites instead of making new ones. The cache is bounded and
+evicts the least recently used sprite first.
+
+Requires NumPy (`pip install bucket-sort-viz[numpy]`).
 """
+
+import math
+from collections import OrderedDict
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import pygame
+
+from bucket_sort_viz.config import (
+    CELEBRATION_PARTICLES,
+    COLORS,
+    GLOW_CACHE_SIZE,
+    GLOW_INTENSITY_LEVELS,
+    GLOW_PULSE_FLOOR,
+    GLOW_RADIUS_SCALE,
+    PARTICLE_CAPACITY,
+    PARTICLE_FADE_LEVELS,
+    PARTICLE_GRAVITY,
+    PARTICLE_LIFETIME,
+    PARTICLE_RADIUS,
+    PARTICLE_SPEED,
+    SCREEN_HEIGHT,
+    TIMING,
+)
+
+Color = tuple[int, int, int]
+
+CELEBRATION_PALETTE: tuple[Color, ...] = (
+    COLORS["cyan_scatter"],
+    COLORS["yellow_sort"],
+    COLORS["magenta_gather"],
+    COLORS["green_sorted"],
+)
+
+
+def _particle_sprite(color: Color, radius: int, alpha: int) -> pygame.Surface:
+    size = 2 * radius + 1
+    sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(sprite, (*color, alpha), (radius, radius), radius)
+    return sprite
+
+
+class ParticlePool:
+    """Preallocated particle storage with vectorized update and sprite drawing.
+
+    Args:
+        palette: Colors a particle's color index refers to.
+        capacity: Maximum number of live particles.
+        radius: Sprite radius in pixels.
+        seed: Seed for the pool's random launch angles, speeds and lifetimes.
+    """
+
+    def __init__(
+        self,
+        palette: Sequence[Color] = CELEBRATION_PALETTE,
+        capacity: int = PARTICLE_CAPACITY,
+        radius: int = PARTICLE_RADIUS,
+        seed: int | None = None,
+    ):
+        self.capacity = capacity
+        self.radius = radius
+        self.palette = tuple(palette)
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.life = np.zeros(capacity, dtype=np.float32)         # Seconds remaining
+        self.max_life = np.ones(capacity, dtype=np.float32)
+        self.color = np.zeros(capacity, dtype=np.uint8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Free slots form a stack; the top `_free_top` entries are available.
+        self._free = np.arange(capacity, dtype=np.int32)[::-1].copy()
+        self._free_top = capacity
+        self._step = np.zeros((capacity, 2), dtype=np.float32)  # Scratch for pos += vel * dt
+        self._rng = np.random.default_rng(seed)
+        # sprites[color * PARTICLE_FADE_LEVELS + level]; level 0 is the faintest. An
+        # object array so a frame's sprite list is one fancy index, not a Python loop.
+        self.sprites = np.empty(len(self.palette) * PARTICLE_FADE_LEVELS, dtype=object)
+        self.sprites[:] = [
+            _particle_sprite(color, radius, 255 * (level + 1) // PARTICLE_FADE_LEVELS)
+            for color in self.palette
+            for level in range(PARTICLE_FADE_LEVELS)
+        ]
+
+    @property
+    def count(self) -> int:
+        """Number of live particles."""
+        return self.capacity - self._free_top
+
+    def spawn(
+        self,
+        x: float | np.ndarray,
+        y: float | np.ndarray,
+        count: int,
+        color_index: int | np.ndarray = 0,
+        speed: tuple[float, float] = PARTICLE_SPEED,
+        angle: tuple[float, float] = (0.0, 2 * np.pi),
+        lifetime: tuple[float, float] = PARTICLE_LIFETIME,
+    ) -> int:
+        """Launch up to `count` particles from (x, y). Returns how many fit in the pool.
+
+        `x`, `y` and `color_index` are scalars or per-particle arrays of length
+        `count`. Angles are in radians, measured with y pointing down the screen.
+        """
+        n = min(count, self._free_top)
+        if n <= 0:
+            return 0
+        slots = self._free[self._free_top - n:self._free_top]
+        self._free_top -= n
+        rng = self._rng
+        theta = rng.uniform(*angle, n)
+        magnitude = rng.uniform(*speed, n)
+        self.pos[slots, 0] = np.broadcast_to(x, (count,))[:n]
+        self.pos[slots, 1] = np.broadcast_to(y, (count,))[:n]
+        self.vel[slots, 0] = magnitude * np.cos(theta)
+        self.vel[slots, 1] = magnitude * np.sin(theta)
+        self.life[slots] = self.max_life[slots] = rng.uniform(*lifetime, n)
+        self.color[slots] = np.broadcast_to(color_index, (count,))[:n]
+        self.alive[slots] = True
+        return n
+
+    def update(self, dt: float, floor: float = SCREEN_HEIGHT) -> int:
+        """Advance every particle by `dt` seconds. Returns how many died.
+
+        Particles die when their life runs out or they fall below `floor`.
+        Dead slots keep integrating harmlessly until they are reused.
+        """
+        self.vel[:, 1] += PARTICLE_GRAVITY * dt
+        np.multiply(self.vel, dt, out=self._step)
+        self.pos += self._step
+        self.life -= dt
+        dying = self.alive & ((self.life <= 0) | (self.pos[:, 1] > floor))
+        died = np.flatnonzero(dying).astype(np.int32)
+        if died.size:
+            self.alive[died] = False
+            self._free[self._free_top:self._free_top + died.size] = died
+            self._free_top += died.size
+        return int(died.size)
+
+    def clear(self) -> None:
+        """Kill every particle."""
+        self.alive[:] = False
+        self._free[:] = np.arange(self.capacity, dtype=np.int32)[::-1]
+        self._free_top = self.capacity
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Blit every live particle's sprite, faded by its remaining life."""
+        live = np.flatnonzero(self.alive)
+        if not live.size:
+            return
+        fade = self.life[live] / self.max_life[live]
+        level = np.minimum((fade * PARTICLE_FADE_LEVELS).astype(np.intp), PARTICLE_FADE_LEVELS - 1)
+        keys = self.color[live].astype(np.intp) * PARTICLE_FADE_LEVELS + level
+        corner = (self.pos[live] - self.radius).astype(np.int32)
+        surface.blits(zip(self.sprites[keys].tolist(), corner.tolist()), doreturn=False)
+
+
+def spawn_celebration(
+    pool: ParticlePool,
+    origins: Sequence[tuple[float, float]],
+    count: int = CELEBRATION_PARTICLES,
+) -> int:
+    """Fan `count` sparks upward out of `origins` (e.g. the sorted row's centers).
+
+    Particles are spread evenly over the origins, and each origin's sparks take
+    the next palette color in turn. Returns how many fit in the pool.
+    """
+    if not origins or count <= 0:
+        return 0
+    points = np.asarray(origins, dtype=np.float32)
+    which = np.arange(count) % len(points)
+    return pool.spawn(
+        points[which, 0],
+        points[which, 1],
+        count,
+        color_index=which % len(pool.palette),
+        angle=(-np.pi * 0.9, -np.pi * 0.1),          # Upward fan
+    )
+
+
+# ──────────────────────────────────────────────
+# Glow
+# ──────────────────────────────────────────────
+def glow_radius(circle_radius: int) -> int:
+    """Radius of the glow around an element circle of `circle_radius`."""
+    return round(circle_radius * GLOW_RADIUS_SCALE)
+
+
+def warmup_intensity(elapsed: float) -> float:
+    """Glow intensity ramping from 0 to 1 over `TIMING["scatter_glow_warmup"]`."""
+    return min(1.0, max(0.0, elapsed / TIMING["scatter_glow_warmup"]))
+
+
+def pulse_intensity(elapsed: float, period: float = TIMING["celebration_pulse_rate"]) -> float:
+    """Glow intensity pulsing between `GLOW_PULSE_FLOOR` and 1, once per `period` seconds."""
+    wave = 0.5 * (1 + math.cos(2 * math.pi * elapsed / period))
+    return GLOW_PULSE_FLOOR + (1 - GLOW_PULSE_FLOOR) * wave
+
+
+def _glow_sprite(radius: int, color: Color, intensity: float) -> pygame.Surface:
+    """Opaque RGB sprite fading from `color * intensity` at the center to black at `radius`."""
+    offsets = np.arange(-radius, radius + 1, dtype=np.float32)
+    distance = np.hypot(offsets[:, None], offsets[None, :]) / max(1, radius)
+    falloff = np.clip(1 - distance, 0, 1) ** 2 * intensity
+    pixels = (falloff[..., None] * np.asarray(color, dtype=np.float32)).astype(np.uint8)
+    return pygame.surfarray.make_surface(pixels)
+
+
+class GlowCache:
+    """Bounded LRU cache of radial glow sprites, drawn with additive blending.
+
+    Args:
+        capacity: Maximum number of sprites kept.
+        levels: Intensity levels (1..levels) sprites are quantized to.
+    """
+
+    def __init__(self, capacity: int = GLOW_CACHE_SIZE, levels: int = GLOW_INTENSITY_LEVELS):
+        self.capacity = capacity
+        self.levels = levels
+        self._sprites: OrderedDict[tuple[int, Color, int], pygame.Surface] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache (0.0 before any lookup)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def level(self, intensity: float) -> int:
+        """Quantized intensity level; 0 means too faint to draw."""
+        return round(min(1.0, max(0.0, intensity)) * self.levels)
+
+    def sprite(self, radius: int, color: Color, intensity: float) -> pygame.Surface | None:
+        """The cached glow sprite for these parameters (None when the level is 0)."""
+        level = self.level(intensity)
+        if level == 0:
+            return None
+        key = (radius, tuple(color), level)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._sprites.move_to_end(key)
+            return sprite
+        self.misses += 1
+        sprite = _glow_sprite(radius, key[1], level / self.levels)
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.capacity:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def draw(
+        self,
+        surface: pygame.Surface,
+        center: tuple[float, float],
+        radius: int,
+        color: Color,
+        intensity: float = 1.0,
+    ) -> None:
+        """Add one glow centered on `center`."""
+        self.draw_many(surface, [(center, radius, color, intensity)])
+
+    def draw_many(
+        self,
+        surface: pygame.Surface,
+        glows: Iterable[tuple[tuple[float, float], int, Color, float]],
+    ) -> None:
+        """Add every (center, radius, color, intensity) glow in one `blits()` call."""
+        batch = []
+        for (x, y), radius, color, intensity in glows:
+            sprite = self.sprite(radius, color, intensity)
+            if sprite is not None:
+                batch.append((sprite, (int(x) - radius, int(y) - radius), None, pygame.BLEND_ADD))
+        surface.blits(batch, doreturn=False)
+
+    def clear(self) -> None:
+        """Drop every sprite and reset the hit counters."""
+        self._sprites.clear()
+        self.hits = self.misses = 0
@@ -0,0 +1,343 @@
+"""Level-of-detail (LOD) rendering for element counts the circle layout can't fit.
+
+Past a few dozen elements, one circle per value no longer fits in the input
+row or the bucket stacks, and drawing thousands of circles per frame is far
+too slow. In LOD mode the input row, bucket contents, and output row are
+drawn as aggregated bars instead:
+
+- Input/output rows: one bar per run of adjacent positions. Bar height is the
+  mean value in the run, brightness is how full the run is.
+- Buckets: a value histogram over the bucket's (low, high) range.
+
+Aggregates are updated incrementally from scatter/gather steps (O(1) per step)
+and re-rasterized into a cached surface only when they change. Only the
+elements named by the current compare/swap step are drawn as circles.
+"""
+
+import pygame
+
+from bucket_sort_viz.config import (
+    COLORS,
+    INPUT_ROW_Y,
+    LOD_BAR_WIDTH,
+    LOD_COUNT_THRESHOLD,
+    LOD_MIN_CIRCLE_GAP,
+    LOD_ROW_HEIGHT,
+    OUTPUT_ROW_Y,
+    SCREEN_WIDTH,
+    SIDE_MARGIN,
+)
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.presets import SortPreset
+from bucket_sort_viz.view.elements import BucketRegion, CircleElement
+
+Color = tuple[int, int, int]
+
+BUCKET_INNER_PAD = 6    # Gap between bucket outline and histogram bars
+MIN_BAR_HEIGHT = 2      # Non-empty bins always show at least this much
+
+PHASE_COLORS: dict[str, Color] = {
+    "scatter": COLORS["cyan_scatter"],
+    "sort": COLORS["yellow_sort"],
+    "gather": COLORS["magenta_gather"],
+}
+
+
+def should_use_lod(count: int, circle_radius: int) -> bool:
+    """Decide whether `count` circles of `circle_radius` need LOD rendering.
+
+    Uses the same spacing as `Renderer._create_elements()`: if neighbouring
+    circles would overlap (or nearly touch), the row can't be drawn per element.
+    """
+    if count > LOD_COUNT_THRESHOLD:
+        return True
+    spacing = (SCREEN_WIDTH - 2 * SIDE_MARGIN) / (count + 1)
+    return spacing < 2 * circle_radius + LOD_MIN_CIRCLE_GAP
+
+
+def _blend(low: Color, high: Color, t: float) -> Color:
+    """Linear blend between two RGB colors (t=0 → low, t=1 → high)."""
+    return (
+        round(low[0] + (high[0] - low[0]) * t),
+        round(low[1] + (high[1] - low[1]) * t),
+        round(low[2] + (high[2] - low[2]) * t),
+    )
+
+
+class DensityRow:
+    """A row of positions aggregated into fixed-width bars.
+
+    Positions are input-list indices (input row) or output indices (output
+    row). Each bar covers a contiguous run of positions and tracks how many
+    of them are occupied and the sum of their values.
+
+    Attributes:
+        x, y: Top-left corner of the row.
+        width, height: Dimensions.
+        counts, sums: Per-bar occupancy and value sum.
+    """
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        width: float,
+        height: float,
+        positions: int,
+        value_range: tuple[int, int],
+        color: Color,
+    ):
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.positions = positions
+        self.value_range = value_range
+        self.color = color
+        self.num_bars = max(1, min(positions, int(width // LOD_BAR_WIDTH)))
+        self.counts = [0] * self.num_bars
+        self.sums = [0] * self.num_bars
+        self.capacity = [0] * self.num_bars
+        for bar in range(self.num_bars):
+            start = -(-bar * positions // self.num_bars)
+            end = -(-(bar + 1) * positions // self.num_bars)
+            self.capacity[bar] = end - start
+        self._cache: pygame.Surface | None = None
+        self._dirty = True
+
+    def bar_of(self, position: int) -> int:
+        """Bar index covering a row position."""
+        return position * self.num_bars // self.positions
+
+    def add(self, position: int, value: int) -> None:
+        bar = self.bar_of(position)
+        self.counts[bar] += 1
+        self.sums[bar] += value
+        self._dirty = True
+
+    def remove(self, position: int, value: int) -> None:
+        bar = self.bar_of(position)
+        self.counts[bar] -= 1
+        self.sums[bar] -= value
+        self._dirty = True
+
+    def set_color(self, color: Color) -> None:
+        if color != self.color:
+            self.color = color
+            self._dirty = True
+
+    def _render(self) -> pygame.Surface:
+        surf = pygame.Surface((int(self.width), int(self.height)), pygame.SRCALPHA)
+        low, high = self.value_range
+        span = max(1, high - low)
+        bar_w = self.width / self.num_bars
+        for bar, count in enumerate(self.counts):
+            if count == 0:
+                continue
+            mean = self.sums[bar] / count
+            bar_h = max(MIN_BAR_HEIGHT, round((mean - low) / span * self.height))
+            fill = count / self.capacity[bar]
+            color = _blend(COLORS["bg_dark"], self.color, 0.35 + 0.65 * fill)
+            left = int(bar * bar_w)
+            rect = pygame.Rect(left, int(self.height) - bar_h, max(1, int(bar_w) - 1), bar_h)
+            pygame.draw.rect(surf, color, rect)
+        return surf
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Blit the cached bars, re-rasterizing only after an update."""
+        if self._dirty or self._cache is None:
+            self._cache = self._render()
+            self._dirty = False
+        surface.blit(self._cache, (int(self.x), int(self.y)))
+
+
+class BucketHistogram:
+    """Value histogram drawn inside a bucket in place of its stacked circles.
+
+    Attributes:
+        bucket: The BucketRegion this histogram fills.
+        low, high: The bucket's inclusive value range.
+        counts: Per-bin element counts.
+        scale: Count that maps to a full-height bar (shared by all buckets).
+    """
+
+    def __init__(self, bucket: BucketRegion, low: int, high: int, scale: int):
+        self.bucket = bucket
+        self.low = low
+        self.high = high
+        self.scale = max(1, scale)
+        self.inner_width = max(1, bucket.width - 2 * BUCKET_INNER_PAD)
+        self.inner_height = max(1, bucket.height - 2 * BUCKET_INNER_PAD)
+        self.num_bins = max(1, min(high - low + 1, int(self.inner_width // LOD_BAR_WIDTH)))
+        self.counts = [0] * self.num_bins
+        self.total = 0
+        self.color = COLORS["cyan_scatter"]
+        self._cache: pygame.Surface | None = None
+        self._dirty = True
+
+    def bin_of(self, value: int) -> int:
+        return (value - self.low) * self.num_bins // (self.high - self.low + 1)
+
+    def add(self, value: int) -> None:
+        self.counts[self.bin_of(value)] += 1
+        self.total += 1
+        self._dirty = True
+
+    def remove(self, value: int) -> None:
+        self.counts[self.bin_of(value)] -= 1
+        self.total -= 1
+        self._dirty = True
+
+    def set_color(self, color: Color) -> None:
+        if color != self.color:
+            self.color = color
+            self._dirty = True
+
+    def _render(self) -> pygame.Surface:
+        w, h = int(self.inner_width), int(self.inner_height)
+        surf = pygame.Surface((w, h), pygame.SRCALPHA)
+        bin_w = self.inner_width / self.num_bins
+        for i, count in enumerate(self.counts):
+            if count == 0:
+                continue
+            bar_h = max(MIN_BAR_HEIGHT, round(min(1.0, count / self.scale) * h))
+            rect = pygame.Rect(int(i * bin_w), h - bar_h, max(1, int(bin_w) - 1), bar_h)
+            pygame.draw.rect(surf, self.color, rect)
+        return surf
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Blit the cached histogram over the bucket's fill."""
+        if self._dirty or self._cache is None:
+            self._cache = self._render()
+            self._dirty = False
+        surface.blit(
+            self._cache,
+            (int(self.bucket.x + BUCKET_INNER_PAD), int(self.bucket.y + BUCKET_INNER_PAD)),
+        )
+
+
+class LodScene:
+    """Aggregated input row, bucket histograms, and output row for one run.
+
+    Starts in the READY state (every value in the input row) and is advanced
+    by feeding it recorded steps in order via `apply_step()`.
+
+    Args:
+        preset: The sort preset (value range, bucket ranges, circle radius).
+        values: The unsorted values, indexed by element ID.
+        buckets: Laid-out bucket regions from the renderer.
+    """
+
+    def __init__(self, preset: SortPreset, values: list[int], buckets: list[BucketRegion]):
+        self.preset = preset
+        self.values = values
+        count = len(values)
+        row_x = SIDE_MARGIN
+        row_width = SCREEN_WIDTH - 2 * SIDE_MARGIN
+
+        self.input_row = DensityRow(
+            row_x, INPUT_ROW_Y - LOD_ROW_HEIGHT / 2, row_width, LOD_ROW_HEIGHT,
+            positions=max(1, count),
+            value_range=preset.value_range,
+            color=COLORS["element_default"],
+        )
+        self.output_row = DensityRow(
+            row_x, OUTPUT_ROW_Y - LOD_ROW_HEIGHT / 2, row_width, LOD_ROW_HEIGHT,
+            positions=max(1, count),
+            value_range=preset.value_range,
+            color=COLORS["magenta_gather"],
+        )
+        for element_id, value in enumerate(values):
+            self.input_row.add(element_id, value)
+
+        bucket_ranges = preset.generate_bucket_ranges()
+        self.histograms = [
+            BucketHistogram(bucket, low, high, scale=1)
+            for bucket, (low, high) in zip(buckets, bucket_ranges)
+        ]
+        self._set_histogram_scale()
+
+        # Two reusable circles for the elements of the current compare/swap.
+        radius = preset.circle_radius
+        self._pair = [CircleElement(-1, 0, 0, 0, radius), CircleElement(-1, 0, 0, 0, radius)]
+        self.active: list[CircleElement] = []
+
+    def _set_histogram_scale(self) -> None:
+        """Normalize bars to the tallest bin any bucket will ever reach."""
+        full = [[0] * hist.num_bins for hist in self.histograms]
+        bucket_size = self.preset.bucket_size
+        first = self.preset.value_range[0]
+        for value in self.values:
+            bucket_idx = (value - first) // bucket_size
+            full[bucket_idx][self.histograms[bucket_idx].bin_of(value)] += 1
+        scale = max((max(bins) for bins in full), default=1)
+        for hist in self.histograms:
+            hist.scale = max(1, scale)
+
+    def set_value(self, element_id: int, old: int, new: int) -> None:
+        """Replace an input-row value (READY state only); `values` is already updated."""
+        self.input_row.remove(element_id, old)
+        self.input_row.add(element_id, new)
+        self._set_histogram_scale()
+
+    def apply_step(self, step: Step) -> None:
+        """Advance the aggregated state by one recorded step."""
+        step_type = step.step_type
+        if step.depth:
+            self.active = []            # Re-bucketing keeps values in their top-level bucket
+        elif step_type == "scatter":
+            element_id = step.element_ids[0]
+            value = self.values[element_id]
+            self.input_row.remove(element_id, value)
+            self.histograms[step.bucket_index].add(value)
+            self.active = []
+        elif step_type in ("compare", "swap", "no_swap"):
+            self._show_pair(step)
+        elif step_type == "gather":
+            element_id = step.element_ids[0]
+            value = self.values[element_id]
+            self.histograms[step.bucket_index].remove(value)
+            self.output_row.add(step.output_index, value)
+            self.active = []
+        elif step_type == "place":
+            self.active = []            # Placement keeps the bucket's histogram as is
+        elif step_type == "celebration":
+            self.output_row.set_color(COLORS["green_sorted"])
+            self.active = []
+        elif step_type == "phase_change":
+            self.active = []
+            color = PHASE_COLORS.get(step.phase)
+            if color is not None:
+                for hist in self.histograms:
+                    hist.set_color(color)
+
+    def _show_pair(self, step: Step) -> None:
+        """Draw the two compared elements individually, centered in their bucket."""
+        bucket = self.histograms[step.bucket_index].bucket
+        left_id, right_id = step.element_ids
+        if step.step_type == "swap":
+            left_id, right_id = right_id, left_id
+        radius = self.preset.circle_radius
+        y = bucket.y + bucket.height / 2
+        for circle, element_id, dx in (
+            (self._pair[0], left_id, -(radius + 2)),
+            (self._pair[1], right_id, radius + 2),
+        ):
+            circle.element_id = element_id
+            circle.value = self.values[element_id]
+            circle.x = bucket.center_x + dx
+            circle.y = y
+            circle.color = (
+                COLORS["element_default"] if step.step_type == "no_swap"
+                else COLORS["yellow_sort"]
+            )
+        self.active = self._pair
+
+    def draw(self, surface: pygame.Surface) -> None:
+        """Draw rows, bucket histograms, and any individually shown elements."""
+        self.input_row.draw(surface)
+        self.output_row.draw(surface)
+        for hist in self.histograms:
+            hist.draw(surface)
+        for circle in self.active:
+            circle.draw(surface)
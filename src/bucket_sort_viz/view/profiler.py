@@ -0,0 +1,149 @@
+"""Per-frame render stage timing with an optional on-screen overlay.
+
+The renderer calls `begin_frame()`, then `mark(stage)` after each render
+stage, then `end_frame()`. Each mark costs one `perf_counter()` call and one
+array store, and the renderer skips all of it when no profiler is attached,
+so instrumentation can stay in production builds.
+"""
+
+import json
+import time
+from array import array
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import pygame
+
+from bucket_sort_viz.config import COLORS, PROFILE_HISTORY_FRAMES, load_font
+
+RENDER_STAGES: tuple[str, ...] = (
+    "background",
+    "buckets",
+    "elements",
+    "code_panel",
+    "overlay",
+    "present",
+)
+
+PERCENTILES = (50, 95, 99)
+
+
+def _percentile(sorted_samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of already-sorted samples."""
+    if not sorted_samples:
+        return 0.0
+    rank = max(0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1))
+    return sorted_samples[rank]
+
+
+class FrameProfiler:
+    """Fixed-size ring buffer of per-stage frame times (in seconds).
+
+    Args:
+        stages: Stage names, in the order they are marked each frame.
+        capacity: Number of most recent frames kept.
+        clock: Time source (injectable for tests).
+    """
+
+    OVERLAY_PAD = 8
+    OVERLAY_LINE_HEIGHT = 18
+
+    def __init__(
+        self,
+        stages: Sequence[str] = RENDER_STAGES,
+        capacity: int = PROFILE_HISTORY_FRAMES,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.stages = tuple(stages)
+        self.capacity = capacity
+        self._clock = clock
+        self._samples = {stage: array("d", bytes(8 * capacity)) for stage in self.stages}
+        self._intervals = array("d", bytes(8 * capacity))
+        self._slot = 0
+        self._filled = 0
+        self._frame_start = 0.0
+        self._last_mark = 0.0
+        self._prev_frame_start: float | None = None
+        self._font: pygame.font.Font | None = None
+
+    @property
+    def frames(self) -> int:
+        """Number of frames currently held in the ring buffer."""
+        return self._filled
+
+    def begin_frame(self) -> None:
+        now = self._clock()
+        slot = self._slot
+        for samples in self._samples.values():
+            samples[slot] = 0.0
+        prev = self._prev_frame_start
+        self._intervals[slot] = now - prev if prev is not None else 0.0
+        self._prev_frame_start = now
+        self._frame_start = now
+        self._last_mark = now
+
+    def mark(self, stage: str) -> None:
+        """Attribute the time since the previous mark to `stage`."""
+        now = self._clock()
+        self._samples[stage][self._slot] += now - self._last_mark
+        self._last_mark = now
+
+    def end_frame(self) -> None:
+        self._slot = (self._slot + 1) % self.capacity
+        self._filled = min(self._filled + 1, self.capacity)
+
+    def _recent(self, samples: array) -> list[float]:
+        if self._filled < self.capacity:
+            return list(samples[: self._filled])
+        return list(samples)
+
+    def fps(self) -> float:
+        """Mean frames per second over the buffered frames."""
+        intervals = [dt for dt in self._recent(self._intervals) if dt > 0]
+        return len(intervals) / sum(intervals) if intervals else 0.0
+
+    def summary(self) -> dict:
+        """Per-stage p50/p95/p99 and mean, in milliseconds."""
+        stages = {}
+        totals = [0.0] * self._filled
+        for stage in self.stages:
+            recent = self._recent(self._samples[stage])
+            for i, dt in enumerate(recent):
+                totals[i] += dt
+            stages[stage] = self._stats_ms(recent)
+        stages["total"] = self._stats_ms(totals)
+        return {"frames": self._filled, "fps": round(self.fps(), 2), "stages": stages}
+
+    @staticmethod
+    def _stats_ms(samples: list[float]) -> dict[str, float]:
+        ordered = sorted(samples)
+        stats = {f"p{pct}_ms": round(_percentile(ordered, pct) * 1000, 4) for pct in PERCENTILES}
+        stats["mean_ms"] = round(sum(ordered) / len(ordered) * 1000, 4) if ordered else 0.0
+        return stats
+
+    def dump_json(self, path: Path) -> Path:
+        """Write `summary()` to `path` (parent directories are created)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+        return path
+
+    def draw_overlay(self, surface: pygame.Surface) -> None:
+        """Draw FPS and the latest complete frame's stage breakdown (top-right)."""
+        if self._font is None:
+            self._font = load_font("label")
+        last = (self._slot - 1) % self.capacity
+        lines = [f"FPS {self.fps():5.1f}"]
+        if self._filled:
+            lines += [
+                f"{stage:<10} {self._samples[stage][last] * 1000:6.2f} ms"
+                for stage in self.stages
+            ]
+
+        surfs = [self._font.render(line, True, COLORS["text_primary"]) for line in lines]
+        width = max(s.get_width() for s in surfs) + 2 * self.OVERLAY_PAD
+        height = len(surfs) * self.OVERLAY_LINE_HEIGHT + 2 * self.OVERLAY_PAD
+        box = pygame.Surface((width, height), pygame.SRCALPHA)
+        box.fill((*COLORS["bg_menu"], 200))
+        for i, text_surf in enumerate(surfs):
+            box.blit(text_surf, (self.OVERLAY_PAD, self.OVERLAY_PAD + i * self.OVERLAY_LINE_HEIGHT))
+        surface.blit(box, (surface.get_width() - width - self.OVERLAY_PAD, self.OVERLAY_PAD))
@@ -9,29 +9,92 @@ from bucket_sort_viz.config import (
     COLORS,
     FPS,
     INPUT_ROW_Y,
+    OUTPUT_DIR,
     PANEL_HEIGHT,
     PANEL_TOP_Y,
+    PROFILE_OUTPUT_NAME,
     SCREEN_HEIGHT,
     SCREEN_WIDTH,
     SIDE_MARGIN,
     WINDOW_TITLE,
 )
+from bucket_sort_viz.model.step import Step
 from bucket_sort_viz.presets import SortPreset
 from bucket_sort_viz.view.code_panel import CodePanel
 from bucket_sort_viz.view.elements import BucketRegion, CircleElement
+from bucket_sort_viz.view.lod import LodScene, should_use_lod
+from bucket_sort_viz.view.profiler import FrameProfiler
+
+
+def layout_elements(preset: SortPreset, values: list[int]) -> list[CircleElement]:
+    """CircleElements for `values`, spaced evenly across the input row."""
+    count = len(values)
+    usable_width = SCREEN_WIDTH - 2 * SIDE_MARGIN
+    spacing = usable_width / (count + 1)
+
+    elements = []
+    for i, value in enumerate(values):
+        x = SIDE_MARGIN + spacing * (i + 1)
+        elements.append(CircleElement(
+            element_id=i,
+            value=value,
+            x=x,
+            y=INPUT_ROW_Y,
+            radius=preset.circle_radius,
+        ))
+    return elements
+
+
+def layout_buckets(preset: SortPreset) -> list[BucketRegion]:
+    """BucketRegions for the preset's buckets, positioned across the screen."""
+    num = preset.num_buckets
+    usable_width = SCREEN_WIDTH - 2 * SIDE_MARGIN
+    gap_total = BUCKET_GAP * (num - 1)
+    bucket_width = (usable_width - gap_total) / num
+    bucket_ranges = preset.generate_bucket_ranges()
+
+    buckets = []
+    for i, (low, high) in enumerate(bucket_ranges):
+        x = SIDE_MARGIN + i * (bucket_width + BUCKET_GAP)
+        label = f"{low}\u2013{high}"
+        buckets.append(BucketRegion(
+            bucket_index=i,
+            x=x,
+            y=BUCKET_TOP_Y,
+            width=bucket_width,
+            height=BUCKET_HEIGHT,
+            label=label,
+        ))
+    return buckets
 
 
 class Renderer:
     """Manages the Pygame window and draws the bucket sort visualization.
 
+    Switches to level-of-detail (LOD) rendering automatically when the values
+    can't be laid out one circle each (see `should_use_lod()`).
+
     Args:
         preset: The sort preset defining bucket count, ranges, circle radius.
         values: The unsorted values to display (one per element).
+        lod: Force LOD on or off. None (default) decides from count and radius.
+        profile: Time each render stage per frame and dump percentiles to
+            `OUTPUT_DIR` on exit. Off by default (near-zero cost when off).
+        profile_overlay: Also draw an FPS/stage-breakdown overlay (implies profile).
     """
 
-    def __init__(self, preset: SortPreset, values: list[int]):
+    def __init__(
+        self,
+        preset: SortPreset,
+        values: list[int],
+        lod: bool | None = None,
+        profile: bool = False,
+        profile_overlay: bool = False,
+    ):
         self.preset = preset
         self.values = values
+        self.profiler = FrameProfiler() if profile or profile_overlay else None
+        self.profile_overlay = profile_overlay
 
         pygame.init()
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -39,67 +102,92 @@ class Renderer:
         self.clock = pygame.time.Clock()
 
         # Build layout
-        self.elements = self._create_elements()
+        if lod is None:
+            lod = should_use_lod(len(values), preset.circle_radius)
+        self.lod = lod
         self.buckets = self._create_buckets()
+        if self.lod:
+            self.elements: list[CircleElement] = []
+            self.lod_scene: LodScene | None = LodScene(preset, values, self.buckets)
+        else:
+            self.elements = self._create_elements()
+            self.lod_scene = None
         self.code_panel = CodePanel(0, PANEL_TOP_Y, SCREEN_WIDTH, PANEL_HEIGHT)
 
     def _create_elements(self) -> list[CircleElement]:
-        """Create CircleElement instances positioned in the input row."""
-        count = len(self.values)
-        usable_width = SCREEN_WIDTH - 2 * SIDE_MARGIN
-        spacing = usable_width / (count + 1)
-
-        elements = []
-        for i, value in enumerate(self.values):
-            x = SIDE_MARGIN + spacing * (i + 1)
-            elements.append(CircleElement(
-                element_id=i,
-                value=value,
-                x=x,
-                y=INPUT_ROW_Y,
-                radius=self.preset.circle_radius,
-            ))
-        return elements
+        return layout_elements(self.preset, self.values)
 
     def _create_buckets(self) -> list[BucketRegion]:
-        """Create BucketRegion instances positioned across the screen."""
-        num = self.preset.num_buckets
-        usable_width = SCREEN_WIDTH - 2 * SIDE_MARGIN
-        gap_total = BUCKET_GAP * (num - 1)
-        bucket_width = (usable_width - gap_total) / num
-        bucket_ranges = self.preset.generate_bucket_ranges()
-
-        buckets = []
-        for i, (low, high) in enumerate(bucket_ranges):
-            x = SIDE_MARGIN + i * (bucket_width + BUCKET_GAP)
-            label = f"{low}\u2013{high}"
-            buckets.append(BucketRegion(
-                bucket_index=i,
-                x=x,
-                y=BUCKET_TOP_Y,
-                width=bucket_width,
-                height=BUCKET_HEIGHT,
-                label=label,
-            ))
-        return buckets
+        return layout_buckets(self.preset)
+
+    def set_value(self, element_id: int, value: int) -> None:
+        """Change one input value in the READY state without rebuilding the window.
+
+        Pair with `IncrementalSort.edit()` for interactive edits; the renderer
+        should be given its own copy of the values list.
+        """
+        old = self.values[element_id]
+        self.values[element_id] = value
+        if self.lod_scene is not None:
+            self.lod_scene.set_value(element_id, old, value)
+        else:
+            self.elements[element_id].value = value
+
+    def apply_step(self, step: Step) -> None:
+        """Advance the aggregated LOD view by one recorded step.
+
+        Only the LOD scene keeps per-step state here; per-circle motion is
+        driven by the animator's tweens.
+        """
+        if self.lod_scene is not None:
+            self.lod_scene.apply_step(step)
 
     def draw_ready_state(self, active_line: int = -1) -> None:
         """Draw the complete READY state frame."""
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin_frame()
+
         # Background
         self.screen.fill(COLORS["bg_dark"])
+        if profiler is not None:
+            profiler.mark("background")
 
         # Bucket regions
         for bucket in self.buckets:
             bucket.draw(self.screen)
+        if profiler is not None:
+            profiler.mark("buckets")
 
-        # Input row elements
+        # Input row elements (aggregated bars in LOD mode)
+        if self.lod_scene is not None:
+            self.lod_scene.draw(self.screen)
         for element in self.elements:
             element.draw(self.screen)
+        if profiler is not None:
+            profiler.mark("elements")
 
         # Code panel
         self.code_panel.draw(self.screen, active_line=active_line)
+        if profiler is not None:
+            profiler.mark("code_panel")
+            if self.profile_overlay:
+                profiler.draw_overlay(self.screen)
+                profiler.mark("overlay")
 
         pygame.display.flip()
+        if profiler is not None:
+            profiler.mark("present")
+            profiler.end_frame()
+
+    def capture_frame(self) -> bytes:
+        """Raw RGB bytes of the last drawn frame, for the export pipeline."""
+        return pygame.image.tobytes(self.screen, "RGB")
+
+    def dump_profile(self) -> None:
+        """Write frame-time percentiles to `OUTPUT_DIR` if profiling is enabled."""
+        if self.profiler is not None and self.profiler.frames:
+            self.profiler.dump_json(OUTPUT_DIR / PROFILE_OUTPUT_NAME)
 
     def run_static(self) -> None:
         """Run a static display loop showing the READY state. ESC or close to exit."""
@@ -115,4 +203,5 @@ class Renderer:
             self.draw_ready_state()
             self.clock.tick(FPS)
 
+        self.dump_profile()
         pygame.quit()
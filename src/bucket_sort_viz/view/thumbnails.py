@@ -0,0 +1,203 @@
+"""Preset preview thumbnails for the menu, rendered in the background and cached on disk.
+
+Each thumbnail is the preset's READY scene (bucket regions with their range
+labels, and a row of sample elements) drawn onto an off-screen surface the
+size of the area above the code panel, then downscaled to `THUMBNAIL_SIZE`.
+Nothing here needs a display mode, so previews can be built before the window
+opens.
+
+`PresetThumbnails.start()` loads every preview already cached under
+`OUTPUT_DIR / THUMBNAIL_DIR_NAME` and queues the rest on a single background
+thread, so the menu's first frame is never blocked on rendering. `get()`
+returns a placeholder until a preview is ready. The worker renders text
+under `FONT_LOCK`; hold it too when drawing text elsewhere while previews
+are pending. Cache files are named
+`<preset>-<key>.png`, where the key hashes the preset and every layout
+constant the scene depends on. Changing either renders a fresh file and
+removes the stale one.
+"""
+
+import dataclasses
+import hashlib
+import json
+import re
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from pathlib import Path
+
+import pygame
+
+from bucket_sort_viz.config import (
+    BUCKET_GAP,
+    BUCKET_HEIGHT,
+    BUCKET_TOP_Y,
+    COLORS,
+    ELEMENT_COUNT_DEFAULT,
+    FONTS,
+    INPUT_ROW_Y,
+    OUTPUT_DIR,
+    PANEL_TOP_Y,
+    SCREEN_WIDTH,
+    SIDE_MARGIN,
+    THUMBNAIL_DIR_NAME,
+    THUMBNAIL_SEED,
+    THUMBNAIL_SIZE,
+)
+from bucket_sort_viz.model.bucket_sort import generate_values
+from bucket_sort_viz.presets import PRESETS, SortPreset
+from bucket_sort_viz.view.renderer import layout_buckets, layout_elements
+
+KEY_LENGTH = 16
+FONT_LOCK = threading.Lock()                 # Serializes pygame.font use across threads
+
+
+def thumbnail_key(preset: SortPreset, size: tuple[int, int] = THUMBNAIL_SIZE) -> str:
+    """Short hash of everything a preset's thumbnail depends on."""
+    layout = {
+        "preset": dataclasses.asdict(preset),
+        "scene": [SCREEN_WIDTH, PANEL_TOP_Y, SIDE_MARGIN, INPUT_ROW_Y],
+        "buckets": [BUCKET_TOP_Y, BUCKET_HEIGHT, BUCKET_GAP],
+        "colors": COLORS,
+        "fonts": {key: [Path(spec["path"]).name, spec["size"]] for key, spec in FONTS.items()},
+        "sample": [ELEMENT_COUNT_DEFAULT, THUMBNAIL_SEED],
+        "size": list(size),
+    }
+    encoded = json.dumps(layout, sort_keys=True).encode()
+    return hashlib.sha256(encoded).hexdigest()[:KEY_LENGTH]
+
+
+def render_thumbnail(
+    preset: SortPreset, size: tuple[int, int] = THUMBNAIL_SIZE,
+) -> pygame.Surface:
+    """Draw the preset's READY scene off-screen and downscale it to `size`.
+
+    The bucket labels and element values are drawn with `pygame.font`, which
+    Pygame does not guarantee to be thread-safe. When this runs off the main
+    thread, hold `FONT_LOCK` (as `PresetThumbnails` does), and take the same
+    lock around any text the main thread renders while previews are pending.
+    """
+    pygame.font.init()                       # No-op once initialized; no display needed
+    scene = pygame.Surface((SCREEN_WIDTH, PANEL_TOP_Y))
+    scene.fill(COLORS["bg_dark"])
+    for bucket in layout_buckets(preset):
+        bucket.draw(scene)
+    values = generate_values(preset, ELEMENT_COUNT_DEFAULT, seed=THUMBNAIL_SEED)
+    for element in layout_elements(preset, values):
+        element.draw(scene)
+    return pygame.transform.smoothscale(scene, size)
+
+
+class PresetThumbnails:
+    """Menu previews of each preset, served from disk or rendered on a worker thread.
+
+    Args:
+        presets: Presets to preview, by name.
+        cache_dir: Directory of cached PNGs (created on `start()`).
+        size: Thumbnail (width, height).
+
+    Attributes:
+        loaded: Thumbnails read from the disk cache.
+        rendered: Thumbnails rendered (and cached) by the worker thread.
+        failed: Preset name -> exception, for previews that could not be rendered.
+    """
+
+    def __init__(
+        self,
+        presets: dict[str, SortPreset] = PRESETS,
+        cache_dir: Path | None = None,
+        size: tuple[int, int] = THUMBNAIL_SIZE,
+    ):
+        self.presets = presets
+        self.cache_dir = cache_dir if cache_dir is not None else OUTPUT_DIR / THUMBNAIL_DIR_NAME
+        self.size = size
+        self.loaded = 0
+        self.rendered = 0
+        self.failed: dict[str, BaseException] = {}
+        self._ready: dict[str, pygame.Surface] = {}
+        self._pending: dict[str, Future] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._placeholder: pygame.Surface | None = None
+
+    def __enter__(self) -> "PresetThumbnails":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def path(self, name: str) -> Path:
+        """Cache file for a preset's thumbnail at the current layout."""
+        return self.cache_dir / f"{name}-{thumbnail_key(self.presets[name], self.size)}.png"
+
+    def start(self) -> None:
+        """Load cached thumbnails now and queue the missing ones for rendering."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for name, preset in self.presets.items():
+            path = self.path(name)
+            own = re.compile(rf"{re.escape(name)}-[0-9a-f]{{{KEY_LENGTH}}}\.png")
+            for stale in self.cache_dir.glob(f"{name}-*.png"):
+                if stale != path and own.fullmatch(stale.name):
+                    stale.unlink()
+            if path.exists():
+                try:
+                    self._ready[name] = pygame.image.load(str(path))
+                    self.loaded += 1
+                    continue
+                except pygame.error:         # Truncated or corrupt: render it again
+                    path.unlink()
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(1, thread_name_prefix="thumbnails")
+            self._pending[name] = self._executor.submit(self._render, preset, path)
+
+    def _render(self, preset: SortPreset, path: Path) -> pygame.Surface:
+        with FONT_LOCK:
+            surface = render_thumbnail(preset, self.size)
+        partial = path.with_name(path.stem + ".partial.png")
+        pygame.image.save(surface, str(partial))
+        partial.replace(path)                # Never leave a half-written PNG under the real name
+        self.rendered += 1
+        return surface
+
+    def ready(self, name: str) -> bool:
+        """Whether the preset's thumbnail is available (collecting it if just finished)."""
+        future = self._pending.get(name)
+        if future is not None and future.done():
+            del self._pending[name]
+            if future.cancelled():               # Dropped by close()
+                return False
+            error = future.exception()
+            if error is None:
+                self._ready[name] = future.result()
+            else:
+                self.failed[name] = error
+        return name in self._ready
+
+    def get(self, name: str) -> pygame.Surface:
+        """The preset's thumbnail, or the placeholder while it is still rendering."""
+        if self.ready(name):
+            return self._ready[name]
+        return self.placeholder
+
+    @property
+    def placeholder(self) -> pygame.Surface:
+        """Empty bucket-colored panel shown in place of a thumbnail that isn't ready."""
+        if self._placeholder is None:
+            self._placeholder = pygame.Surface(self.size)
+            self._placeholder.fill(COLORS["bucket_fill"])
+            pygame.draw.rect(self._placeholder, COLORS["bucket_outline"],
+                             self._placeholder.get_rect(), 2)
+        return self._placeholder
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Block until queued thumbnails finish. Returns True if none are left pending."""
+        wait_futures(list(self._pending.values()), timeout)
+        for name in list(self._pending):
+            self.ready(name)
+        return not self._pending
+
+    def close(self) -> None:
+        """Stop the worker, dropping thumbnails that haven't started rendering."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
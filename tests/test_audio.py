@@ -0,0 +1,99 @@
+"""Tier 2: Tone bank synthesis and step playback (SDL dummy audio driver, no device)."""
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bucket_sort_viz.config import TONE_FREQ_RANGE, TONE_VOLUME  # noqa: E402
+from bucket_sort_viz.model.step import Step  # noqa: E402
+from bucket_sort_viz.view.audio import (  # noqa: E402
+    TONE_SHAPES,
+    StepSounds,
+    ToneBank,
+    init_mixer,
+    synthesize,
+)
+
+
+@pytest.fixture
+def mixer(monkeypatch):
+    """Mixer on SDL's dummy audio driver, for this test only."""
+    monkeypatch.setenv("SDL_AUDIODRIVER", "dummy")
+    init_mixer(voices=4)
+    yield
+    pygame.mixer.quit()
+
+
+def _step(step_type, element_id):
+    return Step(step_type, "scatter", [element_id])
+
+
+class TestSynthesize:
+    """Tones are int16, shaped for the mixer, within volume, and faded in."""
+
+    def test_shape_and_level(self):
+        samples = synthesize(440, 0.1, "sine", sample_rate=8000, channels=2)
+        assert samples.dtype == np.int16 and samples.shape == (800, 2)
+        assert np.abs(samples).max() <= TONE_VOLUME * 32767
+        assert samples[0, 0] == 0                          # Attack starts from silence
+
+    def test_mono(self):
+        assert synthesize(440, 0.01, "triangle", sample_rate=8000, channels=1).shape == (80,)
+
+    def test_unknown_waveform(self):
+        with pytest.raises(ValueError, match="saw"):
+            synthesize(440, 0.01, "saw")
+
+
+class TestToneBank:
+    """Values map to pitch buckets, tones are built once, and silent steps have none."""
+
+    def test_requires_mixer(self):
+        pygame.mixer.quit()
+        with pytest.raises(RuntimeError):
+            ToneBank((0, 99))
+
+    def test_pitch_buckets_cover_range(self, mixer):
+        bank = ToneBank((0, 99), pitches=10)
+        assert [bank.pitch_of(v) for v in (0, 9, 10, 99)] == [0, 0, 1, 9]
+        assert bank.pitch_of(-5) == 0 and bank.pitch_of(500) == 9
+        assert bank.frequency(0) == pytest.approx(TONE_FREQ_RANGE[0])
+        assert bank.frequency(9) == pytest.approx(TONE_FREQ_RANGE[1])
+
+    def test_tones_are_cached(self, mixer):
+        bank = ToneBank((0, 99))
+        sound = bank.tone("swap", 3)
+        assert isinstance(sound, pygame.mixer.Sound)
+        assert bank.tone("swap", 3) is sound
+        assert bank.tone("celebration", 3) is None
+        assert len(bank) == 1
+
+    def test_prewarm(self, mixer):
+        bank = ToneBank((0, 99), pitches=5)
+        assert bank.prewarm() == 5 * len(TONE_SHAPES)
+
+
+class TestStepSounds:
+    """Per-frame coalescing, the voice cap, and voice stealing."""
+
+    def test_same_tone_coalesces(self, mixer):
+        player = StepSounds(ToneBank((0, 99)), values=[10, 10, 90])
+        assert player.play_steps([_step("scatter", 0), _step("scatter", 1)]) == 1
+        assert player.play_steps([_step("scatter", 0), _step("scatter", 2)]) == 2
+        assert player.dropped == 1
+
+    def test_silent_steps_are_ignored(self, mixer):
+        player = StepSounds(ToneBank((0, 99)), values=[10])
+        assert player.play_steps([Step("phase_change", "sort", [])]) == 0
+        assert player.dropped == 0
+
+    def test_voice_cap_and_stealing(self, mixer):
+        values = list(range(0, 100, 4))
+        player = StepSounds(ToneBank((0, 99)), values=values, voices=4)
+        burst = [_step("gather", i) for i in range(len(values))]
+        assert player.play_steps(burst) == 4
+        assert player.dropped == len(values) - 4
+        assert player.play_steps(burst) == 4               # All 4 channels still sounding
+        assert player.stolen >= 1
+        assert player.played == 8
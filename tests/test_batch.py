@@ -0,0 +1,109 @@
+"""Tier 1: Batch manifest expansion, status tracking, and resume (no Pygame)."""
+
+import json
+import os
+
+import pytest
+
+from bucket_sort_viz.batch import (
+    STATUS_FILE,
+    BatchJob,
+    load_manifest,
+    load_status,
+    run_batch,
+    run_job,
+)
+from bucket_sort_viz.presets import PRESETS
+
+
+def _write_manifest(tmp_path, **overrides):
+    manifest = {"name": "t", "presets": ["small", "large"], "counts": [10, 12], "seeds": [0, 1]}
+    manifest.update(overrides)
+    path = tmp_path / "manifest.json"
+    path.write_text(json.dumps(manifest), encoding="utf-8")
+    return path
+
+
+class TestManifest:
+    """Verify manifests expand into the full presets × counts × seeds grid."""
+
+    def test_grid_expansion(self, tmp_path):
+        name, jobs = load_manifest(_write_manifest(tmp_path))
+        assert name == "t"
+        assert len(jobs) == 2 * 2 * 2
+        assert BatchJob("large", 12, 1) in jobs
+
+    def test_all_presets(self, tmp_path):
+        _, jobs = load_manifest(_write_manifest(tmp_path, presets="all", seeds=[0]))
+        assert {job.preset for job in jobs} == set(PRESETS)
+
+    def test_unknown_preset_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            load_manifest(_write_manifest(tmp_path, presets=["huge"]))
+
+
+class TestRunBatch:
+    """Verify outputs, status records, and resume behaviour."""
+
+    def test_runs_all_jobs_and_records_checksums(self, tmp_path):
+        name, jobs = load_manifest(_write_manifest(tmp_path))
+        report = run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        assert report.completed == len(jobs)
+        assert report.failed == 0
+        status = load_status(tmp_path / "batch" / name)
+        assert set(status) == {job.job_id for job in jobs}
+        assert all(len(r.outputs["trace.jsonl"]) == 64 for r in status.values())
+
+    def test_rerun_skips_finished_jobs(self, tmp_path):
+        name, jobs = load_manifest(_write_manifest(tmp_path))
+        run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        report = run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        assert report.skipped == len(jobs)
+        assert report.completed == 0
+
+    def test_corrupted_output_is_redone(self, tmp_path):
+        name, jobs = load_manifest(_write_manifest(tmp_path))
+        run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        trace = tmp_path / "batch" / name / jobs[0].job_id / "trace.jsonl"
+        trace.write_text("truncated", encoding="utf-8")
+        report = run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        assert report.completed == 1
+        assert report.skipped == len(jobs) - 1
+
+    def test_truncated_status_line_is_ignored(self, tmp_path):
+        name, jobs = load_manifest(_write_manifest(tmp_path))
+        run_batch(name, jobs[:2], workers=1, output_dir=tmp_path)
+        with (tmp_path / "batch" / name / STATUS_FILE).open("a", encoding="utf-8") as f:
+            f.write('{"job_id": "small-n1')
+        report = run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        assert report.skipped == 2
+        assert report.completed == len(jobs) - 2
+        assert len(load_status(tmp_path / "batch" / name)) == len(jobs)
+
+    def test_render_rerun_redoes_trace_only_jobs(self, tmp_path):
+        name, jobs = load_manifest(_write_manifest(tmp_path, presets=["small"], seeds=[0]))
+        run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        name, jobs = load_manifest(
+            _write_manifest(tmp_path, presets=["small"], seeds=[0], render=True),
+        )
+        report = run_batch(name, jobs, workers=1, output_dir=tmp_path)
+        assert report.completed == len(jobs) and report.skipped == 0
+        for job in jobs:
+            assert (tmp_path / "batch" / name / job.job_id / "ready.png").exists()
+        assert run_batch(name, jobs, workers=1, output_dir=tmp_path).skipped == len(jobs)
+
+
+class TestInProcessRender:
+    """A workers=1 render leaves the caller's environment and Pygame state alone."""
+
+    def test_environment_and_pygame_restored(self, tmp_path, monkeypatch):
+        pygame = pytest.importorskip("pygame")
+        monkeypatch.delenv("SDL_VIDEODRIVER", raising=False)
+        monkeypatch.setenv("PYGAME_HIDE_SUPPORT_PROMPT", "yes")
+        pygame.quit()
+        job = BatchJob("small", 10, 0, render=True)
+        result = run_job(job, tmp_path)
+        assert result.status == "ok", result.error
+        assert "SDL_VIDEODRIVER" not in os.environ
+        assert os.environ["PYGAME_HIDE_SUPPORT_PROMPT"] == "yes"
+        assert not pygame.get_init()
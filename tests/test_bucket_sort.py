@@ -2,7 +2,8 @@
 
 import pytest
 
-from bucket_sort_viz.model.bucket_sort import bucket_sort
+from bucket_sort_viz.model.bucket_sort import bucket_sort, generate_steps
+from bucket_sort_viz.model.stats import compute_stats
 from bucket_sort_viz.presets import PRESETS
 
 
@@ -93,3 +94,96 @@ class TestSortedOutputPreservesAllValues:
         preset = PRESETS[preset_name]
         original, sorted_vals, _ = bucket_sort(preset, count=15, seed=42)
         assert sorted(original) == sorted(sorted_vals)
+
+
+class TestCountingSortPath:
+    """Buckets at most `counting_width` values wide are counting-sorted."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    @pytest.mark.parametrize("seed", [0, 1, 42])
+    def test_sorted_output_matches_builtin(self, preset_name, seed):
+        preset = PRESETS[preset_name]
+        original, sorted_vals, _ = bucket_sort(
+            preset, count=15, seed=seed, counting_width=preset.bucket_size,
+        )
+        assert sorted_vals == sorted(original)
+
+    def test_duplicates_keep_input_order(self):
+        values = [7, 3, 7, 3, 7, 20, 3]
+        steps = list(generate_steps(PRESETS["small"], values, counting_width=25))
+        assert steps[-1].element_ids == [1, 3, 6, 0, 2, 4, 5]
+
+    def test_no_comparisons_when_all_buckets_are_narrow(self):
+        _, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=3, counting_width=25)
+        kinds = {step.step_type for step in steps}
+        assert "place" in kinds
+        assert kinds.isdisjoint({"compare", "swap", "no_swap"})
+
+    def test_wider_buckets_keep_insertion_sort(self):
+        preset = PRESETS["small"]
+        assert (bucket_sort(preset, count=15, seed=3, counting_width=24)
+                == bucket_sort(preset, count=15, seed=3))
+
+
+def _clustered(count, seed=0):
+    """Values packed into the low end of the small preset's first bucket."""
+    return [(i * 7 + seed) % 12 for i in range(count)]
+
+
+class TestRecursiveRebucketing:
+    """Buckets holding more than `split_load` elements are re-bucketed."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    def test_sorted_output_matches_builtin(self, preset_name):
+        preset = PRESETS[preset_name]
+        original, sorted_vals, _ = bucket_sort(preset, count=200, seed=5, split_load=4)
+        assert sorted_vals == sorted(original)
+
+    def test_same_order_as_plain_insertion_sort(self):
+        values = _clustered(120)
+        plain = list(generate_steps(PRESETS["small"], values))
+        split = list(generate_steps(PRESETS["small"], values, split_load=6))
+        assert split[-1].element_ids == plain[-1].element_ids
+
+    def test_nested_steps_stay_in_sort_phase(self):
+        steps = list(generate_steps(PRESETS["small"], _clustered(60), split_load=6))
+        nested = [s for s in steps if s.depth]
+        assert nested
+        assert all(s.phase == "sort" for s in nested)
+        assert {s.step_type for s in nested} >= {"scatter", "gather"}
+
+    def test_nested_steps_name_their_top_level_bucket(self):
+        steps = list(generate_steps(PRESETS["small"], _clustered(60), split_load=6))
+        top = {s.element_ids[0]: s.bucket_index
+               for s in steps if s.step_type == "scatter" and s.depth == 0}
+        for step in steps:
+            expected = top[step.element_ids[0]] if step.depth else -1
+            assert step.parent_bucket == expected
+        assert max(s.depth for s in steps) >= 2
+
+    def test_comparisons_are_bounded(self):
+        n, split_load = 400, 8
+        preset = PRESETS["small"]
+        plain = compute_stats(generate_steps(preset, _clustered(n)), preset.num_buckets)
+        split = compute_stats(
+            generate_steps(preset, _clustered(n), split_load=split_load), preset.num_buckets,
+        )
+        assert split.comparisons <= n * split_load // 2 + n < plain.comparisons
+
+    def test_stats_report_depth_and_loads(self):
+        preset = PRESETS["small"]
+        stats = compute_stats(
+            generate_steps(preset, _clustered(60), split_load=6), preset.num_buckets,
+        )
+        assert stats.bucket_loads == [60, 0, 0, 0]
+        assert stats.element_count == 60
+        assert stats.max_depth == 3          # 0-24 → 0-6 → 0-1 → single values
+        assert stats.sub_bucket_loads[:2] == [35, 25]   # First split: 0-6 and 7-13
+        assert stats.max_sub_bucket_load == 35
+
+    def test_depth_is_bounded_for_equal_values(self):
+        preset = PRESETS["small"]
+        stats = compute_stats(generate_steps(preset, [3] * 30, split_load=4), 4)
+        assert stats.max_depth == 3          # 25 values, fanout 4: ceil(log4(25)) levels
+        assert stats.comparisons == 29
+
@@ -0,0 +1,163 @@
+"""Tier 2: Particle pool and glow cache (Pygame surfaces, no display)."""
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bucket_sort_viz.config import GLOW_PULSE_FLOOR, PARTICLE_FADE_LEVELS  # noqa: E402
+from bucket_sort_viz.view.effects import (  # noqa: E402
+    GlowCache,
+    ParticlePool,
+    glow_radius,
+    pulse_intensity,
+    spawn_celebration,
+    warmup_intensity,
+)
+
+RED, BLUE = (255, 0, 0), (0, 0, 255)
+
+
+@pytest.fixture
+def pool():
+    return ParticlePool(palette=(RED, BLUE), capacity=100, seed=0)
+
+
+class TestParticlePool:
+    """Spawns fill free slots, deaths return them, and the pool never grows."""
+
+    def test_spawn_counts_live(self, pool):
+        assert pool.spawn(10, 20, 30) == 30
+        assert pool.count == 30 == int(pool.alive.sum())
+        assert np.all(pool.pos[pool.alive] == (10, 20))
+
+    def test_full_pool_drops_extra(self, pool):
+        assert pool.spawn(0, 0, 80) == 80
+        assert pool.spawn(0, 0, 80) == 20
+        assert pool.spawn(0, 0, 1) == 0
+        assert pool.count == pool.capacity
+
+    def test_deaths_free_slots_for_reuse(self, pool):
+        pool.spawn(0, 0, 100, lifetime=(0.5, 0.5))
+        assert pool.update(0.6, floor=1e9) == 100
+        assert pool.count == 0
+        assert pool.spawn(0, 0, 100) == 100
+        assert pool.count == 100
+
+    def test_partial_deaths(self, pool):
+        pool.spawn(0, 0, 40, lifetime=(0.2, 0.2))
+        pool.spawn(0, 0, 40, lifetime=(5.0, 5.0))
+        assert pool.update(0.3, floor=1e9) == 40
+        assert pool.count == 40
+        assert np.all(pool.life[pool.alive] > 4)
+
+    def test_falling_below_floor_kills(self, pool):
+        pool.spawn(0, 100, 10, speed=(0, 0))
+        assert pool.update(1.0, floor=50) == 10
+
+    def test_gravity_and_motion(self, pool):
+        pool.spawn(0, 0, 1, speed=(100, 100), angle=(0, 0))
+        pool.update(0.1, floor=1e9)
+        x, y = pool.pos[pool.alive][0]
+        assert x == pytest.approx(10, rel=1e-5)
+        assert y > 0                                       # Pulled down the screen
+
+    def test_clear(self, pool):
+        pool.spawn(0, 0, 50)
+        pool.clear()
+        assert pool.count == 0
+        assert pool.spawn(0, 0, 100) == 100
+
+    def test_per_particle_positions_and_colors(self, pool):
+        xs = np.arange(5, dtype=np.float32)
+        pool.spawn(xs, 7, 5, color_index=np.array([0, 1, 0, 1, 1]))
+        live = np.flatnonzero(pool.alive)
+        assert sorted(pool.pos[live, 0].tolist()) == xs.tolist()
+        assert int(pool.color[live].sum()) == 3
+
+
+class TestDrawing:
+    """Sprites are cached per color and fade level and land where particles are."""
+
+    def test_sprite_table(self, pool):
+        assert len(pool.sprites) == 2 * PARTICLE_FADE_LEVELS
+        faintest, brightest = pool.sprites[0], pool.sprites[PARTICLE_FADE_LEVELS - 1]
+        center = (pool.radius, pool.radius)
+        assert faintest.get_at(center).a < brightest.get_at(center).a == 255
+
+    def test_draw_colors_pixels(self, pool):
+        surface = pygame.Surface((50, 50))
+        pool.spawn(25, 25, 1, color_index=1, speed=(0, 0), lifetime=(1, 1))
+        pool.draw(surface)
+        assert surface.get_at((25, 25))[:3] == BLUE
+
+    def test_draw_empty_pool(self, pool):
+        surface = pygame.Surface((10, 10))
+        pool.draw(surface)
+        assert surface.get_at((5, 5))[:3] == (0, 0, 0)
+
+
+class TestCelebration:
+    def test_spreads_over_origins_and_palette(self, pool):
+        assert spawn_celebration(pool, [(10, 50), (90, 50)], count=60) == 60
+        live = np.flatnonzero(pool.alive)
+        assert set(pool.pos[live, 0].tolist()) == {10, 90}
+        assert np.all(pool.vel[live, 1] < 0)              # Fans upward
+        assert set(pool.color[live].tolist()) == {0, 1}
+
+    def test_no_origins(self, pool):
+        assert spawn_celebration(pool, [], count=10) == 0
+
+
+class TestGlowCache:
+    """Glow sprites are quantized, cached with a bound, and added onto the target."""
+
+    def test_quantized_intensities_share_a_sprite(self):
+        cache = GlowCache(levels=4)
+        first = cache.sprite(10, RED, 0.49)
+        assert cache.sprite(10, RED, 0.51) is first
+        assert cache.sprite(10, RED, 1.0) is not first
+        assert (cache.hits, cache.misses) == (1, 2)
+        assert cache.hit_rate == pytest.approx(1 / 3)
+
+    def test_faint_glow_is_skipped(self):
+        cache = GlowCache(levels=4)
+        assert cache.sprite(10, RED, 0.1) is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_bound(self):
+        cache = GlowCache(capacity=2, levels=4)
+        a = cache.sprite(5, RED, 1.0)
+        cache.sprite(5, BLUE, 1.0)
+        cache.sprite(5, RED, 1.0)                          # Refresh RED
+        cache.sprite(6, RED, 1.0)                          # Evicts BLUE
+        assert len(cache) == 2
+        assert cache.sprite(5, RED, 1.0) is a
+        misses = cache.misses
+        cache.sprite(5, BLUE, 1.0)
+        assert cache.misses == misses + 1
+
+    def test_gradient_falls_off(self):
+        sprite = GlowCache().sprite(8, RED, 1.0)
+        assert sprite.get_size() == (17, 17)
+        center, edge, corner = sprite.get_at((8, 8)), sprite.get_at((12, 8)), sprite.get_at((0, 0))
+        assert center.r == 255 and 0 < edge.r < center.r
+        assert corner[:3] == (0, 0, 0)
+
+    def test_draw_is_additive(self):
+        surface = pygame.Surface((40, 40))
+        surface.fill((0, 0, 200))
+        cache = GlowCache()
+        cache.draw_many(surface, [((20, 20), 8, RED, 1.0), ((20, 20), 8, RED, 1.0)])
+        assert tuple(surface.get_at((20, 20)))[:3] == (255, 0, 200)
+        assert tuple(surface.get_at((2, 2)))[:3] == (0, 0, 200)
+
+    def test_intensity_curves(self):
+        assert warmup_intensity(0) == 0
+        assert warmup_intensity(1e3) == 1
+        period = 0.4
+        assert pulse_intensity(0, period) == pytest.approx(1)
+        assert pulse_intensity(period / 2, period) == pytest.approx(GLOW_PULSE_FLOOR)
+
+    def test_glow_radius_scales(self):
+        assert glow_radius(10) > 10
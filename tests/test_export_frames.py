@@ -0,0 +1,99 @@
+"""Tier 1: Export frame deduplication and Matroska framing (no Pygame, no ffmpeg)."""
+
+import io
+
+import pytest
+
+from bucket_sort_viz.export.frames import DedupWriter
+from bucket_sort_viz.export.video import MatroskaStream, _encode_size
+
+
+class ListSink:
+    """Records (frame, duration) pairs written by DedupWriter."""
+
+    def __init__(self):
+        self.runs = []
+        self.closed = False
+
+    def write(self, frame, duration):
+        self.runs.append((frame, duration))
+
+    def close(self):
+        self.closed = True
+
+
+class TestDedupWriter:
+    """Verify consecutive identical frames collapse into one timed frame."""
+
+    def test_identical_frames_coalesce(self):
+        sink = ListSink()
+        writer = DedupWriter(sink)
+        for frame in [b"a", b"a", b"a", b"b", b"a", b"a"]:
+            writer.add_frame(frame)
+        writer.close()
+        assert sink.runs == [(b"a", 3), (b"b", 1), (b"a", 2)]
+        assert sink.closed
+
+    def test_known_holds_extend_duration(self):
+        sink = ListSink()
+        with DedupWriter(sink) as writer:
+            writer.add_frame(b"ready", hold=45)
+            writer.add_frame(b"ready")
+            writer.add_frame(b"next", hold=30)
+        assert sink.runs == [(b"ready", 46), (b"next", 30)]
+
+    def test_counters(self):
+        sink = ListSink()
+        writer = DedupWriter(sink)
+        for frame in [b"x"] * 10 + [b"y"] * 5:
+            writer.add_frame(frame)
+        writer.close()
+        assert writer.frames_in == 15
+        assert writer.frames_out == 2
+        assert writer.frames_saved == 13
+
+    def test_total_duration_preserved(self):
+        sink = ListSink()
+        frames = [bytes([i // 7]) for i in range(100)]
+        with DedupWriter(sink) as writer:
+            for frame in frames:
+                writer.add_frame(frame)
+        assert sum(duration for _, duration in sink.runs) == 100
+
+    def test_rejects_empty_hold(self):
+        with pytest.raises(ValueError):
+            DedupWriter(ListSink()).add_frame(b"a", hold=0)
+
+
+class TestMatroskaStream:
+    """Verify the streaming Matroska framing used for the ffmpeg pipe."""
+
+    def test_ebml_size_encoding(self):
+        assert _encode_size(0) == b"\x80"
+        assert _encode_size(126) == b"\xfe"
+        assert _encode_size(127) == b"\x40\x7f"  # 0x7f would be the reserved all-ones value
+        assert len(_encode_size(1694 * 924 * 3)) == 4
+
+    def test_header_declares_raw_rgb_track(self):
+        out = io.BytesIO()
+        MatroskaStream(out, width=4, height=2, fps=30)
+        data = out.getvalue()
+        assert data.startswith(b"\x1a\x45\xdf\xa3")
+        assert b"V_UNCOMPRESSED" in data
+        assert b"RGB\x18" in data
+
+    def test_frames_carry_timestamps_and_durations(self):
+        out = io.BytesIO()
+        muxer = MatroskaStream(out, width=2, height=1, fps=10)
+        muxer.write(b"\x01" * 6, duration=25)     # 2.5 s hold
+        muxer.write(b"\x02" * 6, duration=1)
+        data = out.getvalue()
+        assert data.count(b"\x01" * 6) == 1
+        assert b"\x9b\x82\x09\xc4" in data          # BlockDuration 2500 ms
+        assert b"\x81\x09\xc4\x00" in data          # second block starts at +2500 ms
+        assert muxer.duration_frames == 26
+
+    def test_rejects_wrong_frame_size(self):
+        muxer = MatroskaStream(io.BytesIO(), width=2, height=2)
+        with pytest.raises(ValueError):
+            muxer.write(b"\x00" * 5, duration=1)
@@ -0,0 +1,148 @@
+"""Tier 1: GIF writer palette, LZW, and delta framing (NumPy, no Pygame)."""
+
+import struct
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bucket_sort_viz.config import COLORS  # noqa: E402
+from bucket_sort_viz.export.gif import (  # noqa: E402
+    TRANSPARENT_INDEX,
+    ColorLookup,
+    GifWriter,
+    build_palette,
+    lzw_encode,
+)
+
+
+def _lzw_decode(data: bytes, min_code_size: int = 8) -> bytes:
+    """Reference GIF LZW decoder used to check the encoder."""
+    clear_code = 1 << min_code_size
+    end_code = clear_code + 1
+    bits = int.from_bytes(data, "little")
+    pos = 0
+    code_size = min_code_size + 1
+    table: list[bytes] = []
+    prev: bytes | None = None
+    out = bytearray()
+    while True:
+        code = (bits >> pos) & ((1 << code_size) - 1)
+        pos += code_size
+        if code == clear_code:
+            table = [bytes([i]) for i in range(clear_code)] + [b"", b""]
+            code_size = min_code_size + 1
+            prev = None
+            continue
+        if code == end_code:
+            return bytes(out)
+        if code < len(table):
+            entry = table[code]
+            if prev is not None:
+                table.append(prev + entry[:1])
+        else:
+            entry = prev + prev[:1]
+            table.append(entry)
+        out += entry
+        prev = entry
+        if len(table) == (1 << code_size) and code_size < 12:
+            code_size += 1
+
+
+def _read_frames(path):
+    """Return (delay, left, top, width, height, transparent_flag) per frame."""
+    data = path.read_bytes()
+    assert data[:6] == b"GIF89a"
+    pos = 13 + 256 * 3
+    frames = []
+    gce = None
+    while data[pos] != 0x3B:
+        if data[pos] == 0x21:
+            label = data[pos + 1]
+            if label == 0xF9:
+                packed, delay, _ = struct.unpack("<BHB", data[pos + 3:pos + 7])
+                gce = (delay, packed & 1)
+            pos += 2
+            while data[pos]:
+                pos += data[pos] + 1
+            pos += 1
+        else:
+            left, top, width, height, _ = struct.unpack("<HHHHB", data[pos + 1:pos + 10])
+            frames.append((gce[0], left, top, width, height, gce[1]))
+            pos += 11
+            while data[pos]:
+                pos += data[pos] + 1
+            pos += 1
+    return frames
+
+
+class TestPalette:
+    """Verify the global palette covers the scene's colors."""
+
+    def test_palette_fits_with_transparent_slot(self):
+        assert len(build_palette()) <= TRANSPARENT_INDEX
+
+    def test_scene_colors_map_exactly(self):
+        lookup = ColorLookup()
+        palette = build_palette()
+        rgb = np.array([list(COLORS.values())], dtype=np.uint8)
+        indices = lookup.map(rgb)[0]
+        assert [palette[i] for i in indices] == list(COLORS.values())
+
+    def test_unknown_color_maps_to_nearest(self):
+        lookup = ColorLookup()
+        palette = build_palette()
+        near_white = np.array([[[254, 254, 254]]], dtype=np.uint8)
+        assert palette[lookup.map(near_white)[0, 0]] == COLORS["element_active"]
+
+
+class TestLzw:
+    """Verify LZW output decodes back to the input."""
+
+    @pytest.mark.parametrize("size", [0, 1, 2, 300, 5000, 70000])
+    def test_round_trip(self, size):
+        rng = np.random.default_rng(size)
+        data = rng.integers(0, 12, size=size, dtype=np.uint8).tobytes()
+        assert _lzw_decode(lzw_encode(data)) == data
+
+    def test_round_trip_long_runs(self):
+        data = bytes([3]) * 50000 + bytes(range(256)) * 40
+        assert _lzw_decode(lzw_encode(data)) == data
+
+
+class TestGifWriter:
+    """Verify delta rectangles, transparency, and delays."""
+
+    def _frame(self, w, h, dots=()):
+        rgb = np.zeros((h, w, 3), dtype=np.uint8)
+        rgb[:] = COLORS["bg_dark"]
+        for x, y in dots:
+            rgb[y, x] = COLORS["cyan_scatter"]
+        return rgb.tobytes()
+
+    def test_delta_frames_cover_only_changed_rect(self, tmp_path):
+        path = tmp_path / "out.gif"
+        writer = GifWriter(path, 40, 30, fps=10)
+        writer.write(self._frame(40, 30), duration=15)
+        writer.write(self._frame(40, 30, dots=[(5, 6), (8, 9)]), duration=1)
+        writer.close()
+        frames = _read_frames(path)
+        assert frames[0] == (150, 0, 0, 40, 30, 0)
+        assert frames[1] == (10, 5, 6, 4, 4, 1)
+
+    def test_full_frame_mode(self, tmp_path):
+        path = tmp_path / "out.gif"
+        writer = GifWriter(path, 20, 10, fps=10, delta=False)
+        writer.write(self._frame(20, 10), duration=1)
+        writer.write(self._frame(20, 10, dots=[(1, 1)]), duration=1)
+        writer.close()
+        assert [f[1:] for f in _read_frames(path)] == [(0, 0, 20, 10, 0)] * 2
+
+    def test_unchanged_frame_extends_previous_delay(self, tmp_path):
+        path = tmp_path / "out.gif"
+        writer = GifWriter(path, 20, 10, fps=10)
+        writer.write(self._frame(20, 10), duration=2)
+        writer.write(self._frame(20, 10), duration=3)
+        writer.close()
+        assert writer.frames_written == 1
+        assert _read_frames(path)[0][0] == 50
@@ -0,0 +1,104 @@
+"""Tier 2: Thread-pooled PNG frame sequences (NumPy, Pygame surfaces, no display)."""
+
+import pygame
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bucket_sort_viz.export.frames import DedupWriter  # noqa: E402
+from bucket_sort_viz.export.png_sequence import PngSequenceWriter  # noqa: E402
+
+W, H = 40, 24
+
+
+def _frame(i: int) -> pygame.Surface:
+    surface = pygame.Surface((W, H))
+    surface.fill((10, 20, 30))
+    pygame.draw.rect(surface, (200, 100 + i, 50), (i, 3, 5, 7))
+    return surface
+
+
+def _pixels(path) -> np.ndarray:
+    return pygame.surfarray.array3d(pygame.image.load(str(path)))
+
+
+class TestPngSequenceWriter:
+    """Frames decode losslessly, land in order, and reuse a bounded buffer pool."""
+
+    def test_lossless_and_in_order(self, tmp_path):
+        frames = [_frame(i) for i in range(12)]
+        with PngSequenceWriter(tmp_path, W, H, workers=3, buffers=2) as writer:
+            for surface in frames:
+                writer.capture(surface)
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            f"frame_{i:06d}.png" for i in range(12)
+        ]
+        for i, surface in enumerate(frames):
+            np.testing.assert_array_equal(
+                _pixels(writer.path(i)), pygame.surfarray.array3d(surface),
+            )
+        assert writer.frames_written == 12
+        assert writer.bytes_written == sum(p.stat().st_size for p in tmp_path.iterdir())
+        assert writer.frames_per_second > 0
+
+    def test_capture_leaves_surface_unlocked(self, tmp_path):
+        surface = _frame(0)
+        with PngSequenceWriter(tmp_path, W, H, workers=1) as writer:
+            writer.capture(surface)
+            assert not surface.get_locked()
+            surface.fill((0, 0, 0))                        # Later draws don't reach the frame
+        assert tuple(_pixels(writer.path(0))[0, 0]) == (10, 20, 30)
+
+    def test_single_buffer_pool(self, tmp_path):
+        with PngSequenceWriter(tmp_path, W, H, workers=2, buffers=1) as writer:
+            for i in range(5):
+                writer.capture(_frame(i))
+        assert writer.frames_written == 5
+        assert writer._free.qsize() == 1
+
+    def test_holds_are_linked(self, tmp_path):
+        with PngSequenceWriter(tmp_path, W, H, workers=1) as writer:
+            writer.capture(_frame(0), hold=3)
+            writer.capture(_frame(1))
+        assert writer.frames_written == 4
+        assert writer.path(0).read_bytes() == writer.path(2).read_bytes()
+        assert writer.bytes_written == writer.path(0).stat().st_size + writer.path(3).stat().st_size
+
+    def test_behind_dedup_writer(self, tmp_path):
+        frames = [pygame.image.tobytes(_frame(i), "RGB") for i in (0, 0, 1, 1, 1)]
+        with DedupWriter(PngSequenceWriter(tmp_path, W, H, compression=1)) as dedup:
+            for frame in frames:
+                dedup.add_frame(frame)
+        assert len(list(tmp_path.iterdir())) == 5
+        np.testing.assert_array_equal(
+            _pixels(tmp_path / "frame_000004.png"), pygame.surfarray.array3d(_frame(1)),
+        )
+
+    def test_compression_levels(self, tmp_path):
+        sizes = {}
+        for level in (0, 9):
+            with PngSequenceWriter(tmp_path / str(level), W, H, compression=level) as writer:
+                writer.capture(_frame(0))
+            sizes[level] = writer.bytes_written
+        assert sizes[9] < sizes[0]
+        with pytest.raises(ValueError):
+            PngSequenceWriter(tmp_path, W, H, compression=10)
+
+    def test_worker_errors_surface_on_close(self, tmp_path):
+        writer = PngSequenceWriter(tmp_path, W, H, workers=1)
+        writer.path(0).mkdir()                             # The file can't be written
+        writer.capture(_frame(0))
+        with pytest.raises(OSError):
+            writer.close()
+
+    def test_rejected_frames_keep_no_buffer(self, tmp_path):
+        with PngSequenceWriter(tmp_path, W, H, workers=1, buffers=1) as writer:
+            frame = pygame.image.tobytes(_frame(0), "RGB")
+            for bad in ((frame, 0), (frame, 0), (frame[:-3], 1)):
+                with pytest.raises(ValueError):
+                    writer.write(*bad)
+            with pytest.raises(ValueError):
+                writer.capture(pygame.Surface((W + 1, H)))
+            writer.write(frame, 1)                         # Would block on a leaked buffer
+        assert writer.frames_written == 1
+        assert writer._free.qsize() == 1
@@ -0,0 +1,80 @@
+"""Tier 1: ffmpeg video export end to end (no Pygame; skipped without ffmpeg)."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from bucket_sort_viz.export.frames import DedupWriter
+from bucket_sort_viz.export.video import VideoWriter
+
+pytestmark = pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="Requires ffmpeg and ffprobe on PATH",
+)
+
+W, H, FPS = 64, 48, 10
+
+
+def _frame(shade: int) -> bytes:
+    return bytes([shade, 255 - shade, 128]) * (W * H)
+
+
+def _probe(path) -> dict:
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-select_streams", "v:0", "-count_frames",
+            "-show_entries", "stream=codec_name,width,height,nb_read_frames:format=duration",
+            "-of", "json", str(path),
+        ],
+        capture_output=True, check=True, text=True,
+    )
+    return json.loads(result.stdout)
+
+
+def _frame_times(path) -> list[float]:
+    """Presentation time of every encoded frame, in display order."""
+    result = subprocess.run(
+        [
+            "ffprobe", "-v", "error", "-select_streams", "v:0",
+            "-show_entries", "packet=pts_time", "-of", "json", str(path),
+        ],
+        capture_output=True, check=True, text=True,
+    )
+    return sorted(float(p["pts_time"]) for p in json.loads(result.stdout)["packets"])
+
+
+def _encode(path, holds: list[int], fps: int) -> None:
+    writer = VideoWriter(path, W, H, fps=fps)
+    for i, hold in enumerate(holds):
+        writer.write(_frame(i * 40 % 256), hold)
+    writer.close()
+
+
+class TestVideoWriter:
+    """A short clip is encoded through the Matroska pipe and probes as expected."""
+
+    def test_clip_probes(self, tmp_path):
+        path = tmp_path / "clip.mp4"
+        frames = [_frame(0)] * 10 + [_frame(100)] + [_frame(200)] * 9
+        with DedupWriter(VideoWriter(path, W, H, fps=FPS)) as writer:
+            for frame in frames:
+                writer.add_frame(frame)
+        info = _probe(path)
+        stream = info["streams"][0]
+        assert stream["codec_name"] == "h264"
+        assert (stream["width"], stream["height"]) == (W, H)
+        assert int(stream["nb_read_frames"]) == writer.frames_out == 3   # Holds encode once
+        assert _frame_times(path) == pytest.approx([0.0, 1.0, 1.1], abs=1e-3)
+
+    @pytest.mark.parametrize("holds", [
+        [45, 30, 75],
+        [1200, 1, 1200, 1],
+        [1, 7, 2, 30, 1, 1, 14, 3, 60, 1],
+    ])
+    def test_frames_start_at_hold_boundaries(self, tmp_path, holds):
+        path = tmp_path / "holds.mp4"
+        _encode(path, holds, fps=30)
+        starts = [sum(holds[:i]) / 30 for i in range(len(holds))]
+        assert _frame_times(path) == pytest.approx(starts, abs=1e-3)
@@ -0,0 +1,113 @@
+"""Tier 1: External-memory bucket sort over files (no Pygame)."""
+
+import random
+import tracemalloc
+from array import array
+
+import pytest
+
+from bucket_sort_viz.main import main
+from bucket_sort_viz.model.external import detect_format, external_sort
+from bucket_sort_viz.presets import PRESETS
+
+
+def _write_binary(path, values):
+    path.write_bytes(array("i", values).tobytes())
+
+
+def _read_binary(path):
+    values = array("i")
+    values.frombytes(path.read_bytes())
+    return values.tolist()
+
+
+@pytest.fixture
+def values():
+    rng = random.Random(3)
+    return [rng.randint(0, 999) for _ in range(20_000)]
+
+
+class TestExternalSort:
+    """Sorted output matches sorted() for every format and memory budget."""
+
+    def test_binary(self, tmp_path, values):
+        _write_binary(tmp_path / "in.bin", values)
+        report = external_sort(tmp_path / "in.bin", tmp_path / "out.bin", PRESETS["large"])
+        assert _read_binary(tmp_path / "out.bin") == sorted(values)
+        assert report.values == len(values)
+        assert report.bytes_in == report.bytes_out == 4 * len(values)
+        assert report.max_depth == 0
+
+    def test_text_to_binary(self, tmp_path, values):
+        (tmp_path / "in.txt").write_text("".join(f"{v}\n" for v in values))
+        external_sort(tmp_path / "in.txt", tmp_path / "out.bin", PRESETS["large"])
+        assert _read_binary(tmp_path / "out.bin") == sorted(values)
+
+    def test_text_round_trip(self, tmp_path, values):
+        (tmp_path / "in.csv").write_text("".join(f"{v}\n" for v in values) + "\n")
+        external_sort(tmp_path / "in.csv", tmp_path / "out.csv", PRESETS["large"])
+        assert [int(line) for line in (tmp_path / "out.csv").read_text().split()] == sorted(values)
+
+    def test_small_budget_rebuckets(self, tmp_path, values):
+        _write_binary(tmp_path / "in.bin", values)
+        report = external_sort(
+            tmp_path / "in.bin", tmp_path / "out.bin", PRESETS["large"], memory_limit=20_000,
+        )
+        assert _read_binary(tmp_path / "out.bin") == sorted(values)
+        assert report.max_depth >= 1
+        assert report.spill_bytes > 4 * len(values)
+
+    def test_single_value_bucket_is_copied(self, tmp_path):
+        values = [7] * 5000 + [3, 99]
+        _write_binary(tmp_path / "in.bin", values)
+        external_sort(
+            tmp_path / "in.bin", tmp_path / "out.bin", PRESETS["small"], memory_limit=4000,
+        )
+        assert _read_binary(tmp_path / "out.bin") == sorted(values)
+
+    def test_memory_is_bounded(self, tmp_path):
+        rng = random.Random(0)
+        values = [rng.randint(0, 999) for _ in range(200_000)]
+        _write_binary(tmp_path / "in.bin", values)
+        del values
+        tracemalloc.start()
+        try:
+            external_sort(
+                tmp_path / "in.bin", tmp_path / "out.bin", PRESETS["large"],
+                memory_limit=1 << 20,
+            )
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        assert peak < 2 << 20                # the input alone is 800 kB as int32, 7 MB as ints
+
+    def test_spill_files_are_removed(self, tmp_path, values):
+        _write_binary(tmp_path / "in.bin", values)
+        spill_dir = tmp_path / "spill"
+        spill_dir.mkdir()
+        external_sort(
+            tmp_path / "in.bin", tmp_path / "out.bin", PRESETS["large"],
+            memory_limit=20_000, spill_dir=spill_dir,
+        )
+        assert list(spill_dir.iterdir()) == []
+
+    def test_rejects_out_of_range(self, tmp_path):
+        _write_binary(tmp_path / "in.bin", [1, 2, 100])
+        with pytest.raises(ValueError, match="100"):
+            external_sort(tmp_path / "in.bin", tmp_path / "out.bin", PRESETS["small"])
+
+    def test_rejects_truncated_binary(self, tmp_path):
+        (tmp_path / "in.bin").write_bytes(b"\x01\x00\x00\x00\x02")
+        with pytest.raises(ValueError, match="Truncated"):
+            external_sort(tmp_path / "in.bin", tmp_path / "out.bin", PRESETS["small"])
+
+    def test_detect_format(self, tmp_path):
+        assert detect_format(tmp_path / "a.CSV") == "text"
+        assert detect_format(tmp_path / "a.i32") == "binary"
+
+    def test_cli(self, tmp_path, values, capsys):
+        _write_binary(tmp_path / "in.bin", values)
+        main(["--preset", "large", "--sort-file", str(tmp_path / "in.bin"),
+              str(tmp_path / "out.bin")])
+        assert _read_binary(tmp_path / "out.bin") == sorted(values)
+        assert "MB/s" in capsys.readouterr().out
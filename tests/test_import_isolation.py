@@ -0,0 +1,42 @@
+"""Tier 1: Engine-only import path never loads Pygame."""
+
+import subprocess
+import sys
+
+import pytest
+
+ENGINE_MODULES = [
+    "bucket_sort_viz.config",
+    "bucket_sort_viz.presets",
+    "bucket_sort_viz.model.step",
+    "bucket_sort_viz.model.bucket_sort",
+    "bucket_sort_viz.model.stats",
+    "bucket_sort_viz.model.step_log",
+    "bucket_sort_viz.model.trace_codec",
+    "bucket_sort_viz.model.trace_io",
+    "bucket_sort_viz.model.external",
+    "bucket_sort_viz.model.parallel",
+    "bucket_sort_viz.model.loaders",
+    "bucket_sort_viz.main",
+]
+
+
+def _pygame_loaded_after(code: str) -> bool:
+    probe = f"{code}\nimport sys\nprint('pygame' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", probe], capture_output=True, text=True, check=True,
+    )
+    return result.stdout.strip().splitlines()[-1] == "True"
+
+
+class TestEngineImports:
+    """Importing the model, presets, or CLI must not pull in Pygame."""
+
+    @pytest.mark.parametrize("module", ENGINE_MODULES)
+    def test_module_does_not_import_pygame(self, module):
+        assert not _pygame_loaded_after(f"import {module}")
+
+    @pytest.mark.parametrize("flag", ["--stats", "--trace-only"])
+    def test_cli_engine_modes_do_not_import_pygame(self, flag):
+        code = f"from bucket_sort_viz.main import main\nmain(['{flag}', '--seed', '1'])"
+        assert not _pygame_loaded_after(code)
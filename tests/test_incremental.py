@@ -0,0 +1,119 @@
+"""Tier 1: Incremental re-sort after single-value edits (no Pygame)."""
+
+import random
+
+import pytest
+
+from bucket_sort_viz.model.bucket_sort import bucket_sort, generate_steps, generate_values
+from bucket_sort_viz.model.incremental import IncrementalSort
+from bucket_sort_viz.presets import PRESETS
+
+
+def _full_rerun(preset, values):
+    """bucket_sort() on explicit values (same engine, fixed input)."""
+    steps = list(generate_steps(preset, values))
+    return list(values), [values[i] for i in steps[-1].element_ids], steps
+
+
+class TestIncrementalSort:
+    """Every edit yields exactly the trace of a full rerun."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    def test_initial_trace_matches_bucket_sort(self, preset_name):
+        preset = PRESETS[preset_name]
+        expected = bucket_sort(preset, count=15, seed=11)
+        assert IncrementalSort(preset, expected[0]).result() == expected
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    def test_random_edits_match_full_rerun(self, preset_name):
+        preset = PRESETS[preset_name]
+        rng = random.Random(preset_name)
+        values = generate_values(preset, 15, seed=5)
+        run = IncrementalSort(preset, values)
+        low, high = preset.value_range
+        for _ in range(50):
+            element_id = rng.randrange(len(values))
+            values[element_id] = rng.randint(low, high)
+            run.edit(element_id, values[element_id])
+            assert run.result() == _full_rerun(preset, values)
+
+    def test_counting_sort_edits_match_full_rerun(self):
+        preset = PRESETS["small"]
+        values = generate_values(preset, 15, seed=6)
+        run = IncrementalSort(preset, values, counting_width=25)
+        for element_id, value in [(0, 3), (4, 3), (9, 60), (0, 99)]:
+            values[element_id] = value
+            run.edit(element_id, value)
+            steps = list(generate_steps(preset, values, counting_width=25))
+            assert run.result()[2] == steps
+
+    def test_rebucketing_edits_match_full_rerun(self):
+        preset = PRESETS["small"]
+        values = [(i * 7) % 30 for i in range(40)]
+        run = IncrementalSort(preset, values, split_load=5)
+        for element_id, value in [(0, 3), (4, 3), (9, 60), (0, 12)]:
+            values[element_id] = value
+            run.edit(element_id, value)
+            assert run.result()[2] == list(generate_steps(preset, values, split_load=5))
+
+    def test_edit_within_bucket_touches_one_bucket(self):
+        preset = PRESETS["small"]
+        run = IncrementalSort(preset, [10, 30, 60, 90, 12])
+        assert run.edit(0, 5) == (0,)
+        assert run.sorted_values == [5, 12, 30, 60, 90]
+
+    def test_edit_across_buckets_touches_two(self):
+        preset = PRESETS["small"]
+        run = IncrementalSort(preset, [10, 30, 60, 90, 12])
+        assert run.edit(0, 95) == (0, 3)
+        assert run.sorted_values == [12, 30, 60, 90, 95]
+
+    def test_untouched_buckets_keep_their_steps(self):
+        preset = PRESETS["medium"]
+        values = generate_values(preset, 15, seed=2)
+        run = IncrementalSort(preset, values)
+        before = [list(steps) for steps in run._sort_steps]
+        touched = run.edit(0, values[0])
+        for bucket_idx, steps in enumerate(run._sort_steps):
+            if bucket_idx not in touched:
+                assert all(a is b for a, b in zip(steps, before[bucket_idx]))
+
+    def test_edit_rebuilds_only_the_spanned_buckets(self):
+        preset = PRESETS["medium"]
+        values = generate_values(preset, 30, seed=2)
+        run = IncrementalSort(preset, values)
+        scatter = list(run._scatter_steps)
+        gather = [list(steps) for steps in run._gather_steps]
+        element_id = run._members[1][0]
+        touched = run.edit(element_id, values[element_id])
+        for bucket_idx in range(preset.num_buckets):
+            if bucket_idx not in touched:
+                kept = zip(run._gather_steps[bucket_idx], gather[bucket_idx])
+                assert all(a is b for a, b in kept)
+                assert all(run._scatter_steps[i] is scatter[i] for i in run._members[bucket_idx])
+
+    def test_result_is_cached_until_edit(self):
+        run = IncrementalSort(PRESETS["small"], [10, 30, 60, 90, 12])
+        first, second = run.result()[2], run.result()[2]
+        assert first is not second and all(a is b for a, b in zip(first, second))
+        run.edit(0, 95)
+        assert run.result()[2][1] is not first[1]
+
+    def test_handed_out_steps_are_copies(self):
+        preset = PRESETS["small"]
+        values = [10, 30, 60, 90, 12, 15]
+        run = IncrementalSort(preset, values)
+        for step in run.iter_steps():
+            step.element_ids.append(0)
+            step.bucket_index = 99
+        for step in run.result()[2]:
+            step.slot_index = 99
+        values[5] = 40
+        run.edit(5, 40)
+        assert run.result() == _full_rerun(preset, values)
+
+    def test_rejects_out_of_range_value(self):
+        run = IncrementalSort(PRESETS["small"], [1, 2, 3])
+        with pytest.raises(ValueError):
+            run.edit(0, 100)
+        assert run.values == [1, 2, 3]
@@ -0,0 +1,155 @@
+"""Tier 1: Bulk input loaders for raw int32, .npy, and text/CSV value sets (NumPy, no Pygame)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bucket_sort_viz.main import main  # noqa: E402
+from bucket_sort_viz.model.loaders import (  # noqa: E402
+    check_range,
+    detect_input_format,
+    fit_preset,
+    load_npy,
+    load_raw,
+    load_text,
+    load_values,
+)
+from bucket_sort_viz.model.trace_io import read_header, write_ndjson  # noqa: E402
+from bucket_sort_viz.presets import PRESETS, custom_preset  # noqa: E402
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(5).integers(0, 1000, 10_000, dtype=np.int32)
+
+
+class TestBinary:
+    """Raw and .npy input is memory-mapped, not copied."""
+
+    def test_raw_is_mapped(self, tmp_path, values):
+        path = tmp_path / "in.bin"
+        values.astype("<i4").tofile(path)
+        loaded = load_raw(path)
+        assert isinstance(loaded, np.memmap) and not loaded.flags.writeable
+        np.testing.assert_array_equal(loaded, values)
+
+    def test_raw_truncated(self, tmp_path):
+        (tmp_path / "in.bin").write_bytes(b"\x01\x00\x00\x00\x02")
+        with pytest.raises(ValueError, match="multiple of 4"):
+            load_raw(tmp_path / "in.bin")
+
+    def test_raw_empty(self, tmp_path):
+        (tmp_path / "in.bin").write_bytes(b"")
+        assert load_raw(tmp_path / "in.bin").size == 0
+
+    def test_npy_is_mapped(self, tmp_path, values):
+        np.save(tmp_path / "in.npy", values.astype(np.int64))
+        loaded = load_npy(tmp_path / "in.npy")
+        assert isinstance(loaded, np.memmap)
+        np.testing.assert_array_equal(loaded, values)
+
+    def test_npy_must_be_1d_integers(self, tmp_path):
+        np.save(tmp_path / "floats.npy", np.zeros(4))
+        np.save(tmp_path / "grid.npy", np.zeros((2, 2), dtype=np.int32))
+        for name in ("floats.npy", "grid.npy"):
+            with pytest.raises(ValueError, match="1-D integer"):
+                load_npy(tmp_path / name)
+
+
+class TestText:
+    """Text is parsed chunk by chunk, with an optional header and column choice."""
+
+    def test_one_per_line_in_chunks(self, tmp_path, values):
+        (tmp_path / "in.txt").write_text("".join(f"{v}\n" for v in values) + "\n\n")
+        loaded = load_text(tmp_path / "in.txt", chunk_values=100)
+        np.testing.assert_array_equal(loaded, values)
+
+    def test_csv_column_by_index_skips_header(self, tmp_path):
+        (tmp_path / "in.csv").write_text("id,value\n1,42\n2,-7\n3, 8\n")
+        np.testing.assert_array_equal(load_text(tmp_path / "in.csv", column=1), [42, -7, 8])
+
+    def test_csv_column_from_the_end(self, tmp_path):
+        (tmp_path / "in.csv").write_text("id,value\n1,42\n2,7\n")
+        np.testing.assert_array_equal(load_text(tmp_path / "in.csv", column=-1), [42, 7])
+        (tmp_path / "short.csv").write_text("1,2\n3\n")
+        with pytest.raises(ValueError, match="field -2"):
+            load_text(tmp_path / "short.csv", column=-2)
+
+    def test_csv_column_by_name(self, tmp_path):
+        (tmp_path / "in.csv").write_text("id,value\n1,42\n2,7\n")
+        np.testing.assert_array_equal(load_text(tmp_path / "in.csv", column="value"), [42, 7])
+        with pytest.raises(ValueError, match="'score' not in header"):
+            load_text(tmp_path / "in.csv", column="score")
+
+    def test_bad_field(self, tmp_path):
+        (tmp_path / "in.csv").write_text("1,2\n3,x\n")
+        with pytest.raises(ValueError, match="b'3,x'"):
+            load_text(tmp_path / "in.csv", column=1)
+        with pytest.raises(ValueError, match="field 2"):
+            load_text(tmp_path / "in.csv", column=2)
+
+
+class TestPresets:
+    """Values are checked against a preset, or a covering preset is derived."""
+
+    def test_check_range(self):
+        check_range(np.array([0, 99]), PRESETS["small"])
+        with pytest.raises(ValueError, match="Value 100 is outside"):
+            check_range(np.array([5, 100, 200]), PRESETS["small"])
+
+    def test_fit_builtin(self):
+        assert fit_preset(np.array([3, 80])).name == "small"
+        assert fit_preset(np.array([3, 150])).name == "medium"
+        assert fit_preset(np.array([0, 999])).name == "large"
+
+    def test_fit_custom(self):
+        preset = fit_preset(np.array([-50, 12_345]))
+        assert preset.name == "custom" and preset.validate()
+        low, high = preset.value_range
+        assert low == -50 and high >= 12_345
+        assert preset.num_buckets == 10
+        assert preset == custom_preset(preset.value_range, 10, preset.bucket_size)
+
+    def test_load_values_detects_format(self, tmp_path, values):
+        assert detect_input_format(tmp_path / "a.NPY") == "npy"
+        assert detect_input_format(tmp_path / "a.csv") == "text"
+        assert detect_input_format(tmp_path / "a.dat") == "binary"
+        values.astype("<i4").tofile(tmp_path / "in.dat")
+        loaded, preset = load_values(tmp_path / "in.dat")
+        assert preset.name == "large" and loaded.size == values.size
+        with pytest.raises(ValueError, match="outside"):
+            load_values(tmp_path / "in.dat", PRESETS["small"])
+
+
+class TestCli:
+    def test_stats_from_input(self, tmp_path, capsys):
+        (tmp_path / "in.txt").write_text("150\n3\n42\n")
+        main(["--input", str(tmp_path / "in.txt"), "--stats"])
+        out = capsys.readouterr().out
+        assert "preset:      medium" in out and "elements:    3" in out
+
+    def test_input_outside_preset(self, tmp_path):
+        (tmp_path / "in.txt").write_text("150\n")
+        with pytest.raises(SystemExit):
+            main(["--input", str(tmp_path / "in.txt"), "--preset", "small", "--stats"])
+
+    def test_negative_column_is_an_index(self, tmp_path, capsys):
+        (tmp_path / "in.csv").write_text("id,value\n1,150\n2,3\n")
+        main(["--input", str(tmp_path / "in.csv"), "--column", "-1", "--stats"])
+        assert "preset:      medium" in capsys.readouterr().out
+
+    def test_fitted_preset_trace_validates(self, tmp_path, capsys):
+        values = np.array([-50, 12_345, 7, 400], dtype=np.int64)
+        np.save(tmp_path / "in.npy", values)
+        trace = tmp_path / "trace.jsonl"
+        main(["--input", str(tmp_path / "in.npy"), "--export-trace", str(trace)])
+        assert read_header(trace)["meta"]["buckets"]["num_buckets"] == 10
+        main(["--validate", str(trace)])
+        assert capsys.readouterr().out.splitlines()[-1].startswith("ok ")
+
+    def test_validate_reports_unrecorded_preset(self, tmp_path, capsys):
+        trace = tmp_path / "trace.jsonl"
+        write_ndjson(trace, [], meta={})
+        with pytest.raises(SystemExit):
+            main(["--validate", str(trace)])
+        assert "no preset recorded" in capsys.readouterr().out
@@ -0,0 +1,101 @@
+"""Tier 2: Level-of-detail aggregation state (Pygame surfaces, no display)."""
+
+import pygame
+import pytest
+
+from bucket_sort_viz.config import ELEMENT_COUNT_MAX, LOD_COUNT_THRESHOLD
+from bucket_sort_viz.model.bucket_sort import bucket_sort
+from bucket_sort_viz.presets import PRESETS
+from bucket_sort_viz.view.elements import BucketRegion
+from bucket_sort_viz.view.lod import LodScene, should_use_lod
+
+
+def _make_scene(preset, values):
+    buckets = [
+        BucketRegion(i, x=40 + i * 160, y=200, width=150, height=300, label="")
+        for i in range(preset.num_buckets)
+    ]
+    return LodScene(preset, values, buckets)
+
+
+class TestLodSwitch:
+    """Verify the automatic switch between circle and LOD layouts."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    def test_supported_counts_use_circles(self, preset_name):
+        preset = PRESETS[preset_name]
+        assert not should_use_lod(ELEMENT_COUNT_MAX, preset.circle_radius)
+
+    def test_above_count_threshold_uses_lod(self):
+        assert should_use_lod(LOD_COUNT_THRESHOLD + 1, circle_radius=1)
+
+    def test_circles_that_would_overlap_use_lod(self):
+        preset = PRESETS["small"]
+        assert should_use_lod(60, preset.circle_radius)
+
+
+class TestLodScene:
+    """Verify aggregates track scatter/gather steps incrementally."""
+
+    def test_ready_state_has_all_values_in_input_row(self):
+        preset = PRESETS["large"]
+        original, _, _ = bucket_sort(preset, count=500, seed=7)
+        scene = _make_scene(preset, original)
+        assert sum(scene.input_row.counts) == 500
+        assert sum(scene.output_row.counts) == 0
+        assert all(hist.total == 0 for hist in scene.histograms)
+
+    def test_set_value_updates_input_row(self):
+        preset = PRESETS["small"]
+        values = [10] * 200
+        scene = _make_scene(preset, values)
+        values[0] = 90
+        scene.set_value(0, 10, 90)
+        bar = scene.input_row.bar_of(0)
+        assert sum(scene.input_row.counts) == 200
+        assert scene.input_row.sums[bar] == 10 * (scene.input_row.counts[bar] - 1) + 90
+
+    def test_scatter_moves_values_into_bucket_histograms(self):
+        preset = PRESETS["medium"]
+        original, _, steps = bucket_sort(preset, count=300, seed=3)
+        scene = _make_scene(preset, original)
+        loads = [0] * preset.num_buckets
+        for step in steps:
+            if step.phase != "scatter":
+                break
+            scene.apply_step(step)
+            if step.step_type == "scatter":
+                loads[step.bucket_index] += 1
+        assert sum(scene.input_row.counts) == 0
+        assert [hist.total for hist in scene.histograms] == loads
+
+    def test_full_run_ends_with_sorted_output_row(self):
+        preset = PRESETS["small"]
+        original, _, steps = bucket_sort(preset, count=400, seed=11)
+        scene = _make_scene(preset, original)
+        for step in steps:
+            scene.apply_step(step)
+        assert all(hist.total == 0 for hist in scene.histograms)
+        assert scene.output_row.counts == scene.output_row.capacity
+        means = [s / c for s, c in zip(scene.output_row.sums, scene.output_row.counts)]
+        assert means == sorted(means)
+
+    def test_only_compared_elements_drawn_individually(self):
+        preset = PRESETS["small"]
+        original, _, steps = bucket_sort(preset, count=200, seed=5)
+        scene = _make_scene(preset, original)
+        compare = next(i for i, s in enumerate(steps) if s.step_type == "compare")
+        for step in steps[: compare + 1]:
+            scene.apply_step(step)
+        assert [c.element_id for c in scene.active] == steps[compare].element_ids
+        scene.apply_step(steps[-1])
+        assert scene.active == []
+
+    def test_draws_without_display(self):
+        preset = PRESETS["large"]
+        original, _, steps = bucket_sort(preset, count=250, seed=2)
+        scene = _make_scene(preset, original)
+        for step in steps:
+            scene.apply_step(step)
+        surface = pygame.Surface((1694, 924))
+        scene.draw(surface)
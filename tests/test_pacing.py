@@ -0,0 +1,93 @@
+"""Tier 1: Adaptive playback pacing within a target duration (no Pygame)."""
+
+import pytest
+
+from bucket_sort_viz.config import FPS, TIMING
+from bucket_sort_viz.model.bucket_sort import generate_steps, generate_values
+from bucket_sort_viz.model.pacing import natural_seconds, plan_pacing
+from bucket_sort_viz.model.step_log import StepLog
+from bucket_sort_viz.presets import PRESETS
+
+
+def _steps(preset_name, count, **options):
+    preset = PRESETS[preset_name]
+    values = generate_values(preset, count, seed=3)
+    return list(generate_steps(preset, values, describe=False, **options))
+
+
+def _assert_contiguous(plan, step_count):
+    assert plan.beats[0].start == 0 and plan.beats[0].frame == 0
+    assert plan.beats[-1].stop == step_count
+    for a, b in zip(plan.beats, plan.beats[1:]):
+        assert a.stop == b.start and a.frame + a.frames == b.frame
+    assert min(beat.frames for beat in plan.beats) >= 1
+
+
+class TestNaturalTime:
+    def test_staggered_runs(self):
+        types = ["scatter", "scatter", "scatter", "compare", "gather"]
+        phases = ["scatter", "scatter", "scatter", "sort", "gather"]
+        assert natural_seconds(types, phases) == [
+            TIMING["scatter_stagger"], TIMING["scatter_stagger"], TIMING["scatter_per_element"],
+            TIMING["sort_compare_hold"], TIMING["gather_per_element"],
+        ]
+
+
+class TestPlan:
+    """Short traces play untouched; long ones are compressed, batched, and bounded."""
+
+    def test_short_trace_is_not_compressed(self):
+        steps = _steps("small", 10)
+        plan = plan_pacing(steps, target_seconds=600)
+        assert len(plan.beats) == len(steps) and plan.skipped_steps == 0
+        assert plan.hold_scale == 1 and set(plan.phase_scales.values()) == {1.0}
+        assert plan.seconds == pytest.approx(plan.natural_seconds, abs=len(steps) / FPS)
+        _assert_contiguous(plan, len(steps))
+
+    @pytest.mark.parametrize("target", [1, 10, 60])
+    def test_long_trace_fits_target(self, target):
+        steps = _steps("large", 600)
+        plan = plan_pacing(steps, target_seconds=target)
+        assert plan.natural_seconds > target
+        assert plan.total_frames <= target * FPS
+        assert plan.total_frames >= target * FPS - 1
+        assert plan.skipped_steps > 0
+        _assert_contiguous(plan, len(steps))
+
+    def test_phases_compressed_separately(self):
+        plan = plan_pacing(_steps("large", 600), target_seconds=60)
+        scales = plan.phase_scales
+        assert set(scales) == {"scatter", "sort", "gather"}
+        assert all(0 < s < 1 for s in scales.values())
+        assert scales["sort"] < scales["scatter"]          # The quadratic phase shrinks most
+
+    def test_beats_stay_within_a_phase(self):
+        steps = _steps("medium", 200, split_load=8)
+        plan = plan_pacing(steps, target_seconds=30)
+        for beat in plan.beats:
+            if beat.frames > 1:
+                assert len({steps[i].phase for i in beat.steps}) == 1
+
+    def test_holds_shrink_for_tiny_targets(self):
+        plan = plan_pacing(_steps("small", 10), target_seconds=2)
+        assert plan.hold_scale < 1
+        assert plan.total_frames <= 2 * FPS
+
+    def test_step_log_matches_list(self):
+        steps = _steps("medium", 60)
+        assert plan_pacing(StepLog.from_steps(steps), 20) == plan_pacing(steps, 20)
+
+    def test_beat_at(self):
+        plan = plan_pacing(_steps("large", 500), target_seconds=20)
+        beat = plan.beats[len(plan.beats) // 2]
+        assert plan.beat_at(beat.frame) is beat
+        assert plan.beat_at(beat.frame + beat.frames - 1) is beat
+        assert plan.beat_at(plan.total_frames) is None
+        assert plan.beat_at(-1) is None
+
+    def test_target_shorter_than_a_frame(self):
+        with pytest.raises(ValueError, match="shorter than one frame"):
+            plan_pacing(_steps("small", 10), target_seconds=0.01)
+
+    def test_empty(self):
+        assert plan_pacing([], 10).total_frames == 0
@@ -0,0 +1,62 @@
+"""Tier 1: Shared-memory multi-core bucket sort (NumPy, no Pygame)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bucket_sort_viz.model.parallel import (  # noqa: E402
+    _partition_edges,
+    _partition_step,
+    parallel_sort,
+)
+from bucket_sort_viz.presets import PRESETS  # noqa: E402
+
+
+@pytest.fixture
+def values():
+    return np.random.default_rng(4).integers(0, 1000, 50_000, dtype=np.int32)
+
+
+class TestParallelSort:
+    """Sorted shared-memory output matches np.sort for any worker count."""
+
+    @pytest.mark.parametrize("workers", [1, 2, 3])
+    def test_matches_numpy(self, values, workers):
+        with parallel_sort(PRESETS["large"], values, workers) as result:
+            np.testing.assert_array_equal(result.values, np.sort(values))
+            assert result.workers == workers
+
+    def test_offsets_delimit_partitions(self, values):
+        preset = PRESETS["large"]
+        with parallel_sort(preset, values, 2) as result:
+            edges = _partition_edges(preset, _partition_step(preset, 2 * 4))
+            offsets = result.offsets
+            assert offsets[0] == 0 and offsets[-1] == len(values)
+            assert np.all(np.diff(offsets) >= 0)
+            for p in range(len(edges) - 1):
+                part = result.values[offsets[p]:offsets[p + 1]]
+                assert np.all((part >= edges[p]) & (part < edges[p + 1]))
+
+    def test_partitions_cut_buckets_evenly(self):
+        # 10 buckets of 100: 8 partitions need no cut, 40 need 4 per bucket.
+        assert _partition_step(PRESETS["large"], 8) == 100
+        assert _partition_step(PRESETS["large"], 40) == 25
+        # 25 has no divisor between 5 and 25, so 4 buckets x 6 wanted -> 5 cuts.
+        assert _partition_step(PRESETS["small"], 24) == 5
+        edges = _partition_edges(PRESETS["small"], 5)
+        assert edges[0] == 0 and edges[-1] == 100 and len(edges) == 21
+
+    def test_python_list_and_empty_input(self):
+        with parallel_sort(PRESETS["small"], [5, 99, 0, 5]) as result:
+            assert result.values.tolist() == [0, 5, 5, 99]
+        with parallel_sort(PRESETS["small"], [], 2) as result:
+            assert result.values.size == 0
+
+    def test_rejects_out_of_range(self):
+        with pytest.raises(ValueError, match="100"):
+            parallel_sort(PRESETS["small"], [1, 2, 100])
+
+    def test_close_frees_view(self, values):
+        result = parallel_sort(PRESETS["large"], values, 1)
+        result.close()
+        assert result.values.size == 0
@@ -0,0 +1,75 @@
+"""Tier 2: Frame profiler ring buffer and JSON export (no display)."""
+
+import json
+
+import pytest
+
+from bucket_sort_viz.view.profiler import FrameProfiler
+
+
+class FakeClock:
+    """Deterministic time source advanced manually by the test."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _run_frame(profiler, clock, durations):
+    profiler.begin_frame()
+    for stage, seconds in durations.items():
+        clock.now += seconds
+        profiler.mark(stage)
+    profiler.end_frame()
+
+
+class TestFrameProfiler:
+    """Verify per-stage timing, ring-buffer wraparound, and percentiles."""
+
+    def test_stage_times_recorded(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(stages=("a", "b"), capacity=8, clock=clock)
+        _run_frame(profiler, clock, {"a": 0.002, "b": 0.010})
+        summary = profiler.summary()
+        assert summary["frames"] == 1
+        assert summary["stages"]["a"]["p50_ms"] == pytest.approx(2.0)
+        assert summary["stages"]["b"]["p50_ms"] == pytest.approx(10.0)
+        assert summary["stages"]["total"]["p50_ms"] == pytest.approx(12.0)
+
+    def test_ring_buffer_keeps_only_latest_frames(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(stages=("a",), capacity=4, clock=clock)
+        for ms in (100, 100, 1, 1, 1, 1):
+            _run_frame(profiler, clock, {"a": ms / 1000})
+        summary = profiler.summary()
+        assert summary["frames"] == 4
+        assert summary["stages"]["a"]["p99_ms"] == pytest.approx(1.0)
+
+    def test_percentiles(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(stages=("a",), capacity=100, clock=clock)
+        for ms in range(1, 101):
+            _run_frame(profiler, clock, {"a": ms / 1000})
+        stats = profiler.summary()["stages"]["a"]
+        assert stats["p50_ms"] == pytest.approx(50.0)
+        assert stats["p95_ms"] == pytest.approx(95.0)
+        assert stats["p99_ms"] == pytest.approx(99.0)
+
+    def test_fps_from_frame_intervals(self):
+        clock = FakeClock()
+        profiler = FrameProfiler(stages=("a",), capacity=16, clock=clock)
+        for _ in range(10):
+            _run_frame(profiler, clock, {"a": 0.001})
+            clock.now += 0.049  # 50 ms per frame → 20 FPS
+        assert profiler.fps() == pytest.approx(20.0)
+
+    def test_dump_json(self, tmp_path):
+        clock = FakeClock()
+        profiler = FrameProfiler(stages=("a",), capacity=4, clock=clock)
+        _run_frame(profiler, clock, {"a": 0.005})
+        path = profiler.dump_json(tmp_path / "out" / "profile.json")
+        data = json.loads(path.read_text(encoding="utf-8"))
+        assert set(data["stages"]) == {"a", "total"}
+        assert set(data["stages"]["a"]) == {"p50_ms", "p95_ms", "p99_ms", "mean_ms"}
@@ -0,0 +1,51 @@
+"""Tier 2: READY-state rendering under SDL's dummy video driver (no display)."""
+
+import hashlib
+
+import pygame
+import pytest
+
+from bucket_sort_viz.model.bucket_sort import generate_values
+from bucket_sort_viz.presets import PRESETS
+from bucket_sort_viz.view.renderer import Renderer
+
+
+@pytest.fixture(autouse=True)
+def _dummy_video(monkeypatch):
+    """Dummy SDL video for this module's tests only; Pygame is shut down after each."""
+    monkeypatch.setenv("SDL_VIDEODRIVER", "dummy")
+    yield
+    pygame.quit()
+
+
+def _checksum(renderer, active_line=-1):
+    renderer.draw_ready_state(active_line=active_line)
+    return hashlib.sha256(renderer.capture_frame()).hexdigest()
+
+
+class TestHeadlessRender:
+    """Frames render without a display and are pixel-deterministic."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    @pytest.mark.parametrize("count", [10, 1000])
+    def test_frame_is_deterministic(self, preset_name, count):
+        values = generate_values(PRESETS[preset_name], count, seed=0)
+        first = _checksum(Renderer(PRESETS[preset_name], values))
+        assert _checksum(Renderer(PRESETS[preset_name], list(values))) == first
+
+    def test_checksum_sees_changes(self):
+        preset = PRESETS["small"]
+        renderer = Renderer(preset, generate_values(preset, 10, seed=0))
+        before = _checksum(renderer)
+        assert _checksum(renderer, active_line=3) != before
+        renderer.set_value(0, 99 if renderer.values[0] != 99 else 0)
+        assert _checksum(renderer) != before
+
+    def test_profiler_records_frames(self):
+        preset = PRESETS["large"]
+        renderer = Renderer(preset, generate_values(preset, 15, seed=0), profile=True)
+        for _ in range(5):
+            renderer.draw_ready_state()
+        summary = renderer.profiler.summary()
+        assert summary["frames"] == 5
+        assert summary["stages"]["total"]["p50_ms"] > 0
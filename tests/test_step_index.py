@@ -0,0 +1,108 @@
+"""Tier 1: Inverted step indexes and range queries (no Pygame)."""
+
+import pytest
+
+from bucket_sort_viz.model.bucket_sort import generate_steps, generate_values
+from bucket_sort_viz.model.step import Step
+from bucket_sort_viz.model.step_index import StepIndex
+from bucket_sort_viz.model.step_log import StepLog
+from bucket_sort_viz.presets import PRESETS
+
+
+@pytest.fixture(params=["list", "log"])
+def trace(request):
+    preset = PRESETS["small"]
+    values = generate_values(preset, 60, seed=11)
+    steps = list(generate_steps(preset, values, describe=False, split_load=4))
+    traced = steps if request.param == "list" else StepLog.from_steps(steps)
+    return steps, StepIndex(traced)
+
+
+def _linear(steps, match, start=0, stop=None):
+    stop = len(steps) if stop is None else stop
+    return [i for i in range(start, stop) if match(steps[i])]
+
+
+def _top_bucket(steps):
+    """Top-level bucket of every step, by replaying the trace."""
+    element_bucket, buckets = {}, []
+    for step in steps:
+        bucket = None
+        if step.depth == 0 and step.bucket_index >= 0:
+            bucket = step.bucket_index
+            if step.step_type == "scatter":
+                element_bucket[step.element_ids[0]] = bucket
+        elif step.depth > 0:
+            bucket = element_bucket[step.element_ids[0]]
+        buckets.append(bucket)
+    return buckets
+
+
+class TestQueries:
+    """Every index agrees with a linear scan of the trace."""
+
+    def test_step_type_and_phase(self, trace):
+        steps, index = trace
+        for step_type in ("scatter", "compare", "gather", "celebration", "place"):
+            expected = _linear(steps, lambda s: s.step_type == step_type)
+            assert index.positions("step_type", step_type).tolist() == expected
+        sort_steps = _linear(steps, lambda s: s.phase == "sort")
+        assert index.by_phase("sort") == [steps[i] for i in sort_steps]
+        assert index.count("phase", "sort") == len(sort_steps)
+
+    def test_element(self, trace):
+        steps, index = trace
+        for element_id in (0, 7, 59):
+            expected = _linear(steps, lambda s: element_id in s.element_ids)
+            assert index.positions("element", element_id).tolist() == expected
+            assert index.by_element(element_id) == [steps[i] for i in expected]
+
+    def test_bucket_includes_rebucketing(self, trace):
+        steps, index = trace
+        buckets = _top_bucket(steps)
+        assert any(s.depth > 0 for s in steps)
+        for bucket in range(PRESETS["small"].num_buckets):
+            expected = [i for i, b in enumerate(buckets) if b == bucket]
+            assert index.positions("bucket", bucket).tolist() == expected
+
+    def test_range_query(self, trace):
+        steps, index = trace
+        start, stop = len(steps) // 3, 2 * len(steps) // 3
+        buckets = _top_bucket(steps)
+        expected = [i for i in range(start, stop) if buckets[i] == 2]
+        assert index.positions("bucket", 2, start, stop).tolist() == expected
+        assert index.count("bucket", 2, start, stop) == len(expected)
+        assert index.by_bucket(2, start, stop) == [steps[i] for i in expected]
+        assert index.count("bucket", 2, stop, start) == 0
+
+    def test_counts_heatmap(self, trace):
+        steps, index = trace
+        heat = index.counts("bucket", 0, len(steps))
+        buckets = _top_bucket(steps)
+        assert heat == {b: buckets.count(b) for b in set(buckets) if b is not None}
+
+    def test_missing_key_and_unknown_index(self, trace):
+        _, index = trace
+        assert index.positions("element", 10_000).tolist() == []
+        assert index.count("step_type", "swap", 0, 0) == 0
+        with pytest.raises(ValueError, match="Unknown index"):
+            index.positions("slot", 0)
+
+
+class TestIncremental:
+    """Indexes are built lazily and resume when the trace grows."""
+
+    def test_grows_with_the_log(self):
+        preset = PRESETS["medium"]
+        steps = list(generate_steps(preset, generate_values(preset, 40, seed=2)))
+        log = StepLog.from_steps(steps[:50])
+        first = log.index.positions("element", 3).tolist()
+        log.extend(steps[50:])
+        assert log.index is log.index
+        expected = _linear(steps, lambda s: 3 in s.element_ids)
+        assert log.index.positions("element", 3).tolist() == expected
+        assert expected[:len(first)] == first
+
+    def test_duplicate_id_in_one_step(self):
+        index = StepIndex([Step("compare", "sort", [4, 4]), Step("swap", "sort", [4, 1])])
+        assert index.positions("element", 4).tolist() == [0, 1]
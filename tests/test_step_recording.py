@@ -2,7 +2,7 @@
 
 import pytest
 
-from bucket_sort_viz.config import STEP_TO_CODE_LINE
+from bucket_sort_viz.config import PSEUDOCODE_LINES, STEP_TO_CODE_LINE
 from bucket_sort_viz.model.bucket_sort import bucket_sort
 from bucket_sort_viz.presets import PRESETS
 
@@ -121,6 +121,28 @@ class TestSortSteps:
                 )
 
 
+class TestPlaceSteps:
+    """Verify counting-sort place step recording."""
+
+    def test_place_steps_fill_each_bucket_in_slot_order(self):
+        preset = PRESETS["small"]
+        _, _, steps = bucket_sort(preset, count=15, seed=42, counting_width=25)
+        slots: dict[int, list[int]] = {}
+        for step in _get_steps_by_type(steps, "place"):
+            assert len(step.element_ids) == 1
+            assert step.phase == "sort"
+            slots.setdefault(step.bucket_index, []).append(step.slot_index)
+        loads = [len([s for s in _get_steps_by_type(steps, "scatter") if s.bucket_index == b])
+                 for b in range(preset.num_buckets)]
+        for bucket_idx, bucket_slots in slots.items():
+            assert bucket_slots == list(range(loads[bucket_idx]))
+
+    def test_place_steps_have_correct_code_line(self):
+        _, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=42, counting_width=25)
+        for step in _get_steps_by_type(steps, "place"):
+            assert step.code_line == STEP_TO_CODE_LINE["place"]
+
+
 class TestGatherSteps:
     """Verify gather phase step recording."""
 
@@ -191,6 +213,13 @@ class TestCodeLineMapping:
                 f"expected {expected}"
             )
 
+    def test_sort_lines_are_branches_of_one_conditional(self):
+        insertion = PSEUDOCODE_LINES[STEP_TO_CODE_LINE["compare"]].strip()
+        counting = PSEUDOCODE_LINES[STEP_TO_CODE_LINE["place"]].strip()
+        assert insertion.startswith("if ") and "insertionSort" in insertion
+        assert counting.startswith("else:") and "countingSort" in counting
+        assert STEP_TO_CODE_LINE["place"] == STEP_TO_CODE_LINE["compare"] + 1
+
 
 class TestElementIDValidity:
     """Verify all element IDs are valid indices."""
@@ -0,0 +1,77 @@
+"""Tier 1: Analytic insertion-sort synthesis matches the reference engine (NumPy)."""
+
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from bucket_sort_viz.model.bucket_sort import (  # noqa: E402
+    _insertion_sort_bucket,
+    generate_steps,
+    generate_values,
+)
+from bucket_sort_viz.model.step_log import StepLog  # noqa: E402
+from bucket_sort_viz.model.synthesis import append_insertion_sort, record_log  # noqa: E402
+from bucket_sort_viz.presets import PRESETS  # noqa: E402
+
+
+def _reference(preset, values):
+    return StepLog.from_steps(generate_steps(preset, values, describe=False))
+
+
+class TestRecordLog:
+    """record_log() is step-for-step identical to generate_steps()."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    @pytest.mark.parametrize("count", [0, 1, 2, 15, 300])
+    def test_matches_engine(self, preset_name, count):
+        preset = PRESETS[preset_name]
+        values = generate_values(preset, count, seed=count)
+        assert record_log(preset, values) == _reference(preset, values)
+
+    def test_duplicate_heavy_input(self):
+        values = [5] * 40 + [3] * 40 + [24, 0] * 10
+        assert record_log(PRESETS["small"], values) == _reference(PRESETS["small"], values)
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    def test_counting_sort_matches_engine(self, preset_name):
+        preset = PRESETS[preset_name]
+        values = generate_values(preset, 300, seed=7)
+        expected = StepLog.from_steps(
+            generate_steps(preset, values, describe=False, counting_width=preset.bucket_size)
+        )
+        assert record_log(preset, values, counting_width=preset.bucket_size) == expected
+
+    def test_rejects_out_of_range(self):
+        with pytest.raises(ValueError):
+            record_log(PRESETS["small"], [1, 100])
+
+
+class TestAppendInsertionSort:
+    """Bulk synthesis of one bucket, including multi-block masks."""
+
+    @pytest.mark.parametrize("pattern", ["random", "sorted", "reversed", "equal"])
+    def test_matches_reference_loop(self, pattern, monkeypatch):
+        monkeypatch.setattr("bucket_sort_viz.model.synthesis.MASK_BLOCK_CELLS", 64)
+        rng = random.Random(pattern)
+        values = {
+            "random": [rng.randrange(25) for _ in range(60)],
+            "sorted": list(range(60)),
+            "reversed": list(range(60, 0, -1)),
+            "equal": [7] * 60,
+        }[pattern]
+        bucket = list(range(60))
+        reference = StepLog()
+        reference.extend(_insertion_sort_bucket(list(bucket), 3, values))
+        synthesized = StepLog()
+        append_insertion_sort(synthesized, bucket, 3, np.asarray(values))
+        assert synthesized == reference
+
+    def test_appends_after_existing_steps(self):
+        values = [3, 1, 2]
+        log = StepLog.from_steps(generate_steps(PRESETS["small"], [0], describe=False))
+        base = len(log)
+        append_insertion_sort(log, [0, 1, 2], 0, np.asarray(values))
+        expected = list(_insertion_sort_bucket([0, 1, 2], 0, values))
+        assert list(log)[base:] == expected
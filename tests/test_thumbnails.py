@@ -0,0 +1,129 @@
+"""Tier 2: Preset thumbnails rendered off-screen and cached as PNGs (no display)."""
+
+import dataclasses
+import threading
+
+import pygame
+
+from bucket_sort_viz.config import COLORS, THUMBNAIL_SIZE
+from bucket_sort_viz.presets import PRESETS
+from bucket_sort_viz.view import thumbnails
+from bucket_sort_viz.view.thumbnails import PresetThumbnails, render_thumbnail, thumbnail_key
+
+SMALL = {"small": PRESETS["small"]}
+
+
+def _close(pixel, color, tolerance=2):
+    """Smoothscale's filter can shift flat colors by a unit or two."""
+    return all(abs(a - b) <= tolerance for a, b in zip(pixel[:3], color))
+
+
+class TestRenderThumbnail:
+    """The READY scene is drawn off-screen and downscaled."""
+
+    def test_size_and_background(self):
+        surface = render_thumbnail(PRESETS["small"])
+        assert surface.get_size() == THUMBNAIL_SIZE
+        assert _close(surface.get_at((1, 1)), COLORS["bg_dark"])
+
+    def test_buckets_are_drawn(self):
+        surface = render_thumbnail(PRESETS["small"])
+        width, height = THUMBNAIL_SIZE
+        assert _close(surface.get_at((width // 8, height // 2)), COLORS["bucket_fill"])
+
+
+class TestThumbnailKey:
+    """The cache key follows the preset and the thumbnail size."""
+
+    def test_stable(self):
+        assert thumbnail_key(PRESETS["small"]) == thumbnail_key(PRESETS["small"])
+
+    def test_changes_with_preset_and_size(self):
+        small = PRESETS["small"]
+        keys = {
+            thumbnail_key(small),
+            thumbnail_key(dataclasses.replace(small, circle_radius=small.circle_radius + 1)),
+            thumbnail_key(small, (200, 70)),
+            thumbnail_key(PRESETS["medium"]),
+        }
+        assert len(keys) == 4
+
+
+class TestPresetThumbnails:
+    """Placeholders until ready, PNGs on disk, and instant loads on the next run."""
+
+    def test_renders_in_background_and_caches(self, tmp_path):
+        with PresetThumbnails(PRESETS, cache_dir=tmp_path) as previews:
+            assert previews.wait(timeout=30)
+            assert previews.rendered == len(PRESETS) and previews.loaded == 0
+            for name in PRESETS:
+                assert previews.path(name).exists()
+                assert previews.get(name) is not previews.placeholder
+        assert not list(tmp_path.glob("*.partial.png"))
+
+    def test_placeholder_until_ready(self, tmp_path, monkeypatch):
+        release = threading.Event()
+        original = thumbnails.render_thumbnail
+
+        def blocked(preset, size):
+            release.wait(timeout=30)
+            return original(preset, size)
+
+        monkeypatch.setattr(thumbnails, "render_thumbnail", blocked)
+        with PresetThumbnails(SMALL, cache_dir=tmp_path) as previews:
+            assert not previews.ready("small")
+            assert previews.get("small") is previews.placeholder
+            assert previews.placeholder.get_size() == THUMBNAIL_SIZE
+            release.set()
+            assert previews.wait(timeout=30)
+            assert previews.get("small") is not previews.placeholder
+
+    def test_second_run_loads_from_disk(self, tmp_path):
+        with PresetThumbnails(SMALL, cache_dir=tmp_path) as first:
+            first.wait(timeout=30)
+        with PresetThumbnails(SMALL, cache_dir=tmp_path) as second:
+            assert second.ready("small")                   # Available before any waiting
+            assert (second.loaded, second.rendered) == (1, 0)
+            assert second.get("small").get_size() == THUMBNAIL_SIZE
+
+    def test_stale_and_corrupt_files_are_replaced(self, tmp_path):
+        stale = tmp_path / "small-0000000000000000.png"
+        stale.write_bytes(b"old")
+        previews = PresetThumbnails(SMALL, cache_dir=tmp_path)
+        previews.path("small").write_bytes(b"not a png")
+        with previews:
+            assert previews.wait(timeout=30)
+            assert previews.rendered == 1
+        assert not stale.exists()
+        assert pygame.image.load(str(previews.path("small"))).get_size() == THUMBNAIL_SIZE
+
+    def test_other_presets_sharing_the_prefix_are_kept(self, tmp_path):
+        other = tmp_path / "small-wide-0123456789abcdef.png"
+        unrelated = tmp_path / "small-notes.png"
+        for path in (other, unrelated):
+            path.write_bytes(b"keep")
+        with PresetThumbnails(SMALL, cache_dir=tmp_path) as previews:
+            assert previews.wait(timeout=30)
+        assert other.exists() and unrelated.exists()
+
+    def test_worker_renders_under_font_lock(self, tmp_path, monkeypatch):
+        held = []
+
+        def render(preset, size):
+            held.append(thumbnails.FONT_LOCK.locked())
+            return pygame.Surface(size)
+
+        monkeypatch.setattr(thumbnails, "render_thumbnail", render)
+        with PresetThumbnails(SMALL, cache_dir=tmp_path) as previews:
+            assert previews.wait(timeout=30)
+        assert held == [True]
+
+    def test_render_failure_keeps_placeholder(self, tmp_path, monkeypatch):
+        def broken(preset, size):
+            raise RuntimeError("no fonts")
+
+        monkeypatch.setattr(thumbnails, "render_thumbnail", broken)
+        with PresetThumbnails(SMALL, cache_dir=tmp_path) as previews:
+            assert previews.wait(timeout=30)
+            assert previews.get("small") is previews.placeholder
+            assert isinstance(previews.failed["small"], RuntimeError)
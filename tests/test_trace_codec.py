@@ -0,0 +1,120 @@
+"""Tier 1: Run-length / delta trace codec round-trips (no Pygame)."""
+
+import io
+import random
+from dataclasses import replace
+
+import pytest
+
+from bucket_sort_viz.model.bucket_sort import bucket_sort, describe_step, generate_steps
+from bucket_sort_viz.model.trace_codec import decode_steps, encode_steps
+from bucket_sort_viz.model.trace_io import read_header, read_steps, write_compact, write_ndjson
+from bucket_sort_viz.presets import PRESETS
+
+
+def _round_trip(steps, values):
+    buffer = io.BytesIO()
+    assert encode_steps(steps, buffer, values) == len(steps)
+    buffer.seek(0)
+    return list(decode_steps(buffer, values)), len(buffer.getvalue())
+
+
+class TestDescribeStep:
+    """describe_step() is the single source of step descriptions."""
+
+    def test_matches_engine(self):
+        original, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=3)
+        assert all(step.description == describe_step(step, original) for step in steps)
+
+    def test_without_values(self):
+        _, _, steps = bucket_sort(PRESETS["small"], count=10, seed=3)
+        assert describe_step(steps[1], None) == ""
+
+    def test_generate_steps_can_skip_descriptions(self):
+        original, _, steps = bucket_sort(PRESETS["small"], count=10, seed=3)
+        bare = list(generate_steps(PRESETS["small"], original, describe=False))
+        assert bare == [replace(step, description="") for step in steps]
+
+
+class TestCodecRoundTrip:
+    """Decoding reproduces the exact original steps."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_engine_traces(self, preset_name, seed):
+        original, _, steps = bucket_sort(PRESETS[preset_name], count=15, seed=seed)
+        decoded, _ = _round_trip(steps, original)
+        assert decoded == steps
+
+    def test_counting_sort_trace(self):
+        original, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=2, counting_width=25)
+        decoded, _ = _round_trip(steps, original)
+        assert decoded == steps
+
+    def test_rebucketed_trace(self):
+        values = [(i * 7) % 30 for i in range(60)]
+        steps = list(generate_steps(PRESETS["small"], values, split_load=5))
+        decoded, _ = _round_trip(steps, values)
+        assert decoded == steps
+
+    def test_without_values_stores_descriptions(self):
+        original, _, steps = bucket_sort(PRESETS["small"], count=12, seed=1)
+        decoded, _ = _round_trip(steps, None)
+        assert decoded == steps
+
+    def test_skewed_input_compresses(self):
+        values = [i % 7 for i in range(200)]         # everything in bucket 0
+        steps = list(generate_steps(PRESETS["small"], values))
+        decoded, size = _round_trip(steps, values)
+        assert decoded == steps
+        assert len(steps) > 10_000
+        assert size < len(steps) // 10
+
+    def test_arbitrary_edits_round_trip(self):
+        original, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=9)
+        rng = random.Random(0)
+        for _ in range(100):
+            edited = list(steps)
+            i, j = rng.randrange(len(edited)), rng.randrange(len(edited))
+            match rng.randrange(3):
+                case 0:
+                    del edited[i]
+                case 1:
+                    edited.insert(i, edited[j])
+                case 2:
+                    edited[i] = replace(edited[i], slot_index=edited[i].slot_index + 1)
+            decoded, _ = _round_trip(edited, original)
+            assert decoded == edited
+
+    def test_decoding_is_lazy(self):
+        original, _, steps = bucket_sort(PRESETS["small"], count=10, seed=2)
+        buffer = io.BytesIO()
+        encode_steps(steps, buffer, original)
+        buffer.seek(0)
+        stream = decode_steps(buffer, original)
+        assert next(stream) == steps[0]
+
+    def test_truncated_stream_raises(self):
+        original, _, steps = bucket_sort(PRESETS["small"], count=10, seed=2)
+        buffer = io.BytesIO()
+        encode_steps(steps, buffer, original)
+        with pytest.raises(ValueError):
+            list(decode_steps(io.BytesIO(buffer.getvalue()[:-3]), original))
+
+
+class TestCompactTraceFile:
+    """The compact encoding is available through trace_io."""
+
+    @pytest.mark.parametrize("name", ["trace.bsw", "trace.bsw.gz"])
+    def test_file_round_trip(self, tmp_path, name):
+        original, _, steps = bucket_sort(PRESETS["large"], count=15, seed=4)
+        path = tmp_path / name
+        write_compact(path, iter(steps), meta={"values": original})
+        assert read_header(path)["encoding"] == "compact"
+        assert list(read_steps(path)) == steps
+
+    def test_smaller_than_ndjson(self, tmp_path):
+        original, _, steps = bucket_sort(PRESETS["large"], count=15, seed=4)
+        write_ndjson(tmp_path / "t.ndjson", steps, meta={"values": original})
+        write_compact(tmp_path / "t.bsw", steps, meta={"values": original})
+        assert (tmp_path / "t.bsw").stat().st_size * 10 < (tmp_path / "t.ndjson").stat().st_size
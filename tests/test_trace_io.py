@@ -0,0 +1,238 @@
+"""Tier 1: Streaming trace export and round-trip loading (no Pygame)."""
+
+import gzip
+import json
+from dataclasses import replace
+
+import pytest
+
+from bucket_sort_viz.model import trace_codec, trace_io
+from bucket_sort_viz.model.bucket_sort import bucket_sort, generate_steps, generate_values
+from bucket_sort_viz.model.step_log import StepLog
+from bucket_sort_viz.model.trace_io import (
+    MAGIC,
+    iter_columnar_chunks,
+    read_header,
+    read_steps,
+    write_columnar,
+    write_compact,
+    write_ndjson,
+    write_trace,
+)
+from bucket_sort_viz.presets import PRESETS
+
+
+def _without_descriptions(steps):
+    return [replace(step, description="") for step in steps]
+
+
+@pytest.fixture
+def run():
+    original, _, steps = bucket_sort(PRESETS["medium"], count=40, seed=7)
+    return original, steps
+
+
+class TestGenerateSteps:
+    """The streaming engine yields exactly what bucket_sort() records."""
+
+    def test_matches_bucket_sort(self, run):
+        original, steps = run
+        assert list(generate_steps(PRESETS["medium"], original)) == steps
+
+    def test_values_are_reproducible(self, run):
+        original, _ = run
+        assert generate_values(PRESETS["medium"], 40, seed=7) == original
+
+
+class TestStepLog:
+    """Verify the struct-of-arrays storage round-trips steps."""
+
+    def test_round_trip(self, run):
+        _, steps = run
+        log = StepLog.from_steps(steps)
+        assert len(log) == len(steps)
+        assert list(log) == _without_descriptions(steps)
+        assert log[-1].element_ids == steps[-1].element_ids
+
+    def test_index_out_of_range(self):
+        with pytest.raises(IndexError):
+            StepLog()[0]
+
+
+class TestNdjson:
+    """Verify NDJSON traces stream, compress, and round-trip."""
+
+    @pytest.mark.parametrize("name", ["trace.ndjson", "trace.ndjson.gz"])
+    def test_round_trip(self, tmp_path, run, name):
+        original, steps = run
+        path = tmp_path / name
+        assert write_ndjson(path, iter(steps), meta={"values": original}, chunk_size=7) == len(
+            steps
+        )
+        assert list(read_steps(path)) == steps
+        assert read_header(path)["meta"]["values"] == original
+
+    def test_gzip_by_suffix(self, tmp_path, run):
+        path = tmp_path / "trace.ndjson.gz"
+        write_ndjson(path, run[1])
+        with gzip.open(path, "rb") as f:
+            assert b'"step_type":"phase_change"' in f.read()
+
+    def test_one_step_per_line(self, tmp_path, run):
+        path = tmp_path / "trace.ndjson"
+        write_ndjson(path, run[1], descriptions=False)
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == len(run[1]) + 1
+        assert "description" not in lines[1]
+        assert list(read_steps(path)) == _without_descriptions(run[1])
+
+
+class TestColumnar:
+    """Verify the chunked binary trace."""
+
+    @pytest.mark.parametrize("name", ["trace.bst", "trace.bst.gz"])
+    @pytest.mark.parametrize("chunk_size", [1, 13, 4096])
+    def test_round_trip(self, tmp_path, run, name, chunk_size):
+        _, steps = run
+        path = tmp_path / name
+        assert write_columnar(path, steps, chunk_size=chunk_size) == len(steps)
+        assert list(read_steps(path)) == _without_descriptions(steps)
+
+    def test_round_trips_depth(self, tmp_path):
+        values = [(i * 7) % 30 for i in range(60)]
+        steps = list(generate_steps(PRESETS["small"], values, split_load=5))
+        path = tmp_path / "trace.bst"
+        write_columnar(path, steps, chunk_size=32)
+        assert list(read_steps(path)) == _without_descriptions(steps)
+
+    def test_chunks(self, tmp_path, run):
+        path = tmp_path / "trace.bst"
+        write_columnar(path, run[1], chunk_size=50)
+        chunks = list(iter_columnar_chunks(path))
+        assert all(len(chunk) <= 50 for chunk in chunks)
+        assert sum(len(chunk) for chunk in chunks) == len(run[1])
+
+    def test_header_describes_columns(self, tmp_path, run):
+        path = tmp_path / "trace.bst"
+        write_columnar(path, run[1], meta={"preset": "medium"})
+        assert path.read_bytes().startswith(MAGIC)
+        header = read_header(path)
+        assert header["encoding"] == "columnar"
+        assert header["columns"]["ids"] == "int32"
+        assert header["meta"] == {"preset": "medium"}
+
+    def test_smaller_than_ndjson(self, tmp_path, run):
+        write_ndjson(tmp_path / "t.ndjson", run[1], descriptions=False)
+        write_columnar(tmp_path / "t.bst", run[1])
+        assert (tmp_path / "t.bst").stat().st_size < (tmp_path / "t.ndjson").stat().st_size / 4
+
+    def test_truncated_file_raises(self, tmp_path, run):
+        path = tmp_path / "trace.bst"
+        write_columnar(path, run[1])
+        path.write_bytes(path.read_bytes()[:-20])
+        with pytest.raises(ValueError):
+            list(read_steps(path))
+
+
+class TestWriteTrace:
+    """Verify encoding is chosen from the suffix and bad files are rejected."""
+
+    def test_streams_from_generator(self, tmp_path):
+        preset = PRESETS["large"]
+        values = generate_values(preset, 500, seed=3)
+        path = tmp_path / "big.bst.gz"
+        written = write_trace(path, generate_steps(preset, values))
+        assert read_header(path)["encoding"] == "columnar"
+        assert sum(1 for _ in read_steps(path)) == written
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "other.ndjson"
+        path.write_text('{"hello": 1}\n', encoding="utf-8")
+        with pytest.raises(ValueError):
+            read_header(path)
+
+
+# Fields each older trace version lacks.
+MISSING_FIELDS = {1: ("depth", "parent_bucket"), 2: ("parent_bucket",)}
+
+
+@pytest.fixture
+def rebucketed():
+    values = [(i * 7) % 30 for i in range(60)]
+    return values, list(generate_steps(PRESETS["small"], values, split_load=5))
+
+
+def _as_older_writer(monkeypatch, version):
+    """Make the writers produce `version`'s layout (header, columns and codec literals)."""
+    missing = MISSING_FIELDS[version]
+    monkeypatch.setattr(trace_io, "TRACE_VERSION", version)
+    monkeypatch.setattr(
+        trace_io, "STEP_FIELDS", tuple(f for f in trace_io.STEP_FIELDS if f not in missing),
+    )
+    monkeypatch.setattr(trace_io, "_FILE_TYPECODES", {
+        name: code for name, code in trace_io._FILE_TYPECODES.items() if name not in missing
+    })
+    monkeypatch.setattr(trace_codec, "LITERAL_FIELDS", tuple(
+        f for f in trace_codec.LITERAL_FIELDS if f not in missing
+    ))
+
+
+def _older_ndjson(path, steps, version):
+    write_ndjson(path, steps)
+    header, *records = (json.loads(line) for line in path.read_text().splitlines())
+    header["version"] = version
+    header["fields"] = [f for f in header["fields"] if f not in MISSING_FIELDS[version]]
+    for record in records:
+        for name in MISSING_FIELDS[version]:
+            del record[name]
+    path.write_text("".join(json.dumps(obj) + "\n" for obj in [header, *records]))
+
+
+class TestOlderVersions:
+    """Traces written by earlier versions still load; unknown future ones don't."""
+
+    def test_version_1_defaults_depth(self, tmp_path, run, monkeypatch):
+        original, steps = run
+        _older_ndjson(tmp_path / "t.ndjson", steps, 1)
+        with monkeypatch.context() as m:
+            _as_older_writer(m, 1)
+            write_columnar(tmp_path / "t.bst", steps, chunk_size=13)
+            write_compact(tmp_path / "t.bsw", steps, {"values": original})
+        assert read_header(tmp_path / "t.bst")["version"] == 1
+        assert "depth" not in read_header(tmp_path / "t.bst")["columns"]
+        assert list(read_steps(tmp_path / "t.ndjson")) == steps
+        assert list(read_steps(tmp_path / "t.bst")) == _without_descriptions(steps)
+        assert list(read_steps(tmp_path / "t.bsw")) == steps
+
+    @pytest.mark.parametrize("name", ["t.ndjson", "t.bst", "t.bsw"])
+    def test_version_2_recovers_parent_buckets(self, tmp_path, rebucketed, monkeypatch, name):
+        values, steps = rebucketed
+        path = tmp_path / name
+        if name == "t.ndjson":
+            _older_ndjson(path, steps, 2)
+        else:
+            with monkeypatch.context() as m:
+                _as_older_writer(m, 2)
+                write_trace(path, steps, {"values": values})
+        loaded = list(read_steps(path))
+        assert any(step.depth and step.parent_bucket >= 0 for step in loaded)
+        expected = steps if name != "t.bst" else _without_descriptions(steps)
+        assert loaded == expected
+        if name == "t.bst":
+            chunks = list(iter_columnar_chunks(path))
+            assert [s for chunk in chunks for s in chunk] == expected
+
+    def test_parent_bucket_round_trips(self, tmp_path, rebucketed):
+        values, steps = rebucketed
+        for name in ("t.ndjson", "t.bst", "t.bsw"):
+            write_trace(tmp_path / name, steps, {"values": values})
+            loaded = list(read_steps(tmp_path / name))
+            assert [s.parent_bucket for s in loaded] == [s.parent_bucket for s in steps]
+
+    def test_future_version_rejected(self, tmp_path, run):
+        path = tmp_path / "t.ndjson"
+        write_ndjson(path, run[1])
+        header, rest = path.read_text().split("\n", 1)
+        path.write_text(header.replace('"version": 3', '"version": 4') + "\n" + rest)
+        with pytest.raises(ValueError, match="unsupported trace version 4"):
+            read_header(path)
@@ -0,0 +1,193 @@
+"""Tier 1: Vectorized trace validation (NumPy, no Pygame)."""
+
+from dataclasses import replace
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from bucket_sort_viz.main import main  # noqa: E402
+from bucket_sort_viz.model.bucket_sort import bucket_sort, generate_steps  # noqa: E402
+from bucket_sort_viz.model.step_log import StepLog  # noqa: E402
+from bucket_sort_viz.model.trace_io import write_trace  # noqa: E402
+from bucket_sort_viz.model.validate import validate_log, validate_trace  # noqa: E402
+from bucket_sort_viz.presets import PRESETS  # noqa: E402
+
+
+@pytest.fixture
+def run():
+    original, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=4)
+    return original, steps
+
+
+def _check(steps, values, preset="medium"):
+    return validate_log(StepLog.from_steps(steps), PRESETS[preset], values)
+
+
+def _index_of(steps, step_type, nth=0):
+    return [i for i, s in enumerate(steps) if s.step_type == step_type][nth]
+
+
+class TestValidTraces:
+    """Engine output passes every invariant."""
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    @pytest.mark.parametrize("seed", range(5))
+    def test_engine_traces_are_valid(self, preset_name, seed):
+        original, _, steps = bucket_sort(PRESETS[preset_name], count=15, seed=seed)
+        assert _check(steps, original, preset_name) is None
+
+    def test_large_skewed_trace(self):
+        values = [(i * 37) % 90 for i in range(400)]
+        log = StepLog.from_steps(generate_steps(PRESETS["small"], values, describe=False))
+        assert validate_log(log, PRESETS["small"], values) is None
+
+    @pytest.mark.parametrize("preset_name", ["small", "medium", "large"])
+    def test_counting_sort_traces_are_valid(self, preset_name):
+        preset = PRESETS[preset_name]
+        original, _, steps = bucket_sort(
+            preset, count=15, seed=2, counting_width=preset.bucket_size,
+        )
+        assert _check(steps, original, preset_name) is None
+
+    def test_rebucketed_traces_are_valid(self):
+        values = [(i * 37) % 90 for i in range(400)]
+        steps = generate_steps(PRESETS["small"], values, describe=False, split_load=10)
+        assert validate_log(StepLog.from_steps(steps), PRESETS["small"], values) is None
+
+    def test_accepts_chunked_logs(self, run):
+        original, steps = run
+        chunks = [StepLog.from_steps(steps[i:i + 7]) for i in range(0, len(steps), 7)]
+        assert validate_log(chunks, PRESETS["medium"], original) is None
+
+
+class TestViolations:
+    """Each broken invariant is reported at the first offending step."""
+
+    def test_wrong_bucket(self, run):
+        original, steps = run
+        i = _index_of(steps, "scatter", 3)
+        steps[i] = replace(steps[i], bucket_index=(steps[i].bucket_index + 1) % 8)
+        violation = _check(steps, original)
+        assert violation.step_index == i
+        assert "wrong bucket" in violation.message
+
+    def test_scattered_twice(self, run):
+        original, steps = run
+        i = _index_of(steps, "scatter", 2)
+        steps[i] = replace(steps[i], element_ids=list(steps[i - 1].element_ids))
+        assert _check(steps, original).step_index == i
+
+    def test_non_adjacent_swap(self, run):
+        original, steps = run
+        i = _index_of(steps, "swap")
+        steps[i] = replace(steps[i], slot_index=steps[i].slot_index + 1)
+        assert "swap slot" in _check(steps, original).message
+
+    def test_swap_in_wrong_order(self, run):
+        original, steps = run
+        i = _index_of(steps, "no_swap")
+        steps[i] = replace(steps[i], step_type="swap", slot_index=steps[i].slot_index - 1)
+        violation = _check(steps, original)
+        assert violation.step_index == i
+
+    def test_gather_out_of_order(self, run):
+        original, steps = run
+        i = _index_of(steps, "gather", 2)
+        steps[i], steps[i + 1] = steps[i + 1], steps[i]
+        assert _check(steps, original).step_index == i
+
+    def test_celebration_must_cover_all(self, run):
+        original, steps = run
+        steps[-1] = replace(steps[-1], element_ids=steps[-1].element_ids[:-1])
+        violation = _check(steps, original)
+        assert violation.step_index == len(steps) - 1
+
+    def test_missing_celebration(self, run):
+        original, steps = run
+        assert "celebration" in _check(steps[:-1], original).message
+
+    def test_unpaired_compare(self, run):
+        original, steps = run
+        i = _index_of(steps, "compare")
+        del steps[i + 1]
+        assert _check(steps, original).step_index == i
+
+    def test_placement_out_of_order(self):
+        original, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=4, counting_width=25)
+        i = _index_of(steps, "place")
+        steps[i], steps[i + 1] = steps[i + 1], steps[i]
+        violation = _check(steps, original)
+        assert violation.step_index == i
+        assert "next free slot" in violation.message
+
+    def test_counting_pass_must_place_every_element(self):
+        original, _, steps = bucket_sort(PRESETS["medium"], count=15, seed=4, counting_width=25)
+        bucket = steps[_index_of(steps, "place")].bucket_index
+        last = max(i for i, s in enumerate(steps)
+                   if s.step_type == "place" and s.bucket_index == bucket)
+        del steps[last]
+        violation = _check(steps, original)
+        assert violation.step_index == last - 1
+        assert "unplaced" in violation.message
+
+    def test_rebucketed_gather_out_of_order(self):
+        values = [(i * 37) % 90 for i in range(60)]
+        steps = list(generate_steps(PRESETS["small"], values, split_load=10))
+        i = next(i for i, s in enumerate(steps) if s.step_type == "gather" and s.depth == 1)
+        steps[i], steps[i + 1] = steps[i + 1], steps[i]
+        violation = _check(steps, values, "small")
+        assert violation.step_index == i
+        assert "next free slot" in violation.message
+
+    def test_wrong_parent_bucket(self):
+        values = [(i * 37) % 90 for i in range(60)]
+        steps = list(generate_steps(PRESETS["small"], values, split_load=10))
+        i = next(i for i, s in enumerate(steps) if s.depth and s.step_type == "compare")
+        steps[i] = replace(steps[i], parent_bucket=steps[i].parent_bucket + 1)
+        violation = _check(steps, values, "small")
+        assert violation.step_index == i
+        assert "parent bucket" in violation.message
+
+    def test_missing_marker_for_empty_phase(self):
+        values = [5, 150]                                  # One element per bucket: no sort steps
+        steps = list(generate_steps(PRESETS["medium"], values))
+        assert not any(s.phase == "sort" and s.step_type != "phase_change" for s in steps)
+        del steps[next(i for i, s in enumerate(steps) if s.phase == "sort")]
+        violation = _check(steps, values)
+        assert violation.step_index == _index_of(steps, "phase_change", 1)
+        assert "markers" in violation.message
+
+    def test_empty(self):
+        assert _check([], [1, 2]).message == "empty trace"
+
+
+class TestValidateTrace:
+    """Files are validated using the preset and values in their header."""
+
+    @pytest.mark.parametrize("name", ["t.ndjson", "t.bst", "t.bsw.gz"])
+    def test_files(self, tmp_path, run, name):
+        original, steps = run
+        path = tmp_path / name
+        write_trace(path, steps, {"preset": "medium", "values": original})
+        result = validate_trace(path)
+        assert result.ok
+        assert result.steps == len(steps)
+
+    def test_missing_meta(self, tmp_path, run):
+        path = tmp_path / "t.bst"
+        write_trace(path, run[1])
+        with pytest.raises(ValueError):
+            validate_trace(path)
+
+    def test_cli_exit_status(self, tmp_path, run, capsys):
+        original, steps = run
+        good, bad = tmp_path / "good.bst", tmp_path / "bad.bst"
+        meta = {"preset": "medium", "values": original}
+        write_trace(good, steps, meta)
+        write_trace(bad, steps[:-1], meta)
+        main(["--validate", str(good)])
+        assert capsys.readouterr().out.startswith("ok")
+        with pytest.raises(SystemExit):
+            main(["--validate", str(good), str(bad)])
+        assert "INVALID" in capsys.readouterr().out